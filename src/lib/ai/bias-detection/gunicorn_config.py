@@ -1,6 +1,9 @@
 # Gunicorn configuration file for the Bias Detection Service
 
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "python-service"))
 
 # Bind to all interfaces on port 5001 by default, or use environment variables
 bind = f"{os.getenv('BIAS_SERVICE_HOST', '0.0.0.0')}:{os.getenv('BIAS_SERVICE_PORT', '5001')}"
@@ -27,10 +30,28 @@ pidfile = os.getenv('GUNICORN_PIDFILE', '/tmp/bias-detection-service.pid')
 # Set to False for foreground operation, useful for Docker or systemd
 daemon = os.getenv('GUNICORN_DAEMON', 'False').lower() == 'true'
 
-# Preload the application. This can save memory if workers share the same code,
-# but can cause issues with some applications (e.g., those with global state).
-# Set to False if issues arise.
+# Preload the application. Models (spaCy, VADER, toxic-bert) then load once in
+# the master and are shared copy-on-write by the workers; the fork hooks below
+# drain per-process state and freeze the heap so the sharing lasts.
 preload_app = os.getenv('GUNICORN_PRELOAD_APP', 'False').lower() == 'true'
 
 # WSGI application path
 wsgi_app = "start-python-service:app"
+
+
+def pre_fork(server, worker):
+    """Drain the preloaded service and freeze the heap before each worker fork"""
+    if server.cfg.preload_app:
+        from preload import prepare_for_fork
+
+        service_module = sys.modules.get("bias_detection_service")
+        prepare_for_fork(getattr(service_module, "bias_service", None))
+
+
+def post_fork(server, worker):
+    """Reseed per-worker state and log the worker's starting memory"""
+    if server.cfg.preload_app:
+        from preload import memory_usage, reinit_after_fork
+
+        reinit_after_fork()
+        server.log.info(f"Worker {worker.pid} memory at fork: {memory_usage()}")
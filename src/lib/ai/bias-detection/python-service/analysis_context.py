@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+analysis_context.py
+Per-request shared artifacts for the analysis layers
+
+Every layer used to re-derive the same inputs: the joined session text, its
+spaCy parse, response time/length lists and the synthetic fairness dataset.
+An AnalysisContext materializes each artifact lazily, at most once per
+request, and counts how often and how long each one took to build. Layers
+may run on separate threads, so each artifact is built under a lock.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from analysis_modes import DEFAULT_ANALYSIS_MODE
+from incremental import ResponseStats, RunningMoments
+
+# Artifacts that hold live library objects and are rebuilt, not pickled,
+# when a context is shipped to a process-pool worker
+_UNPICKLED_ARTIFACTS = ("doc", "dataset")
+
+
+class AnalysisContext:
+    """Lazily computed artifacts shared by all layers of one analysis
+
+    ``service`` supplies the extraction/parsing helpers. ``analysis_mode``
+    is the tier the layers run at. Keyword ``seeds`` pre-populate artifacts
+    (e.g. ``linguistic_bias`` from a batch parse or ``response_stats`` from
+    an incremental session) so they are never built.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        session_data: Any,
+        analysis_mode: str = DEFAULT_ANALYSIS_MODE,
+        **seeds: Any,
+    ):
+        self.service = service
+        self.session_data = session_data
+        self.analysis_mode = analysis_mode
+        self._values: Dict[str, Any] = {k: v for k, v in seeds.items() if v is not None}
+        self.materialized: Dict[str, int] = {}
+        self.timings_ms: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["service"] = None
+        del state["_lock"]
+        state["_values"] = {
+            k: v for k, v in self._values.items() if k not in _UNPICKLED_ARTIFACTS
+        }
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def bind(self, service: Any) -> "AnalysisContext":
+        """Attach a service after the context crossed a process boundary"""
+        if self.service is None:
+            self.service = service
+        return self
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        if name not in self._values:
+            with self._lock:
+                if name not in self._values:
+                    start = time.perf_counter()
+                    self._values[name] = factory()
+                    self.materialized[name] = self.materialized.get(name, 0) + 1
+                    self.timings_ms[name] = (time.perf_counter() - start) * 1000
+        return self._values[name]
+
+    @property
+    def text(self) -> str:
+        return self._get("text", lambda: self.service._extract_text_content(self.session_data))
+
+    @property
+    def doc(self) -> Optional[Any]:
+        """spaCy Doc for the session text, or None when NLP is unavailable
+
+        The fast tier only needs token texts for the lexicon, so it skips the
+        tagger/parser/NER pipeline and runs the tokenizer alone.
+        """
+        return self._get("doc", self._parse)
+
+    def _parse(self) -> Optional[Any]:
+        nlp = self.service.nlp
+        if nlp is None:
+            return None
+        return nlp.make_doc(self.text) if self.analysis_mode == "fast" else nlp(self.text)
+
+    @property
+    def sentiment(self) -> Dict[str, Any]:
+        return self._get("sentiment", lambda: self.service._analyze_sentiment(self.text))
+
+    @property
+    def linguistic_bias(self) -> Dict[str, Any]:
+        return self._get("linguistic_bias", lambda: self.service._linguistic_bias_for(self))
+
+    @property
+    def response_times(self) -> np.ndarray:
+        return self._get(
+            "response_times",
+            lambda: np.array(
+                [r.get("response_time", 0) for r in self.session_data.ai_responses or []],
+                dtype=float,
+            ),
+        )
+
+    @property
+    def response_lengths(self) -> np.ndarray:
+        return self._get(
+            "response_lengths",
+            lambda: np.array(
+                [len(r.get("content", "")) for r in self.session_data.ai_responses or []],
+                dtype=float,
+            ),
+        )
+
+    @property
+    def response_stats(self) -> ResponseStats:
+        """Response length/time moments, from the arrays unless seeded"""
+        return self._get(
+            "response_stats",
+            lambda: ResponseStats(
+                lengths=_moments(self.response_lengths), times=_moments(self.response_times)
+            ),
+        )
+
+    @property
+    def dataset(self) -> Optional[Dict[str, Any]]:
+        """Label-encoded synthetic dataset shared by AIF360 and Fairlearn"""
+        return self._get("dataset", lambda: self.service._create_synthetic_dataset(self.session_data))
+
+    def profile(self) -> Dict[str, Any]:
+        """Build counts and timings for the artifacts this context materialized"""
+        return {
+            "materialized": dict(self.materialized),
+            "timings_ms": {k: round(v, 3) for k, v in self.timings_ms.items()},
+            "seeded": sorted(set(self._values) - set(self.materialized)),
+        }
+
+
+def _moments(values: np.ndarray) -> RunningMoments:
+    count = len(values)
+    if not count:
+        return RunningMoments()
+    return RunningMoments(
+        count=count, mean=float(values.mean()), m2=float(values.var()) * count
+    )
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+analysis_modes.py
+Analysis tiers selectable per request
+
+- ``fast``: the preprocessing layer's lexical screen (tokenizer-only parse)
+  and demographic representation metrics, nothing else; meant for the
+  real-time chat path
+- ``standard``: all four layers, without the toxicity classifier and the
+  SHAP/LIME interpretability analysis
+- ``deep``: standard plus the toxicity classifier and interpretability
+
+Each tier has a latency budget, the target it is expected to meet, and a
+deadline, after which unfinished layers are abandoned. Results record the
+tier that ran, its budget and whether the analysis finished within it.
+"""
+
+from typing import Any, Dict, Tuple
+
+from layer_executor import ANALYSIS_LAYERS
+
+ANALYSIS_MODES = ("fast", "standard", "deep")
+DEFAULT_ANALYSIS_MODE = "standard"
+
+# Layers each tier runs, in ANALYSIS_LAYERS order
+MODE_LAYERS: Dict[str, Tuple[str, ...]] = {
+    "fast": ("preprocessing",),
+    "standard": ANALYSIS_LAYERS,
+    "deep": ANALYSIS_LAYERS,
+}
+
+DEFAULT_LATENCY_BUDGETS_MS: Dict[str, float] = {
+    "fast": 10.0,
+    "standard": 500.0,
+    "deep": 5000.0,
+}
+
+# Hard cap per tier, split across its layers (see deadlines.py); kept well
+# under the gunicorn worker timeout
+DEFAULT_DEADLINES_MS: Dict[str, float] = {
+    "fast": 100.0,
+    "standard": 10000.0,
+    "deep": 60000.0,
+}
+
+
+def parse_analysis_mode(value: Any) -> str:
+    """Validate a requested tier, defaulting to standard when none was given"""
+    if value is None:
+        return DEFAULT_ANALYSIS_MODE
+    if value not in ANALYSIS_MODES:
+        raise ValueError(
+            f"Unknown analysis_mode: {value!r} (expected one of {', '.join(ANALYSIS_MODES)})"
+        )
+    return value
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+asgi_app.py
+ASGI serving mode for the Pixelated Empathy Bias Detection Service
+
+Serves the same routes as the Flask app (/analyze, /analyze/append,
+/analyze/batch, /dashboard, /export, /health, /ready) but keeps one long-lived event
+loop per worker and awaits BiasDetectionService directly, instead of creating
+and tearing down an event loop for every request.
+
+Run with:
+    gunicorn -k uvicorn.workers.UvicornWorker -w 4 -b 0.0.0.0:5000 asgi_app:app
+or for development:
+    uvicorn asgi_app:app --port 5000
+"""
+
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Tuple
+
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from werkzeug.exceptions import BadRequest
+
+from bias_detection_service import (
+    REQUIRED_SESSION_FIELDS,
+    bias_service,
+    config,
+    build_analysis_mode,
+    build_append_delta,
+    build_batch_sessions,
+    build_dashboard_data,
+    build_deadline_ms,
+    build_export_stream,
+    build_health_data,
+    build_readiness_data,
+    build_session_data,
+    check_rate_limit,
+    max_body_bytes,
+    to_ndjson_line,
+)
+from incremental import IncrementalSessionNotFound
+from request_body import PayloadError, check_content_length, decode_json, read_limited
+from serialization import encode_json_response
+
+logger = logging.getLogger(__name__)
+
+
+class AuthError(Exception):
+    """Raised when a request fails JWT authentication"""
+
+    status_code = 401
+    headers: Dict[str, str] = {}
+
+
+class RateLimitExceeded(AuthError):
+    """Raised when an authenticated user has no tokens left"""
+
+    status_code = 429
+
+    def __init__(self, retry_after: int):
+        super().__init__("Rate limit exceeded")
+        self.retry_after = retry_after
+        self.headers = {"Retry-After": str(retry_after)}
+
+
+def _authenticate(request: Request) -> str:
+    """Resolve the user id for a request, enforcing JWT auth in production"""
+    if os.environ.get("ENV") != "production":
+        return "development-user"
+
+    token = request.headers.get("Authorization")
+    if not token:
+        raise AuthError("No authorization token provided")
+
+    # Remove 'Bearer ' prefix if present
+    if token.startswith("Bearer "):
+        token = token[7:]
+
+    try:
+        payload = bias_service.security_manager.verify_jwt_token(token)
+    except Exception as e:
+        raise AuthError(str(e)) from e
+
+    user_id = payload.get("user_id", "unknown")
+    retry_after = check_rate_limit(user_id)
+    if retry_after:
+        raise RateLimitExceeded(retry_after)
+    return user_id
+
+
+def _auth_error(e: AuthError) -> Response:
+    return JSONResponse({"error": str(e)}, status_code=e.status_code, headers=e.headers)
+
+
+async def _read_json(
+    request: Request, required: Tuple[str, ...] = (), batch: bool = False
+) -> Dict[str, Any]:
+    """Read a JSON body within its size limit; an empty body is no data
+
+    Raises PayloadError (400) or PayloadTooLarge (413) before reading more
+    than the limit.
+    """
+    max_bytes = max_body_bytes(batch)
+    check_content_length(request.headers.get("content-length"), max_bytes)
+    body = await read_limited(request.stream(), max_bytes)
+    return decode_json(body, required)
+
+
+def _json_response(request: Request, payload: Dict[str, Any]) -> Response:
+    """JSON response encoded numpy-natively, compressed if the client accepts it"""
+    body, headers = encode_json_response(
+        payload, request.headers.get("accept-encoding"), config.response_compression_min_bytes
+    )
+    return Response(body, headers=headers)
+
+
+def _payload_error(e: PayloadError) -> Response:
+    return JSONResponse({"error": str(e)}, status_code=e.status_code)
+
+
+async def health_check(request: Request) -> Response:
+    """Health check endpoint"""
+    return JSONResponse(build_health_data())
+
+
+async def readiness_check(request: Request) -> Response:
+    """Readiness endpoint: 503 until the worker has warmed up"""
+    data, status = build_readiness_data()
+    headers = {"Retry-After": "1"} if status == 503 else None
+    return JSONResponse(data, status_code=status, headers=headers)
+
+
+async def analyze_session(request: Request) -> Response:
+    """Analyze session for bias"""
+    try:
+        user_id = _authenticate(request)
+    except AuthError as e:
+        return _auth_error(e)
+
+    try:
+        try:
+            data = await _read_json(request, REQUIRED_SESSION_FIELDS)
+        except PayloadError as e:
+            return _payload_error(e)
+        if not data:
+            return JSONResponse({"error": "No data provided"}, status_code=400)
+
+        try:
+            session_data = build_session_data(data)
+            analysis_mode = build_analysis_mode(data)
+            deadline_ms = build_deadline_ms(data)
+        except BadRequest as e:
+            return JSONResponse({"error": e.description}, status_code=400)
+
+        # Awaited on the worker's long-lived loop
+        result = await bias_service.analyze_session(
+            session_data, user_id, analysis_mode=analysis_mode, deadline_ms=deadline_ms
+        )
+        return _json_response(request, result)
+
+    except Exception as e:
+        logger.error(f"Analysis endpoint error: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def analyze_append(request: Request) -> Response:
+    """Append new turns to a live session and return its updated analysis"""
+    try:
+        user_id = _authenticate(request)
+    except AuthError as e:
+        return _auth_error(e)
+
+    try:
+        try:
+            data = await _read_json(request, ("session_id",))
+        except PayloadError as e:
+            return _payload_error(e)
+        if not data:
+            return JSONResponse({"error": "No data provided"}, status_code=400)
+
+        try:
+            delta = build_append_delta(data)
+        except BadRequest as e:
+            return JSONResponse({"error": e.description}, status_code=400)
+
+        try:
+            result = await bias_service.append_to_session(delta, user_id)
+        except IncrementalSessionNotFound as e:
+            return JSONResponse({"error": str(e)}, status_code=404)
+
+        return _json_response(request, result)
+
+    except Exception as e:
+        logger.error(f"Incremental analysis endpoint error: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def analyze_batch(request: Request) -> Response:
+    """Analyze many sessions, streaming results back as NDJSON"""
+    try:
+        user_id = _authenticate(request)
+    except AuthError as e:
+        return _auth_error(e)
+
+    try:
+        try:
+            data = await _read_json(request, ("sessions",), batch=True)
+        except PayloadError as e:
+            return _payload_error(e)
+        if not data:
+            return JSONResponse({"error": "No data provided"}, status_code=400)
+
+        try:
+            sessions = build_batch_sessions(data)
+            analysis_mode = build_analysis_mode(data)
+        except BadRequest as e:
+            return JSONResponse({"error": e.description}, status_code=400)
+
+        async def stream():
+            async for result in bias_service.analyze_sessions(sessions, user_id, analysis_mode):
+                yield to_ndjson_line(result)
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    except Exception as e:
+        logger.error(f"Batch analysis endpoint error: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def get_dashboard_data(request: Request) -> Response:
+    """Get dashboard data for bias monitoring"""
+    try:
+        _authenticate(request)
+    except AuthError as e:
+        return _auth_error(e)
+
+    try:
+        return _json_response(
+            request,
+            build_dashboard_data(
+                request.query_params.get("timeRange", "24h"),
+                request.query_params.get("demographic", "all"),
+            ),
+        )
+    except BadRequest as e:
+        return JSONResponse({"error": e.description}, status_code=400)
+    except Exception as e:
+        logger.error(f"Dashboard endpoint error: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def export_data(request: Request) -> Response:
+    """Export bias analysis data"""
+    try:
+        _authenticate(request)
+    except AuthError as e:
+        return _auth_error(e)
+
+    try:
+        try:
+            data = await _read_json(request)
+        except PayloadError as e:
+            return _payload_error(e)
+        try:
+            chunks, mimetype, headers = build_export_stream(
+                data.get("format", "json"), data.get("date_range", {})
+            )
+        except BadRequest as e:
+            return JSONResponse({"error": e.description}, status_code=400)
+
+        # Sync iterator: Starlette pulls each chunk in its threadpool
+        return StreamingResponse(chunks, media_type=mimetype, headers=headers)
+
+    except Exception as e:
+        logger.error(f"Export endpoint error: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def http_error(request: Request, exc: HTTPException) -> Response:
+    if exc.status_code == 404:
+        return JSONResponse({"error": "Endpoint not found"}, status_code=404)
+    return JSONResponse({"error": exc.detail}, status_code=exc.status_code)
+
+
+async def internal_error(request: Request, exc: Exception) -> Response:
+    return JSONResponse({"error": "Internal server error"}, status_code=500)
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    yield
+    # Make buffered audit events durable before the worker exits
+    bias_service.audit_logger.close()
+
+
+routes = [
+    Route("/health", health_check, methods=["GET"]),
+    Route("/ready", readiness_check, methods=["GET"]),
+    Route("/analyze", analyze_session, methods=["POST"]),
+    Route("/analyze/append", analyze_append, methods=["POST"]),
+    Route("/analyze/batch", analyze_batch, methods=["POST"]),
+    Route("/dashboard", get_dashboard_data, methods=["GET"]),
+    Route("/export", export_data, methods=["POST"]),
+]
+
+app = Starlette(
+    routes=routes,
+    middleware=[Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])],
+    exception_handlers={HTTPException: http_error, 500: internal_error},
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    # Development server
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=5000)
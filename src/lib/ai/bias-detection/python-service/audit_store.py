@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+audit_store.py
+Segmented audit log with a sidecar index for lookups by session hash
+
+Records are appended to ``audit-<seq>-<start>.jsonl`` segments that rotate by
+size and age. Each segment has a ``.idx`` sidecar with one tab-separated line
+per record: ``session_id_hash, event_type, offset, length``. Queries read only
+the sidecars, seek straight to the matching records and decrypt just their
+``encrypted_details``, so a compliance lookup costs O(matches) rather than a
+scan of the whole log.
+
+Query from the command line (from python-service/):
+    python audit_store.py audit_logs --session-id <id> [--event-type analysis_completed] [--decrypt]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from audit_writer import AuditRecord, locked, open_append, write_all
+
+_SEGMENT_RE = re.compile(r"^audit-(\d{6})-(\d+)\.jsonl$")
+_CURRENT_FILE = "CURRENT"
+_LOCK_FILE = ".lock"
+_NO_KEY = "-"
+
+# (offset, length) of one record in its segment
+IndexEntry = Tuple[int, int]
+
+
+@dataclass
+class _SegmentIndex:
+    """In-memory view of one sidecar, extended as the sidecar grows"""
+
+    by_session: Dict[str, List[Tuple[str, int, int]]] = field(default_factory=dict)
+    by_event: Dict[str, List[IndexEntry]] = field(default_factory=dict)
+    position: int = 0
+
+
+class AuditStore:
+    """Rotating, indexed audit segments shared by every worker process"""
+
+    def __init__(
+        self,
+        directory: str,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_age_seconds: float = 24 * 3600,
+    ):
+        self.directory = directory
+        self.path = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age_seconds = max_segment_age_seconds
+        os.makedirs(directory, exist_ok=True)
+
+        self._segment: Optional[str] = None
+        self._data_fd: Optional[int] = None
+        self._index_fd: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+        self._pid: Optional[int] = None
+        self._indexes: Dict[str, _SegmentIndex] = {}
+        self._index_lock = threading.Lock()
+
+    # Writing
+
+    def append(self, records: List[AuditRecord]):
+        """Append a batch of records and their index entries"""
+        if self._pid != os.getpid():
+            # flock is shared by descriptors inherited across fork
+            self._close_files()
+            self._lock_fd = open_append(os.path.join(self.directory, _LOCK_FILE))
+            self._pid = os.getpid()
+
+        with locked(self._lock_fd):
+            segment = self._current_segment()
+            if segment != self._segment:
+                self._close_segment()
+                self._segment = segment
+                self._data_fd = open_append(self._segment_path(segment))
+                self._index_fd = open_append(self._index_path(segment))
+
+            offset = os.fstat(self._data_fd).st_size
+            data, index = [], []
+            for line, session_id_hash, event_type in records:
+                encoded = line.encode()
+                data.append(encoded)
+                index.append(
+                    f"{session_id_hash or _NO_KEY}\t{event_type or _NO_KEY}\t{offset}\t{len(encoded)}\n"
+                )
+                offset += len(encoded)
+
+            # Data before index, so an index entry never points past EOF
+            write_all(self._data_fd, b"".join(data))
+            write_all(self._index_fd, "".join(index).encode())
+
+    def fsync(self):
+        for fd in (self._data_fd, self._index_fd):
+            if fd is not None:
+                os.fsync(fd)
+
+    def close(self):
+        self._close_files()
+
+    def _current_segment(self) -> str:
+        """Name of the segment to append to, rotating it if full or old; lock held"""
+        current_path = os.path.join(self.directory, _CURRENT_FILE)
+        try:
+            with open(current_path) as f:
+                segment = f.read().strip()
+        except FileNotFoundError:
+            segment = ""
+
+        match = _SEGMENT_RE.match(segment)
+        if match:
+            started = int(match.group(2))
+            try:
+                size = os.path.getsize(self._segment_path(segment))
+            except FileNotFoundError:
+                size = 0
+            if (
+                size < self.max_segment_bytes
+                and time.time() - started < self.max_segment_age_seconds
+            ):
+                return segment
+            sequence = int(match.group(1)) + 1
+        else:
+            sequence = 1
+
+        segment = f"audit-{sequence:06d}-{int(time.time())}.jsonl"
+        tmp_path = f"{current_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(segment)
+        os.replace(tmp_path, current_path)
+        return segment
+
+    def _segment_path(self, segment: str) -> str:
+        return os.path.join(self.directory, segment)
+
+    def _index_path(self, segment: str) -> str:
+        return os.path.join(self.directory, segment[: -len(".jsonl")] + ".idx")
+
+    def _close_segment(self):
+        if self._pid == os.getpid():
+            for fd in (self._data_fd, self._index_fd):
+                if fd is not None:
+                    os.close(fd)
+        self._segment = self._data_fd = self._index_fd = None
+
+    def _close_files(self):
+        self._close_segment()
+        if self._lock_fd is not None and self._pid == os.getpid():
+            os.close(self._lock_fd)
+        self._lock_fd = None
+
+    # Querying
+
+    def segments(self) -> List[str]:
+        """Segment names, oldest first"""
+        return sorted(name for name in os.listdir(self.directory) if _SEGMENT_RE.match(name))
+
+    def query(
+        self,
+        session_id_hash: Optional[str] = None,
+        event_type: Optional[str] = None,
+        decrypt: Optional[Callable[[str], str]] = None,
+    ) -> Iterator[Dict]:
+        """Yield records matching a session hash and/or event type, oldest first
+
+        With ``decrypt`` the ``encrypted_details`` of each hit is decrypted into
+        ``details``; nothing else in the log is read or decrypted.
+        """
+        if session_id_hash is None and event_type is None:
+            raise ValueError("Provide a session_id_hash and/or an event_type")
+
+        for segment in self.segments():
+            index = self._load_index(segment)
+            if session_id_hash is not None:
+                entries = [
+                    (offset, length)
+                    for entry_type, offset, length in index.by_session.get(session_id_hash, ())
+                    if event_type is None or entry_type == event_type
+                ]
+            else:
+                entries = list(index.by_event.get(event_type, ()))
+            if not entries:
+                continue
+
+            with open(self._segment_path(segment), "rb") as f:
+                for offset, length in entries:
+                    f.seek(offset)
+                    record = json.loads(f.read(length))
+                    if decrypt and "encrypted_details" in record:
+                        record["details"] = json.loads(decrypt(record["encrypted_details"]))
+                    yield record
+
+    def _load_index(self, segment: str) -> _SegmentIndex:
+        """Read any sidecar lines not yet seen; rotated segments are read once"""
+        with self._index_lock:
+            index = self._indexes.setdefault(segment, _SegmentIndex())
+            try:
+                with open(self._index_path(segment), "rb") as f:
+                    f.seek(index.position)
+                    chunk = f.read()
+            except FileNotFoundError:
+                return index
+
+            # Ignore a trailing partial line from an in-progress append
+            complete = chunk[: chunk.rfind(b"\n") + 1]
+            index.position += len(complete)
+            for line in complete.decode().splitlines():
+                session_id_hash, event_type, offset, length = line.split("\t")
+                entry = (int(offset), int(length))
+                index.by_session.setdefault(session_id_hash, []).append((event_type, *entry))
+                index.by_event.setdefault(event_type, []).append(entry)
+            return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the segmented audit log")
+    parser.add_argument("directory", help="Audit store directory")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--session-id", help="Session id (hashed before lookup)")
+    target.add_argument("--session-hash", help="Session id hash as stored in the log")
+    parser.add_argument("--event-type")
+    parser.add_argument(
+        "--decrypt",
+        action="store_true",
+        help="Decrypt details of matching records (uses ENCRYPTION_PASSWORD/ENCRYPTION_SALT)",
+    )
+    args = parser.parse_args()
+
+    session_hash = args.session_hash
+    if args.session_id:
+        # Same hash as SecurityManager.hash_session_id
+        session_hash = hashlib.sha256(args.session_id.encode()).hexdigest()
+    if session_hash is None and args.event_type is None:
+        parser.error("give --session-id, --session-hash or --event-type")
+
+    decrypt = None
+    if args.decrypt:
+        from bias_detection_service import SecurityManager
+
+        decrypt = SecurityManager().decrypt_data
+
+    store = AuditStore(args.directory)
+    for record in store.query(session_hash, args.event_type, decrypt):
+        sys.stdout.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
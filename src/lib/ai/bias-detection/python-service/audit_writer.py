@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+audit_writer.py
+Background group-commit writer for the HIPAA audit log
+
+Callers enqueue pre-serialized JSONL records on a bounded queue and return
+immediately. A single writer thread drains the queue in batches, appends each
+batch with one write() under an exclusive file lock (so records from several
+gunicorn workers never interleave), and fsyncs every N events or T ms.
+
+The writer appends to a sink: a single JSONL file (AuditFileSink) or the
+segmented, indexed AuditStore from audit_store.py.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: O_APPEND alone, no cross-process lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# (JSONL line with trailing newline, session_id_hash, event_type)
+AuditRecord = Tuple[str, Optional[str], Optional[str]]
+
+
+@contextmanager
+def locked(fd: int) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``fd``"""
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def write_all(fd: int, data: bytes):
+    """os.write until every byte is written"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def open_append(path: str) -> int:
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+
+
+class AuditFileSink:
+    """Appends audit batches to one JSONL file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def _file(self) -> int:
+        # Reopen after a fork: flock is shared by inherited descriptors
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = open_append(self.path)
+            self._pid = os.getpid()
+        return self._fd
+
+    def append(self, records: List[AuditRecord]):
+        fd = self._file()
+        # O_APPEND positions each write at EOF; the lock keeps a batch
+        # contiguous even if the kernel splits a large write
+        with locked(fd):
+            write_all(fd, "".join(line for line, _, _ in records).encode())
+
+    def fsync(self):
+        if self._fd is not None:
+            os.fsync(self._fd)
+
+    def close(self):
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
+
+
+class _FlushMarker:
+    """Queue item that is acknowledged once everything before it is durable"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class AuditWriter:
+    """Buffered, batched, multi-process-safe audit appender"""
+
+    def __init__(
+        self,
+        sink: Union[str, Any],
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        fsync_every_events: int = 100,
+        fsync_interval_ms: int = 1000,
+    ):
+        """
+        ``sink`` is a file path or an object with append/fsync/close
+        (AuditFileSink, AuditStore). ``fsync_every_events`` /
+        ``fsync_interval_ms`` bound how many events or how much time may pass
+        between fsyncs; 0 disables that rule.
+        """
+        self.sink = AuditFileSink(sink) if isinstance(sink, str) else sink
+        self.path = getattr(self.sink, "path", None)
+        self.max_queue = max_queue
+        self.batch_size = max(1, batch_size)
+        self.fsync_every_events = fsync_every_events
+        self.fsync_interval_ms = fsync_interval_ms
+        self.stats = {"events": 0, "batches": 0, "fsyncs": 0}
+
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        atexit.register(self.close)
+
+    def submit(
+        self, record: str, session_id_hash: Optional[str] = None, event_type: Optional[str] = None
+    ):
+        """Queue one JSONL record (without trailing newline)
+
+        ``session_id_hash`` and ``event_type`` feed sinks that index records.
+        Blocks only when the queue is full, so audit events are never dropped.
+        Events arriving after close() are written synchronously.
+        """
+        item = (record + "\n", session_id_hash, event_type)
+        if self._closed:
+            with self._lock:
+                self.sink.append([item])
+            return
+        self._ensure_started().put(item)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record submitted so far is written and fsynced"""
+        if self._queue is None or self._pid != os.getpid():
+            return True
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Flush pending records and stop the writer thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._queue is None or self._pid != os.getpid():
+            return
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _ensure_started(self) -> queue.Queue:
+        # (Re)start after a fork: threads do not survive into the child
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue(maxsize=self.max_queue)
+                    self._thread = threading.Thread(
+                        target=self._run, name="audit-writer", daemon=True
+                    )
+                    self._thread.start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def _run(self):
+        pending_sync = 0
+        last_sync = time.monotonic()
+        interval = self.fsync_interval_ms / 1000 if self.fsync_interval_ms else None
+        stopping = False
+
+        while not stopping:
+            try:
+                items = [self._queue.get(timeout=interval)]
+            except queue.Empty:
+                items = []
+            while items and len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records: List[AuditRecord] = []
+            markers: List[_FlushMarker] = []
+            for entry in items:
+                if entry is None:
+                    stopping = True
+                elif isinstance(entry, _FlushMarker):
+                    markers.append(entry)
+                else:
+                    records.append(entry)
+
+            if records:
+                self._append(records)
+                pending_sync += len(records)
+
+            now = time.monotonic()
+            due = pending_sync and (
+                markers
+                or stopping
+                or (self.fsync_every_events and pending_sync >= self.fsync_every_events)
+                or (interval and now - last_sync >= interval)
+            )
+            if due:
+                self._fsync()
+                pending_sync, last_sync = 0, now
+
+            for marker in markers:
+                marker.done.set()
+
+        with self._lock:
+            self.sink.close()
+
+    def _append(self, records: List[AuditRecord]):
+        try:
+            self.sink.append(records)
+            self.stats["events"] += len(records)
+            self.stats["batches"] += 1
+        except OSError as e:
+            logger.error(f"Audit log write failed: {e}")
+
+    def _fsync(self):
+        try:
+            self.sink.fsync()
+            self.stats["fsyncs"] += 1
+        except OSError as e:
+            logger.error(f"Audit log fsync failed: {e}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+bench_analysis_modes.py
+Per-tier latency of analyze_session against each tier's budget
+
+Runs the fast, standard and deep tiers over the same synthetic sessions with
+the result cache disabled, and reports mean/p50/p95 latency next to the
+configured budget and the share of sessions that finished within it.
+
+Usage (from python-service/):
+    python benchmarks/bench_analysis_modes.py --sessions 50 --turns 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("FLASK_SECRET_KEY", "benchmark-flask-secret")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret")
+
+from analysis_modes import ANALYSIS_MODES  # noqa: E402
+from bias_detection_service import (  # noqa: E402
+    BiasDetectionConfig,
+    BiasDetectionService,
+    SessionData,
+)
+
+
+def make_session(index: int, turns: int) -> SessionData:
+    """Build a synthetic chat session with the given number of turns"""
+    sentence = "She said he was too old for the role but the young team disagreed. "
+    return SessionData(
+        session_id=f"bench_modes_{index}",
+        participant_demographics={
+            "gender_distribution": {"male": 40, "female": 60},
+            "age_distribution": {"18-25": 20, "26-35": 30, "36-45": 25, "46+": 25},
+        },
+        training_scenario={"scenario_type": "anxiety_management"},
+        content={"session_notes": sentence},
+        ai_responses=[
+            {"content": sentence, "response_time": 1.0 + (i % 7) * 0.1} for i in range(turns)
+        ],
+        expected_outcomes=[{"outcome": "improved_mood"}],
+        transcripts=[{"text": sentence} for _ in range(turns)],
+        metadata={},
+    )
+
+
+async def run_mode(service: BiasDetectionService, mode: str, sessions: int, turns: int) -> list:
+    """Time analyze_session for every synthetic session at one tier"""
+    await service.analyze_session(make_session(-1, turns), "benchmark-user", analysis_mode=mode)
+    latencies = []
+    for index in range(sessions):
+        session = make_session(index, turns)
+        start = time.perf_counter()
+        await service.analyze_session(session, "benchmark-user", analysis_mode=mode)
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=10)
+    args = parser.parse_args()
+
+    service = BiasDetectionService(
+        BiasDetectionConfig(enable_result_cache=False, enable_audit_logging=False)
+    )
+    budgets = service.config.analysis_latency_budgets_ms
+
+    print(f"{'mode':>9} {'mean_ms':>9} {'p50_ms':>9} {'p95_ms':>9} {'budget':>8} {'within':>7}")
+    for mode in ANALYSIS_MODES:
+        latencies = asyncio.run(run_mode(service, mode, args.sessions, args.turns))
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        within = sum(latency * 1000 <= budgets[mode] for latency in latencies) / len(latencies)
+        print(
+            f"{mode:>9} {statistics.mean(latencies) * 1000:>9.2f} "
+            f"{statistics.median(latencies) * 1000:>9.2f} {p95 * 1000:>9.2f} "
+            f"{budgets[mode]:>8.0f} {within:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
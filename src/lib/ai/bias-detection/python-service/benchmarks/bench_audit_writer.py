@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+bench_audit_writer.py
+Audit-path cost per request: synchronous appends vs. the buffered writer
+
+Each simulated request logs the two events an analysis emits
+(analysis_started, and an encrypted analysis_completed) from several
+threads at once. "sync" opens/appends/closes the file per event; "buffered"
+hands records to AuditWriter. Buffered totals include the final flush.
+
+Usage (from python-service/):
+    python benchmarks/bench_audit_writer.py --requests 2000 --threads 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("FLASK_SECRET_KEY", "benchmark-flask-secret")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret")
+
+from audit_writer import AuditWriter  # noqa: E402
+from bias_detection_service import AuditLogger, SecurityManager  # noqa: E402
+
+
+async def log_request(audit_logger: AuditLogger, index: int):
+    session_id = f"bench_session_{index}"
+    await audit_logger.log_event(
+        "analysis_started", session_id, "bench-user", {"analysis_type": "comprehensive"}
+    )
+    await audit_logger.log_event(
+        "analysis_completed",
+        session_id,
+        "bench-user",
+        {"overall_bias_score": 0.42, "alert_level": "warning", "processing_time": 0.1},
+        sensitive_data=True,
+    )
+
+
+def run(audit_logger: AuditLogger, requests: int, threads: int) -> float:
+    """Return wall-clock seconds to log ``requests`` requests across threads"""
+
+    def worker(offset: int):
+        loop = asyncio.new_event_loop()
+        for i in range(offset, requests, threads):
+            loop.run_until_complete(log_request(audit_logger, i))
+        loop.close()
+
+    start = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    audit_logger.flush()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--fsync-every", type=int, default=100)
+    parser.add_argument("--fsync-interval-ms", type=int, default=1000)
+    args = parser.parse_args()
+
+    security_manager = SecurityManager()
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_logger = AuditLogger(security_manager)
+        sync_logger.audit_file = os.path.join(tmp, "sync.log")
+        sync = run(sync_logger, args.requests, args.threads)
+
+        writer = AuditWriter(
+            os.path.join(tmp, "buffered.log"),
+            fsync_every_events=args.fsync_every,
+            fsync_interval_ms=args.fsync_interval_ms,
+        )
+        buffered_logger = AuditLogger(security_manager, writer)
+        buffered = run(buffered_logger, args.requests, args.threads)
+        buffered_logger.close()
+
+    per_request = lambda seconds: seconds / args.requests * 1e6  # noqa: E731
+    print(f"requests: {args.requests} x 2 events, {args.threads} threads")
+    print(f"sync:     {per_request(sync):8.1f} us/request  (no fsync)")
+    print(
+        f"buffered: {per_request(buffered):8.1f} us/request  "
+        f"({writer.stats['batches']} batches, {writer.stats['fsyncs']} fsyncs)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+bench_export.py
+Peak memory and time to first byte of a streamed export vs. range size
+
+Fills a temporary result store with ``--rows`` results spread over
+``--days`` partitions, then streams each export format, reporting the
+time to the first chunk, the total time and the tracemalloc peak. Peak
+memory should stay flat as --rows grows.
+
+Usage (from python-service/):
+    python benchmarks/bench_export.py --rows 10000 100000 --days 30
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from export_stream import PARQUET_AVAILABLE, iter_export  # noqa: E402
+from result_store import ResultStore  # noqa: E402
+
+FIELDS = ["session_id", "bias_score", "alert_level", "timestamp"]
+
+
+def fill(store: ResultStore, rows: int, days: int):
+    start = datetime(2024, 1, 1)
+    step = timedelta(days=days) / rows
+    for i in range(rows):
+        store.append(
+            {
+                "session_id": f"bench_session_{i}",
+                "bias_score": (i % 100) / 100,
+                "alert_level": "low",
+                "timestamp": (start + step * i).isoformat(),
+            }
+        )
+    store.close()
+
+
+def measure(store: ResultStore, export_format: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    for chunk in iter_export(export_format, store.scan(), FIELDS):
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first, total, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--days", type=int, default=30)
+    args = parser.parse_args()
+
+    formats = ["jsonl", "csv", "json"] + (["parquet"] if PARQUET_AVAILABLE else [])
+    print(f"{'rows':>8} {'format':>8} {'first ms':>9} {'total s':>8} {'peak KiB':>9} {'MiB out':>8}")
+    for rows in args.rows:
+        directory = tempfile.mkdtemp()
+        try:
+            store = ResultStore(directory)
+            fill(store, rows, args.days)
+            for export_format in formats:
+                first, total, peak, size = measure(store, export_format)
+                print(
+                    f"{rows:>8} {export_format:>8} {first * 1000:>9.2f} {total:>8.2f} "
+                    f"{peak / 1024:>9.0f} {size / 2**20:>8.1f}"
+                )
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+bench_inference_backend.py
+Latency, throughput and fp32 parity of the bias classifier backends
+
+Loads unitary/toxic-bert once per backend (pytorch fp32, dynamic int8, ONNX
+on the CPU execution provider) and scores batches of full 512-token windows
+and short windows. For each backend and batch size it reports median batch
+latency, windows per second, and the largest absolute score difference from
+fp32 on the same inputs. Requires torch and transformers; onnxruntime for
+the ONNX backend.
+
+Usage (from python-service/):
+    python benchmarks/bench_inference_backend.py --batch-sizes 1 8 32
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from inference_backend import (  # noqa: E402
+    INFERENCE_BACKENDS,
+    backend_available,
+    load_classifier,
+)
+from toxicity import chunk_windows  # noqa: E402
+
+TEXT = (
+    "I feel anxious about my job and my manager keeps criticising me in front of the team. "
+    "Sometimes I think people like me are never taken seriously here. "
+)
+
+
+def matrix(scores):
+    labels = sorted(scores[0])
+    return np.array([[s[label] for label in labels] for s in scores])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--model", default="unitary/toxic-bert")
+    parser.add_argument("--backends", nargs="+", default=list(INFERENCE_BACKENDS))
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=None, help="onnxruntime intra-op threads")
+    args = parser.parse_args()
+
+    onnx_path = os.path.join(tempfile.mkdtemp(), "model.onnx")
+    classifiers = {}
+    for backend in args.backends:
+        if not backend_available(backend):
+            print(f"{backend}: dependencies not installed, skipped")
+            continue
+        start = time.perf_counter()
+        classifiers[backend] = load_classifier(args.model, backend, onnx_path, args.threads)
+        print(f"{backend}: loaded in {time.perf_counter() - start:.1f}s")
+    if not classifiers:
+        return
+
+    tokenizer = next(iter(classifiers.values())).tokenizer
+    long_window = chunk_windows(TEXT * 40, tokenizer)[0]
+    short_window = TEXT
+
+    print(f"{'backend':>8} {'window':>6} {'batch':>6} {'p50_ms':>9} {'win/s':>8} {'max_diff':>9}")
+    for window_name, window in (("512", long_window), ("short", short_window)):
+        for batch_size in args.batch_sizes:
+            windows = [window] * batch_size
+            reference = None
+            for backend, classify in classifiers.items():
+                classify(windows)  # warm-up
+                timings = []
+                for _ in range(args.iterations):
+                    start = time.perf_counter()
+                    scores = classify(windows)
+                    timings.append(time.perf_counter() - start)
+                median = statistics.median(timings)
+                if reference is None:
+                    reference = matrix(scores)
+                diff = float(np.abs(matrix(scores) - reference).max())
+                print(
+                    f"{backend:>8} {window_name:>6} {batch_size:>6} {median * 1000:>9.1f} "
+                    f"{batch_size / median:>8.1f} {diff:>9.4f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
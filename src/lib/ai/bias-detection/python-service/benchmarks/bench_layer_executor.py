@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+bench_layer_executor.py
+Compare per-session latency of inline and process-pool layer execution
+
+Usage (from python-service/):
+    python benchmarks/bench_layer_executor.py --sessions 20 --turns 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("FLASK_SECRET_KEY", "benchmark-flask-secret")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret")
+
+from bias_detection_service import (  # noqa: E402
+    BiasDetectionConfig,
+    BiasDetectionService,
+    SessionData,
+)
+
+
+def make_session(index: int, turns: int) -> SessionData:
+    """Build a synthetic session with the given number of turns"""
+    sentence = "She said he was too old for the role but the young team disagreed. "
+    return SessionData(
+        session_id=f"bench_session_{index}",
+        participant_demographics={
+            "gender_distribution": {"male": 40, "female": 60},
+            "age_distribution": {"18-25": 20, "26-35": 30, "36-45": 25, "46+": 25},
+        },
+        training_scenario={"scenario_type": "anxiety_management"},
+        content={"session_notes": sentence * 5},
+        ai_responses=[
+            {"content": sentence * 3, "response_time": 1.0 + (i % 7) * 0.1} for i in range(turns)
+        ],
+        expected_outcomes=[{"outcome": "improved_mood"}],
+        transcripts=[{"text": sentence * 2} for _ in range(turns)],
+        metadata={},
+    )
+
+
+async def run_mode(mode: str, sessions: int, turns: int, workers: int) -> list:
+    """Time analyze_session for every synthetic session in the given mode"""
+    service = BiasDetectionService(
+        BiasDetectionConfig(
+            layer_execution=mode,
+            layer_executor_workers=workers or None,
+            enable_audit_logging=False,
+        )
+    )
+    if service.layer_executor is not None:
+        service.layer_executor.warm_up()
+
+    latencies = []
+    for index in range(sessions):
+        session = make_session(index, turns)
+        start = time.perf_counter()
+        await service.analyze_session(session, "benchmark-user")
+        latencies.append(time.perf_counter() - start)
+
+    if service.layer_executor is not None:
+        service.layer_executor.shutdown(wait=True)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    for mode in ("inline", "process"):
+        latencies = asyncio.run(run_mode(mode, args.sessions, args.turns, args.workers))
+        print(
+            f"{mode:>8}: mean {statistics.mean(latencies) * 1000:8.1f} ms  "
+            f"p50 {statistics.median(latencies) * 1000:8.1f} ms  "
+            f"max {max(latencies) * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+bench_lexicon.py
+Micro-benchmark: compiled single-pass lexicon vs. per-detector list scans
+
+Times the lexical stage of _detect_linguistic_bias on 10k-token transcripts.
+"baseline" reproduces the previous approach (five passes over the doc with
+``token.text.lower() in <list>``); "compiled" is one BIAS_LEXICON.scan().
+
+Usage (from python-service/):
+    python benchmarks/bench_lexicon.py --tokens 10000 --repeat 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("FLASK_SECRET_KEY", "benchmark-flask-secret")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret")
+
+from bias_detection_service import (  # noqa: E402
+    AGE_TERMS,
+    BIAS_LEXICON,
+    BIASED_TERMS,
+    CULTURAL_TERMS,
+    GENDER_TERMS,
+    RACIAL_TERMS,
+)
+
+Token = namedtuple("Token", ["text", "idx"])
+
+FILLER = (
+    "i feel anxious about work and the workload is overwhelming today but "
+    "talking helps me think about what to do next with my family"
+).split()
+
+
+def make_tokens(count: int, seed: int = 7) -> list:
+    """Build a transcript mixing filler words with lexicon terms"""
+    rng = random.Random(seed)
+    vocabulary = (
+        FILLER * 8
+        + GENDER_TERMS["male"]
+        + GENDER_TERMS["female"]
+        + RACIAL_TERMS
+        + AGE_TERMS
+        + CULTURAL_TERMS
+        + [term for terms in BIASED_TERMS.values() for term in terms if " " not in term]
+    )
+    tokens, offset = [], 0
+    for _ in range(count):
+        word = rng.choice(vocabulary)
+        tokens.append(Token(word, offset))
+        offset += len(word) + 1
+    return tokens
+
+
+def baseline_scan(doc) -> tuple:
+    """Previous approach: one pass and list membership test per detector"""
+    male = sum(token.text.lower() in GENDER_TERMS["male"] for token in doc)
+    female = sum(token.text.lower() in GENDER_TERMS["female"] for token in doc)
+    racial = sum(token.text.lower() in RACIAL_TERMS for token in doc)
+    age = sum(token.text.lower() in AGE_TERMS for token in doc)
+    cultural = sum(token.text.lower() in CULTURAL_TERMS for token in doc)
+    hits = [
+        (token.text, category)
+        for token in doc
+        for category, terms in BIASED_TERMS.items()
+        if token.text.lower() in terms
+    ]
+    return male, female, racial, age, cultural, len(hits)
+
+
+def compiled_scan(doc) -> tuple:
+    scan = BIAS_LEXICON.scan(doc)
+    counts = scan.counts
+    return (
+        counts["male"],
+        counts["female"],
+        counts["racial"],
+        counts["age"],
+        counts["cultural"],
+        sum(1 for hit in scan.hits if hit.category.startswith("biased:")),
+    )
+
+
+def time_it(fn, doc, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(doc)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    doc = make_tokens(args.tokens)
+    assert baseline_scan(doc) == compiled_scan(doc), "scanners disagree on counts"
+
+    baseline = time_it(baseline_scan, doc, args.repeat)
+    compiled = time_it(compiled_scan, doc, args.repeat)
+    print(f"tokens:   {args.tokens}")
+    print(f"baseline: {baseline * 1000:8.2f} ms")
+    print(f"compiled: {compiled * 1000:8.2f} ms  ({baseline / compiled:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+bench_rate_limiter.py
+Load test: fair sharing of the cross-worker rate limit between tenants
+
+Forks ``--workers`` processes standing in for gunicorn workers. Every worker
+serves one noisy tenant, which retries in a tight loop, and ``--tenants``
+quiet tenants, which each send one request every ``--interval`` seconds. All
+workers share one limiter table. The noisy tenant should be held to about
+burst + rate * duration requests in total, across all workers, and the quiet
+tenants should never be rejected.
+
+Usage (from python-service/):
+    python benchmarks/bench_rate_limiter.py --workers 4 --duration 5 --rate 600
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rate_limiter import RateLimiter  # noqa: E402
+
+
+def worker(path, args, results):
+    limiter = RateLimiter(args.rate, path=path)
+    allowed, rejected = Counter(), Counter()
+    latencies = []
+    quiet = [f"quiet-{i}" for i in range(args.tenants)]
+    next_quiet = time.monotonic()
+    deadline = time.monotonic() + args.duration
+
+    while time.monotonic() < deadline:
+        tenants = ["noisy"]
+        if time.monotonic() >= next_quiet:
+            tenants += quiet
+            next_quiet += args.interval
+        for tenant in tenants:
+            start = time.perf_counter()
+            ok, _ = limiter.acquire(tenant)
+            latencies.append(time.perf_counter() - start)
+            (allowed if ok else rejected)[tenant] += 1
+
+    latencies.sort()
+    results.put((allowed, rejected, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--rate", type=float, default=600, help="Requests per minute per tenant")
+    parser.add_argument("--tenants", type=int, default=3, help="Quiet tenants")
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between quiet requests")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "rate_limit.bin")
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        processes = [
+            context.Process(target=worker, args=(path, args, results)) for _ in range(args.workers)
+        ]
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        shutil.rmtree(directory)
+
+    allowed, rejected = Counter(), Counter()
+    for worker_allowed, worker_rejected, _, _ in outcomes:
+        allowed.update(worker_allowed)
+        rejected.update(worker_rejected)
+
+    expected = args.rate + args.rate / 60 * args.duration
+    print(f"{args.workers} workers, {args.duration:.0f}s, {args.rate:.0f}/min per tenant")
+    print(f"{'tenant':>10} {'allowed':>8} {'rejected':>9}")
+    for tenant in sorted(set(allowed) | set(rejected)):
+        print(f"{tenant:>10} {allowed[tenant]:>8} {rejected[tenant]:>9}")
+    print(f"noisy tenant allowance (burst + rate * duration): {expected:.0f}")
+    p50 = max(o[2] for o in outcomes) * 1e6
+    p99 = max(o[3] for o in outcomes) * 1e6
+    print(f"acquire latency, worst worker: p50 {p50:.1f} us, p99 {p99:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
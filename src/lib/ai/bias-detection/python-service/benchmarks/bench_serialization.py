@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+bench_serialization.py
+Encoding time and payload size of analysis results
+
+Runs the service on a typical session and a large one, then times three
+encoders on each result: Flask's jsonify, the previous json.dumps with a
+str/tolist default, and serialization.dumps (orjson when installed). It also
+reports the payload size raw and after gzip/brotli compression. A third case
+attaches per-response numpy arrays to the large result to show the
+numpy-heavy path.
+
+Usage (from python-service/):
+    python benchmarks/bench_serialization.py --iterations 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("FLASK_SECRET_KEY", "benchmark-flask-secret")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret")
+
+import numpy as np  # noqa: E402
+
+from bias_detection_service import SessionData, app, bias_service, jsonify  # noqa: E402
+from serialization import (  # noqa: E402
+    BROTLI_AVAILABLE,
+    ORJSON_AVAILABLE,
+    compress,
+    dumps,
+)
+
+
+def session(responses: int) -> SessionData:
+    return SessionData(
+        session_id=f"bench_serialization_{responses}",
+        participant_demographics={
+            "gender_distribution": {"male": 40, "female": 60},
+            "age_distribution": {"18-25": 20, "26-35": 30, "36-45": 25, "46+": 25},
+        },
+        training_scenario={},
+        content={"session_notes": "Patient expressing anxiety about work situation"},
+        ai_responses=[
+            {"content": f"Response {i}: can you tell me more about that?", "response_time": 1.0 + i % 7 / 10}
+            for i in range(responses)
+        ],
+        expected_outcomes=[{"outcome": "improved_mood"}],
+        transcripts=[{"text": f"Turn {i}: I feel anxious about my job"} for i in range(responses)],
+        metadata={},
+    )
+
+
+def legacy_dumps(value) -> bytes:
+    return json.dumps(value, default=lambda v: v.tolist() if hasattr(v, "tolist") else str(v)).encode()
+
+
+def flask_jsonify(value) -> bytes:
+    with app.app_context():
+        return jsonify(value).get_data()
+
+
+def timed(encode, value, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encode(value)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--large-responses", type=int, default=1000)
+    args = parser.parse_args()
+
+    typical = asyncio.run(bias_service.analyze_session(session(3), "bench-user"))
+    large = asyncio.run(bias_service.analyze_session(session(args.large_responses), "bench-user"))
+    rng = np.random.default_rng(0)
+    numpy_heavy = {
+        **large,
+        "response_scores": {
+            "sentiment": rng.uniform(-1, 1, args.large_responses).astype(np.float32),
+            "bias": rng.uniform(0, 1, (args.large_responses, 4)),
+            "tokens": rng.integers(0, 500, args.large_responses),
+        },
+    }
+
+    print(f"orjson: {ORJSON_AVAILABLE}, brotli: {BROTLI_AVAILABLE}")
+    print(f"{'case':>12} {'encoder':>10} {'us/op':>9} {'bytes':>9} {'gzip':>8} {'br':>8}")
+    for name, value in (("typical", typical), ("large", large), ("numpy-heavy", numpy_heavy)):
+        for encoder_name, encoder in (
+            ("jsonify", flask_jsonify),
+            ("legacy", legacy_dumps),
+            ("dumps", dumps),
+        ):
+            try:
+                body = encoder(value)
+            except TypeError:
+                print(f"{name:>12} {encoder_name:>10} {'fails':>9}")
+                continue
+            per_op = timed(encoder, value, args.iterations)
+            gzip_size = len(compress(body, "gzip"))
+            br_size = len(compress(body, "br")) if BROTLI_AVAILABLE else 0
+            print(
+                f"{name:>12} {encoder_name:>10} {per_op:>9.1f} {len(body):>9} "
+                f"{gzip_size:>8} {br_size or '-':>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
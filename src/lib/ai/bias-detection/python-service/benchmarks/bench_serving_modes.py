@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+bench_serving_modes.py
+Side-by-side /analyze throughput of Flask+gevent and the ASGI serving mode
+
+Starts each server under gunicorn on its own port, drives it with concurrent
+clients and reports successful requests/second, latency percentiles and the
+number of failed requests.
+
+Usage (from python-service/):
+    python benchmarks/bench_serving_modes.py --requests 400 --concurrency 16 --workers 2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "flask+gevent": ["-k", "gevent", "bias_detection_service:app"],
+    "asgi+uvicorn": ["-k", "uvicorn.workers.UvicornWorker", "asgi_app:app"],
+}
+
+PAYLOAD = json.dumps(
+    {
+        "session_id": "bench_session",
+        "participant_demographics": {
+            "gender_distribution": {"male": 40, "female": 60},
+            "age_distribution": {"18-25": 20, "26-35": 30, "36-45": 25, "46+": 25},
+        },
+        "content": {"session_notes": "Patient expressing anxiety about work situation"},
+        "ai_responses": [
+            {"content": "How are you feeling today?", "response_time": 1.2},
+            {"content": "Can you tell me more about that?", "response_time": 1.5},
+        ],
+        "expected_outcomes": [{"outcome": "improved_mood"}],
+        "transcripts": [{"text": "I feel anxious about my job"}],
+    }
+).encode()
+
+
+def wait_for_health(base_url: str, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become healthy")
+
+
+def post_analyze(base_url: str) -> tuple:
+    """POST one session; returns (latency_seconds, succeeded)"""
+    request = urllib.request.Request(
+        f"{base_url}/analyze",
+        data=PAYLOAD,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            response.read()
+        succeeded = True
+    except urllib.error.HTTPError as e:
+        e.read()
+        succeeded = False
+    return time.perf_counter() - start, succeeded
+
+
+def run_mode(name: str, port: int, args) -> dict:
+    env = dict(os.environ)
+    env.setdefault("FLASK_SECRET_KEY", "benchmark-flask-secret")
+    env.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret")
+    env["ENV"] = "development"
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "-w",
+        str(args.workers),
+        "-b",
+        f"127.0.0.1:{port}",
+        "--log-level",
+        "warning",
+        *MODES[name],
+    ]
+    server = subprocess.Popen(command, cwd=SERVICE_DIR, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_for_health(base_url)
+        # Warm every worker before timing
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            list(pool.map(lambda _: post_analyze(base_url), range(args.workers * 4)))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            outcomes = list(pool.map(lambda _: post_analyze(base_url), range(args.requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    latencies = sorted(latency for latency, succeeded in outcomes if succeeded)
+    errors = sum(1 for _, succeeded in outcomes if not succeeded)
+    if not latencies:
+        raise RuntimeError(f"{name}: every request failed")
+    return {
+        "throughput_rps": len(latencies) / elapsed,
+        "errors": errors,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=5600)
+    args = parser.parse_args()
+
+    for offset, name in enumerate(MODES):
+        stats = run_mode(name, args.port + offset, args)
+        print(
+            f"{name:>14}: {stats['throughput_rps']:8.1f} req/s  "
+            f"p50 {stats['p50_ms']:7.1f} ms  p99 {stats['p99_ms']:7.1f} ms  "
+            f"errors {stats['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py
+Cold-start import time of the service module (python -X importtime)
+
+Imports bias_detection_service in fresh interpreters and reports the median
+total and the slowest imports. Optional toolkits are probed, not
+imported (see capabilities.py), so only the service's own dependencies and
+the models it loads at construction should appear. The same measurement runs
+in the test suite (test_capabilities.py).
+
+Usage (from python-service/):
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_capabilities import HEAVY_MODULES, import_profile  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--module", default="bias_detection_service")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    profiles = [import_profile(args.module) for _ in range(args.runs)]
+    totals = [profile[args.module] / 1000 for profile in profiles]
+    print(f"{args.module}: median {statistics.median(totals):.1f}ms "
+          f"(min {min(totals):.1f}ms, max {max(totals):.1f}ms, {args.runs} runs)")
+
+    last = profiles[-1]
+    heavy = sorted({name.split(".")[0] for name in last} & set(HEAVY_MODULES))
+    print(f"optional toolkits imported: {', '.join(heavy) or 'none'}")
+
+    print(f"\n{'module':<40} {'cumulative_ms':>14}")
+    slowest = sorted(
+        ((name, total) for name, total in last.items() if name != args.module),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    for name, total in slowest[: args.top]:
+        print(f"{name:<40} {total / 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+bench_toxicity_batching.py
+Throughput and latency of toxicity scoring with and without micro-batching
+
+Concurrent clients each submit a session's windows to a MicroBatcher wrapping
+a stand-in classifier whose cost is a fixed per-call overhead plus a per-window
+cost, the shape of a transformer forward pass on CPU. Pass --model to use the
+real unitary/toxic-bert pipeline instead (requires transformers and torch).
+A batch size of 1 with no wait is the unbatched baseline.
+
+Usage (from python-service/):
+    python benchmarks/bench_toxicity_batching.py --clients 16 --requests 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inference_backend import load_classifier  # noqa: E402
+from toxicity import MicroBatcher, chunk_windows  # noqa: E402
+
+
+def simulated_classifier(call_ms: float, window_ms: float):
+    def classify(windows):
+        time.sleep((call_ms + window_ms * len(windows)) / 1000)
+        return [{"toxic": 0.1, "identity_hate": 0.0} for _ in windows]
+
+    return classify
+
+
+def run(batcher: MicroBatcher, windows, clients: int, requests: int):
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        for _ in range(requests):
+            start = time.perf_counter()
+            batcher.submit(windows).result()
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--windows", type=int, default=2, help="windows per request")
+    parser.add_argument("--call-ms", type=float, default=15.0, help="simulated per-call overhead")
+    parser.add_argument("--window-ms", type=float, default=2.0, help="simulated per-window cost")
+    parser.add_argument("--model", action="store_true", help="use unitary/toxic-bert")
+    parser.add_argument("--backend", default="pytorch", help="inference backend with --model")
+    args = parser.parse_args()
+
+    if args.model:
+        classify = load_classifier("unitary/toxic-bert", args.backend)
+        text = "I feel anxious about my job and my manager keeps criticising me. " * 60
+        windows = chunk_windows(text, classify.tokenizer)[: args.windows]
+    else:
+        classify = simulated_classifier(args.call_ms, args.window_ms)
+        windows = ["window"] * args.windows
+
+    print(f"{args.clients} clients x {args.requests} requests, {len(windows)} windows each")
+    print(f"{'batch':>6} {'wait_ms':>8} {'req/s':>8} {'p50_ms':>8} {'p95_ms':>8} {'passes':>7}")
+    for batch_size, wait_ms in ((1, 0), (8, 2), (32, 5), (32, 10), (64, 20)):
+        batcher = MicroBatcher(classify, max_batch_size=batch_size, max_wait_ms=wait_ms)
+        elapsed, latencies = run(batcher, windows, args.clients, args.requests)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"{batch_size:>6} {wait_ms:>8} {len(latencies) / elapsed:>8.1f} "
+            f"{statistics.median(latencies) * 1000:>8.1f} {p95 * 1000:>8.1f} "
+            f"{batcher.stats['batches']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+bench_worker_memory.py
+Per-worker RSS and PSS under gunicorn with and without preloading
+
+Starts the Flask service under gunicorn (with the repo's gunicorn_config.py
+and its fork hooks) twice, once per GUNICORN_PRELOAD_APP setting, sends a
+few /analyze requests to every worker, then reads each worker's
+/proc/<pid>/smaps_rollup. RSS counts shared pages in every worker; PSS splits
+them between the processes sharing them, so the PSS sum is the real total.
+
+Usage (from python-service/):
+    python benchmarks/bench_worker_memory.py --workers 4
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUNICORN_CONFIG = os.path.join(os.path.dirname(SERVICE_DIR), "gunicorn_config.py")
+
+sys.path.insert(0, SERVICE_DIR)
+
+from bench_serving_modes import PAYLOAD, wait_for_health  # noqa: E402
+from preload import memory_usage  # noqa: E402
+
+
+def worker_pids(master_pid: int):
+    with open(f"/proc/{master_pid}/task/{master_pid}/children") as f:
+        return [int(pid) for pid in f.read().split()]
+
+
+def measure(preload: bool, workers: int, port: int, worker_class: str, requests: int):
+    env = {
+        **os.environ,
+        "GUNICORN_PRELOAD_APP": "true" if preload else "false",
+        "GUNICORN_PIDFILE": f"/tmp/bench-worker-memory-{port}.pid",
+        "FLASK_SECRET_KEY": os.environ.get("FLASK_SECRET_KEY", "benchmark-flask-secret"),
+        "JWT_SECRET_KEY": os.environ.get("JWT_SECRET_KEY", "benchmark-jwt-secret"),
+        "BIAS_RATE_LIMIT_PER_MINUTE": "0",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn",
+            "-c", GUNICORN_CONFIG,
+            "--chdir", SERVICE_DIR,
+            "-k", worker_class,
+            "-w", str(workers),
+            "-b", f"127.0.0.1:{port}",
+            "bias_detection_service:app",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        wait_for_health(base_url, timeout=120)
+        # Let every worker import (without preload) and serve some traffic
+        while len(worker_pids(server.pid)) < workers:
+            time.sleep(0.2)
+        time.sleep(2)
+        for _ in range(requests * workers):
+            request = urllib.request.Request(
+                f"{base_url}/analyze", data=PAYLOAD, headers={"Content-Type": "application/json"}
+            )
+            urllib.request.urlopen(request, timeout=30).read()
+        return memory_usage(server.pid), {pid: memory_usage(pid) for pid in worker_pids(server.pid)}
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=5, help="requests per worker")
+    parser.add_argument("--worker-class", default="sync")
+    parser.add_argument("--port", type=int, default=5093)
+    args = parser.parse_args()
+
+    print(f"{'preload':>8} {'process':>10} {'rss_mb':>8} {'pss_mb':>8} {'private_mb':>11}")
+    for preload in (False, True):
+        master, workers = measure(preload, args.workers, args.port, args.worker_class, args.requests)
+        rows = [("master", master)] + [(str(pid), usage) for pid, usage in workers.items()]
+        for name, usage in rows:
+            private = usage.get("private_clean_kb", 0) + usage.get("private_dirty_kb", 0)
+            print(
+                f"{str(preload):>8} {name:>10} {usage.get('rss_kb', 0) / 1024:>8.1f} "
+                f"{usage.get('pss_kb', 0) / 1024:>8.1f} {private / 1024:>11.1f}"
+            )
+        total_rss = sum(usage.get("rss_kb", 0) for _, usage in rows) / 1024
+        total_pss = sum(usage.get("pss_kb", 0) for _, usage in rows) / 1024
+        print(f"{str(preload):>8} {'total':>10} {total_rss:>8.1f} {total_pss:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
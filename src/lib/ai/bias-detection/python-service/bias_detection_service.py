@@ -19,13 +19,18 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
 import traceback
 import uuid
-from dataclasses import asdict, dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta
-from functools import wraps
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import partial, wraps
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 import jwt
 
@@ -34,104 +39,63 @@ import numpy as np
 import pandas as pd
 
 # Flask and web framework
-from flask import Flask, Response, g, jsonify, request
+from flask import Flask, Response, g, jsonify, request, stream_with_context
 from flask_cors import CORS
-from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from werkzeug.exceptions import BadRequest, InternalServerError, Unauthorized
-
-# IBM AIF360
-try:
-    from aif360.algorithms.inprocessing import AdversarialDebiasing
-    from aif360.algorithms.preprocessing import DisparateImpactRemover, Reweighing
-    from aif360.datasets import BinaryLabelDataset, StandardDataset
-    from aif360.metrics import BinaryLabelDatasetMetric, ClassificationMetric
-
-    # Note: FairAdaBoost was removed in newer AIF360 versions
-    FairAdaBoost = None  # Deprecated/removed from AIF360
-    from aif360.algorithms.postprocessing import (
-        CalibratedEqOddsPostprocessing,
-        EqOddsPostprocessing,
-    )
-
-    AIF360_AVAILABLE = True
-except ImportError as e:
-    AIF360_AVAILABLE = False
-    FairAdaBoost = None
-    logging.warning(f"AIF360 not available: {e}")
-
-# Microsoft Fairlearn
-try:
-    from fairlearn.metrics import (
-        demographic_parity_difference,
-        demographic_parity_ratio,
-        equalized_odds_difference,
-        equalized_odds_ratio,
-        selection_rate,
-    )
-    from fairlearn.postprocessing import ThresholdOptimizer
-    from fairlearn.reductions import (
-        DemographicParity,
-        EqualizedOdds,
-        ExponentiatedGradient,
-    )
+from werkzeug.exceptions import (
+    BadRequest,
+    InternalServerError,
+    RequestEntityTooLarge,
+    Unauthorized,
+)
 
-    FAIRLEARN_AVAILABLE = True
-except ImportError as e:
-    FAIRLEARN_AVAILABLE = False
-    logging.warning(f"Fairlearn not available: {e}")
-
-# Hugging Face evaluate
-try:
-    import evaluate
-    from transformers import AutoModelForSequenceClassification, AutoTokenizer
-    from transformers.pipelines import pipeline
-
-    HF_EVALUATE_AVAILABLE = True
-except ImportError as e:
-    HF_EVALUATE_AVAILABLE = False
-    pipeline = None
-    logging.warning(f"Hugging Face evaluate not available: {e}")
-
-# NLP libraries
-try:
-    import nltk
-    import spacy
-    from nltk.sentiment import SentimentIntensityAnalyzer
-    from textblob import TextBlob
-
-    NLP_AVAILABLE = True
-except ImportError as e:
-    NLP_AVAILABLE = False
-    logging.warning(f"NLP libraries not available: {e}")
-
-# Model interpretability
-try:
-    import lime
-    import shap
-    from lime.lime_text import LimeTextExplainer
-
-    INTERPRETABILITY_AVAILABLE = True
-except ImportError as e:
-    INTERPRETABILITY_AVAILABLE = False
-    logging.warning(f"Interpretability libraries not available: {e}")
-
-# Visualization and data processing
-try:
-    import matplotlib
-
-    matplotlib.use("Agg")  # Use non-interactive backend
-    import matplotlib.pyplot as plt
-    import plotly.express as px
-    import plotly.graph_objs as go
-    import seaborn as sns
-    from plotly.subplots import make_subplots
-
-    VISUALIZATION_AVAILABLE = True
-except ImportError as e:
-    VISUALIZATION_AVAILABLE = False
-    logging.warning(f"Visualization libraries not available: {e}")
+from analysis_context import AnalysisContext
+from analysis_modes import (
+    ANALYSIS_MODES,
+    DEFAULT_ANALYSIS_MODE,
+    DEFAULT_DEADLINES_MS,
+    DEFAULT_LATENCY_BUDGETS_MS,
+    MODE_LAYERS,
+    parse_analysis_mode,
+)
+from audit_store import AuditStore
+from audit_writer import AuditWriter
+from capabilities import toolkit
+from dashboard_rollups import DashboardRollups
+from deadlines import gather_with_deadlines, layer_timeouts
+from export_stream import EXPORT_FORMATS, iter_export
+from incremental import IncrementalSession, IncrementalSessionNotFound
+from inference_backend import INFERENCE_BACKENDS, load_classifier
+from layer_executor import LayerExecutor
+from lexicon import CompiledLexicon, LexiconScan
+from preload import memory_usage
+from rate_limiter import RateLimiter, retry_after_seconds
+from request_body import PayloadError, PayloadTooLarge, check_content_length, decode_json
+from resources import SPACY_MODEL, ensure_nltk_resource, spacy_model_path
+from result_cache import ResultCache, compute_cache_key
+from result_store import ResultStore, parse_date_range
+from serialization import dumps, encode_json_response
+from toxicity import MicroBatcher, aggregate_scores, chunk_windows
+from warmup import WARMUP_SESSION, Readiness
+
+# Optional toolkits: availability is probed without importing them, and each
+# is imported by the layer that first uses it (see capabilities.py)
+AIF360 = toolkit("aif360")
+FAIRLEARN = toolkit("fairlearn")
+HF_EVALUATE = toolkit("hf_evaluate")
+NLP = toolkit("nlp")
+INTERPRETABILITY = toolkit("interpretability")
+VISUALIZATION = toolkit("visualization")
+
+AIF360_AVAILABLE = AIF360.available
+FAIRLEARN_AVAILABLE = FAIRLEARN.available
+HF_EVALUATE_AVAILABLE = HF_EVALUATE.available
+NLP_AVAILABLE = NLP.available
+INTERPRETABILITY_AVAILABLE = INTERPRETABILITY.available
+VISUALIZATION_AVAILABLE = VISUALIZATION.available
+
+for _toolkit in (AIF360, FAIRLEARN, HF_EVALUATE, NLP, INTERPRETABILITY, VISUALIZATION):
+    if not _toolkit.available:
+        logging.warning(f"{_toolkit.name} not available: missing {', '.join(_toolkit.missing)}")
 
 import base64
 
@@ -179,10 +143,85 @@ class BiasDetectionConfig:
     enable_hipaa_compliance: bool = True
     enable_audit_logging: bool = True
     enable_encryption: bool = True
+    # Request body limits, enforced before the body is read or parsed
     max_session_size_mb: int = 50
+    max_batch_size_mb: int = 200
+    # JSON responses at least this large are gzip/brotli compressed when accepted
+    response_compression_min_bytes: int = 1024
+    # toxic-bert windows are batched across concurrent requests; a batch runs
+    # when full or max_wait_ms after its first window arrived
+    toxicity_window_tokens: int = 512
+    toxicity_max_batch_size: int = 32
+    toxicity_max_wait_ms: float = 10.0
+    # Classifier backend: "pytorch" (fp32), "int8" (dynamic quantization) or
+    # "onnx" (exported graph on onnxruntime's CPU provider, cached at onnx_model_path)
+    inference_backend: str = "pytorch"
+    onnx_model_path: Optional[str] = None
+    inference_threads: Optional[int] = None
+    # Per-user token buckets shared by all workers (0 disables); burst
+    # defaults to one minute's allowance
     rate_limit_per_minute: int = 60
+    rate_limit_burst: Optional[int] = None
+    rate_limit_path: Optional[str] = None
+    # "inline" runs layers on the event loop, "process" offloads CPU-bound layers
+    layer_execution: str = "inline"
+    layer_executor_workers: Optional[int] = None
+    # spaCy nlp.pipe settings for batch analysis
+    nlp_batch_size: int = 64
+    nlp_n_process: int = 1
+    # Content-addressed result cache; the disk tier is encrypted and optional
+    enable_result_cache: bool = True
+    result_cache_size: int = 1024
+    result_cache_ttl_seconds: int = 3600
+    result_cache_dir: Optional[str] = None
+    # Live sessions kept for /analyze/append, least recently used dropped first
+    incremental_session_limit: int = 256
+    # Latency budget per analysis tier (fast/standard/deep), in milliseconds
+    analysis_latency_budgets_ms: Optional[Dict[str, float]] = None
+    # Hard deadline per tier, split across its layers by layer_deadline_shares;
+    # layers over their share are abandoned and the result is marked partial.
+    # Inline layers then run on a thread pool (0 for a tier disables deadlines)
+    analysis_deadlines_ms: Optional[Dict[str, float]] = None
+    layer_deadline_shares: Optional[Dict[str, float]] = None
+    layer_thread_workers: Optional[int] = None
+    # Attach AnalysisContext build counts/timings to each result
+    enable_analysis_profiling: bool = False
+    # Background audit writer; fsync every N events or T ms (0 disables a rule)
+    audit_buffered: bool = True
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 256
+    audit_fsync_every_events: int = 100
+    audit_fsync_interval_ms: int = 1000
+    # Segmented, indexed audit store (enables find_events lookups by session)
+    audit_store_dir: Optional[str] = None
+    audit_segment_max_mb: int = 64
+    audit_segment_max_age_hours: float = 24
+    # Dashboard rollups; with a path they are shared by all workers via the file
+    dashboard_rollup_path: Optional[str] = None
+    dashboard_flush_interval_seconds: float = 5.0
+    # History of completed analyses streamed by /export (none kept when unset)
+    result_store_dir: Optional[str] = None
+    export_chunk_rows: int = 500
+    # Bundled NLTK/spaCy resources (see resources.py); runtime downloads are
+    # off so workers never reach the network at startup
+    resource_dir: Optional[str] = None
+    allow_resource_downloads: bool = False
+    # Run a synthetic session through every tier at startup; /ready waits for it
+    warmup_on_start: bool = True
 
     def __post_init__(self):
+        if self.layer_execution not in ("inline", "process"):
+            raise ValueError(f"Unknown layer_execution mode: {self.layer_execution}")
+        if self.inference_backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"Unknown inference_backend: {self.inference_backend}")
+        self.analysis_latency_budgets_ms = {
+            **DEFAULT_LATENCY_BUDGETS_MS,
+            **(self.analysis_latency_budgets_ms or {}),
+        }
+        self.analysis_deadlines_ms = {
+            **DEFAULT_DEADLINES_MS,
+            **(self.analysis_deadlines_ms or {}),
+        }
         if self.layer_weights is None:
             self.layer_weights = {
                 "preprocessing": 0.25,
@@ -211,6 +250,108 @@ class SessionData:
             self.timestamp = datetime.now().isoformat()
 
 
+# Lexical term lists used by the linguistic bias detectors
+GENDER_TERMS = {
+    "male": [
+        "he",
+        "him",
+        "his",
+        "man",
+        "men",
+        "boy",
+        "boys",
+        "male",
+        "father",
+        "son",
+        "brother",
+    ],
+    "female": [
+        "she",
+        "her",
+        "hers",
+        "woman",
+        "women",
+        "girl",
+        "girls",
+        "female",
+        "mother",
+        "daughter",
+        "sister",
+    ],
+}
+
+RACIAL_TERMS = [
+    "race",
+    "racial",
+    "ethnic",
+    "ethnicity",
+    "minority",
+    "majority",
+    "black",
+    "white",
+    "asian",
+    "hispanic",
+    "latino",
+    "native",
+]
+
+AGE_TERMS = [
+    "young",
+    "old",
+    "elderly",
+    "senior",
+    "youth",
+    "teenager",
+    "adult",
+    "child",
+    "children",
+    "baby",
+    "infant",
+    "toddler",
+    "adolescent",
+]
+
+CULTURAL_TERMS = [
+    "culture",
+    "cultural",
+    "religion",
+    "religious",
+    "tradition",
+    "traditional",
+    "foreign",
+    "immigrant",
+    "native",
+    "indigenous",
+    "western",
+    "eastern",
+]
+
+BIASED_TERMS = {
+    "gender": ["mankind", "manpower", "chairman", "policeman", "fireman"],
+    "racial": ["exotic", "articulate", "urban", "ghetto", "primitive"],
+    "age": ["over the hill", "senior moment", "young blood", "old-fashioned"],
+    "ability": ["crazy", "insane", "lame", "blind to", "deaf to"],
+}
+
+# Column order of the per-session lexical count vectors
+LEXICAL_COUNT_COLUMNS = ("male", "female", "racial", "age", "cultural")
+
+# Biased-term categories are prefixed so they don't collide with the count columns
+BIASED_TERM_PREFIX = "biased:"
+
+# All detector term lists compiled once for single-pass matching
+BIAS_LEXICON = CompiledLexicon(
+    {
+        "male": GENDER_TERMS["male"],
+        "female": GENDER_TERMS["female"],
+        "racial": RACIAL_TERMS,
+        "age": AGE_TERMS,
+        "cultural": CULTURAL_TERMS,
+        **{f"{BIASED_TERM_PREFIX}{category}": terms for category, terms in BIASED_TERMS.items()},
+    }
+)
+
+
 class SecurityManager:
     """Handles encryption, authentication, and HIPAA compliance"""
 
@@ -255,11 +396,17 @@ class SecurityManager:
 
 
 class AuditLogger:
-    """HIPAA-compliant audit logging"""
+    """HIPAA-compliant audit logging
+
+    With a ``writer`` events are handed to a background group-commit writer;
+    without one each event is appended synchronously.
+    """
 
-    def __init__(self, security_manager: SecurityManager):
+    def __init__(self, security_manager: SecurityManager, writer: Optional[AuditWriter] = None):
         self.security_manager = security_manager
-        self.audit_file = "bias_detection_audit.log"
+        self.writer = writer
+        self.store = writer.sink if writer and isinstance(writer.sink, AuditStore) else None
+        self.audit_file = writer.path if writer else "bias_detection_audit.log"
 
     async def log_event(
         self,
@@ -286,11 +433,51 @@ class AuditLogger:
             )
 
         # Write to audit log
-        with open(self.audit_file, "a") as f:
-            f.write(json.dumps(audit_entry) + "\n")
+        if self.writer is not None:
+            self.writer.submit(
+                json.dumps(audit_entry), audit_entry["session_id_hash"], event_type
+            )
+        else:
+            with open(self.audit_file, "a") as f:
+                f.write(json.dumps(audit_entry) + "\n")
 
         logger.info(f"Audit event logged: {event_type} for session {session_id}")
 
+    def find_events(
+        self, session_id: str, event_type: Optional[str] = None, decrypt: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Audit events for a session, with sensitive details decrypted
+
+        Uses the audit store index when configured, otherwise scans the log.
+        """
+        session_id_hash = self.security_manager.hash_session_id(session_id)
+        decrypt_fn = self.security_manager.decrypt_data if decrypt else None
+        if self.store is not None:
+            yield from self.store.query(session_id_hash, event_type, decrypt_fn)
+            return
+
+        if not os.path.exists(self.audit_file):
+            return
+        with open(self.audit_file) as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get("session_id_hash") != session_id_hash:
+                    continue
+                if event_type is not None and record.get("event_type") != event_type:
+                    continue
+                if decrypt_fn and "encrypted_details" in record:
+                    record["details"] = json.loads(decrypt_fn(record["encrypted_details"]))
+                yield record
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until buffered events are durable"""
+        return self.writer.flush(timeout) if self.writer else True
+
+    def close(self):
+        """Flush and stop the background writer"""
+        if self.writer:
+            self.writer.close()
+
 
 class BiasDetectionService:
     """Main bias detection service implementing multi-layer analysis"""
@@ -298,92 +485,169 @@ class BiasDetectionService:
     def __init__(self, config: BiasDetectionConfig):
         self.config = config
         self.security_manager = SecurityManager()
-        self.audit_logger = AuditLogger(self.security_manager)
+        self.audit_logger = AuditLogger(self.security_manager, self._create_audit_writer(config))
         self.nlp = None
         self.sentiment_analyzer = None
         self.bias_classifier = None
+        self.toxicity_batcher = None
+        self.layer_executor = None
+        self._layer_threads: Optional[ThreadPoolExecutor] = None
+        self._layer_threads_pid: Optional[int] = None
+        self._layer_threads_lock = threading.Lock()
+        self.result_cache = None
+        self.incremental_sessions: "OrderedDict[str, IncrementalSession]" = OrderedDict()
+        self._incremental_lock = threading.Lock()
+        self.rollups = DashboardRollups(
+            config.dashboard_rollup_path, config.dashboard_flush_interval_seconds
+        )
+        self.rate_limiter = None
+        if config.rate_limit_per_minute > 0:
+            self.rate_limiter = RateLimiter(
+                config.rate_limit_per_minute, config.rate_limit_burst, config.rate_limit_path
+            )
+        self.readiness = Readiness()
+        self.result_store = None
+        if config.result_store_dir:
+            self.result_store = ResultStore(
+                config.result_store_dir,
+                fernet=self.security_manager.fernet if config.enable_encryption else None,
+            )
         self._initialize_components()
 
+        if self.bias_classifier is not None:
+            self.toxicity_batcher = MicroBatcher(
+                self.bias_classifier,
+                max_batch_size=config.toxicity_max_batch_size,
+                max_wait_ms=config.toxicity_max_wait_ms,
+            )
+
+        if config.enable_result_cache:
+            self.result_cache = ResultCache(
+                max_entries=config.result_cache_size,
+                ttl_seconds=config.result_cache_ttl_seconds,
+                disk_dir=config.result_cache_dir,
+                fernet=self.security_manager.fernet,
+            )
+
+        if config.layer_execution == "process":
+            # Pool processes build their own inline service from the same config
+            self.layer_executor = LayerExecutor(
+                partial(BiasDetectionService, replace(config, layer_execution="inline")),
+                max_workers=config.layer_executor_workers,
+            )
+
+    def _create_audit_writer(self, config: BiasDetectionConfig) -> Optional[AuditWriter]:
+        """Background audit writer over the log file or the segmented store"""
+        if config.audit_store_dir:
+            sink = AuditStore(
+                config.audit_store_dir,
+                max_segment_bytes=config.audit_segment_max_mb * 1024 * 1024,
+                max_segment_age_seconds=config.audit_segment_max_age_hours * 3600,
+            )
+        elif config.audit_buffered:
+            sink = "bias_detection_audit.log"
+        else:
+            return None
+
+        return AuditWriter(
+            sink,
+            max_queue=config.audit_queue_size,
+            batch_size=config.audit_batch_size,
+            fsync_every_events=config.audit_fsync_every_events,
+            fsync_interval_ms=config.audit_fsync_interval_ms,
+        )
+
     def _initialize_components(self):
         """Initialize NLP and ML components"""
         try:
             # Initialize NLP components
-            if NLP_AVAILABLE:
-                self.nlp = spacy.load("en_core_web_sm")
-                nltk.download("vader_lexicon", quiet=True)
-                self.sentiment_analyzer = SentimentIntensityAnalyzer()
+            spacy_model = spacy_model_path(self.config.resource_dir) if NLP_AVAILABLE else None
+            if NLP_AVAILABLE and spacy_model is None:
+                logger.warning(
+                    f"spaCy model {SPACY_MODEL} not bundled or installed, NLP components disabled"
+                )
+            elif NLP_AVAILABLE:
+                self.nlp = NLP.spacy.load(spacy_model)
+                if ensure_nltk_resource(
+                    "vader_lexicon", self.config.resource_dir, self.config.allow_resource_downloads
+                ):
+                    self.sentiment_analyzer = NLP.SentimentIntensityAnalyzer()
+                else:
+                    logger.warning("VADER lexicon not bundled, sentiment falls back to TextBlob")
                 logger.info("NLP components initialized")
 
             # Initialize bias detection models
-            if HF_EVALUATE_AVAILABLE and pipeline is not None:
-                self.bias_classifier = pipeline(
-                    "text-classification",
-                    model="unitary/toxic-bert",
-                    device=-1,  # Use CPU
+            if HF_EVALUATE_AVAILABLE:
+                self.bias_classifier = load_classifier(
+                    "unitary/toxic-bert",
+                    backend=self.config.inference_backend,
+                    onnx_path=self.config.onnx_model_path,
+                    num_threads=self.config.inference_threads,
+                )
+                logger.info(
+                    f"Bias classification model initialized ({self.config.inference_backend} backend)"
                 )
-                logger.info("Bias classification model initialized")
 
         except Exception as e:
             logger.error(f"Failed to initialize components: {e}")
 
-    async def analyze_session(self, session_data: SessionData, user_id: str) -> Dict[str, Any]:
-        """Perform comprehensive bias analysis on a therapeutic session"""
+    async def analyze_session(
+        self,
+        session_data: SessionData,
+        user_id: str,
+        linguistic_bias: Optional[Dict[str, Any]] = None,
+        analysis_mode: str = DEFAULT_ANALYSIS_MODE,
+        deadline_ms: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Perform comprehensive bias analysis on a therapeutic session
+
+        ``linguistic_bias`` may carry a result precomputed by analyze_sessions,
+        in which case the preprocessing layer skips its own spaCy parse.
+        ``analysis_mode`` selects the fast, standard or deep tier, and
+        ``deadline_ms`` may tighten the tier's deadline.
+        """
         start_time = time.time()
+        cache_key = (
+            compute_cache_key(session_data, self.config, analysis_mode)
+            if self.result_cache
+            else None
+        )
 
         try:
+            if cache_key:
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    await self.audit_logger.log_event(
+                        "analysis_cache_hit",
+                        session_data.session_id,
+                        user_id,
+                        {"overall_bias_score": cached["overall_bias_score"]},
+                    )
+                    return {
+                        **cached,
+                        "cache_hit": True,
+                        "processing_time_seconds": time.time() - start_time,
+                    }
+
             # Log analysis start
             await self.audit_logger.log_event(
                 "analysis_started",
                 session_data.session_id,
                 user_id,
-                {"analysis_type": "comprehensive_bias_detection"},
+                {"analysis_type": "comprehensive_bias_detection", "analysis_mode": analysis_mode},
             )
 
-            # Run all analysis layers in parallel
-            tasks = [
-                self._run_preprocessing_analysis(session_data),
-                self._run_model_level_analysis(session_data),
-                self._run_interactive_analysis(session_data),
-                self._run_evaluation_analysis(session_data),
-            ]
-
-            layer_results = await asyncio.gather(*tasks)
-            (
-                preprocessing_result,
-                model_level_result,
-                interactive_result,
-                evaluation_result,
-            ) = layer_results
-
-            # Calculate overall bias score
-            overall_score = self._calculate_overall_bias_score(layer_results)
-
-            # Generate recommendations
-            recommendations = self._generate_recommendations(layer_results)
-
-            # Determine alert level
-            alert_level = self._determine_alert_level(overall_score)
+            # Run the tier's analysis layers in parallel
+            context = AnalysisContext(
+                self, session_data, analysis_mode=analysis_mode, linguistic_bias=linguistic_bias
+            )
+            layer_results = await self._run_analysis_layers(session_data, context, deadline_ms)
+            result = self._build_analysis_result(context, layer_results, start_time)
 
-            # Calculate confidence
-            confidence = self._calculate_confidence(layer_results)
-
-            result = {
-                "session_id": session_data.session_id,
-                "timestamp": datetime.now().isoformat(),
-                "overall_bias_score": overall_score,
-                "layer_results": {
-                    "preprocessing": preprocessing_result,
-                    "model_level": model_level_result,
-                    "interactive": interactive_result,
-                    "evaluation": evaluation_result,
-                },
-                "demographics": session_data.participant_demographics,
-                "recommendations": recommendations,
-                "alert_level": alert_level,
-                "confidence": confidence,
-                "processing_time_seconds": time.time() - start_time,
-                "service_version": "1.0.0",
-            }
+            # Partial results would pin a degraded answer in the cache
+            if cache_key and not result["partial"]:
+                self.result_cache.set(cache_key, result)
+            self._record_completed(result)
 
             # Log analysis completion
             await self.audit_logger.log_event(
@@ -391,8 +655,8 @@ class BiasDetectionService:
                 session_data.session_id,
                 user_id,
                 {
-                    "overall_bias_score": overall_score,
-                    "alert_level": alert_level,
+                    "overall_bias_score": result["overall_bias_score"],
+                    "alert_level": result["alert_level"],
                     "processing_time": time.time() - start_time,
                 },
                 sensitive_data=True,
@@ -414,8 +678,407 @@ class BiasDetectionService:
             logger.error(f"Bias analysis failed for session {session_data.session_id}: {e}")
             raise
 
-    async def _run_preprocessing_analysis(self, session_data: SessionData) -> Dict[str, Any]:
+    def _build_analysis_result(
+        self, context: AnalysisContext, layer_results: List[Dict[str, Any]], start_time: float
+    ) -> Dict[str, Any]:
+        """Combine layer results into the analysis response"""
+        session_data = context.session_data
+        mode = context.analysis_mode
+
+        # Calculate overall bias score
+        overall_score = self._calculate_overall_bias_score(layer_results)
+
+        # Generate recommendations
+        recommendations = self._generate_recommendations(layer_results)
+
+        # Determine alert level
+        alert_level = self._determine_alert_level(overall_score)
+
+        # Calculate confidence
+        confidence = self._calculate_confidence(layer_results)
+
+        result = {
+            "session_id": session_data.session_id,
+            "timestamp": datetime.now().isoformat(),
+            "overall_bias_score": overall_score,
+            "layer_results": dict(zip(MODE_LAYERS[mode], layer_results)),
+            "demographics": session_data.participant_demographics,
+            "recommendations": recommendations,
+            "alert_level": alert_level,
+            "confidence": confidence,
+            "processing_time_seconds": time.time() - start_time,
+            "service_version": "1.0.0",
+            "cache_hit": False,
+        }
+
+        budget_ms = self.config.analysis_latency_budgets_ms[mode]
+        elapsed_ms = result["processing_time_seconds"] * 1000
+        result["analysis_mode"] = mode
+        result["latency_budget_ms"] = budget_ms
+        result["within_latency_budget"] = elapsed_ms <= budget_ms
+        result["timed_out_layers"] = [r["layer"] for r in layer_results if r.get("timed_out")]
+        result["partial"] = bool(result["timed_out_layers"])
+        if elapsed_ms > budget_ms:
+            logger.warning(
+                f"{mode} analysis of session {session_data.session_id} took "
+                f"{elapsed_ms:.1f}ms, over its {budget_ms:.0f}ms budget"
+            )
+
+        profile = context.profile()
+        logger.debug(f"Analysis context for session {session_data.session_id}: {profile}")
+        if self.config.enable_analysis_profiling:
+            result["analysis_profile"] = profile
+        return result
+
+    def _record_completed(self, result: Dict[str, Any]):
+        """Feed a completed analysis to the dashboard rollups and export history"""
+        self.rollups.record(result)
+        if self.result_store:
+            self.result_store.append(
+                {
+                    "session_id": result["session_id"],
+                    "bias_score": result["overall_bias_score"],
+                    "alert_level": result["alert_level"],
+                    "timestamp": result["timestamp"],
+                }
+            )
+
+    def iter_results(
+        self, date_range: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Completed analyses recorded within an inclusive date range"""
+        start, end = parse_date_range(date_range)
+        if not self.result_store:
+            return iter(())
+        return self.result_store.scan(start, end)
+
+    def invalidate_cached_results(self, session_id: Optional[str] = None) -> int:
+        """Drop cached results for a session, or all of them when no id is given"""
+        if not self.result_cache:
+            return 0
+        if session_id is None:
+            removed = self.result_cache.stats()["memory_entries"]
+            self.result_cache.clear()
+            return removed
+        return self.result_cache.invalidate_session(session_id)
+
+    def warmup_steps(self) -> List[Tuple[str, Any]]:
+        """Warm-up steps: the synthetic session analyzed once per tier"""
+        session_data = SessionData(**WARMUP_SESSION)
+        return [
+            (f"{mode}_analysis", partial(self._warm_up_tier, session_data, mode))
+            for mode in ANALYSIS_MODES
+        ]
+
+    def _warm_up_tier(self, session_data: SessionData, analysis_mode: str):
+        """Run a tier's layers like analyze_session, without caching, auditing or recording"""
+        start_time = time.time()
+        context = AnalysisContext(self, session_data, analysis_mode=analysis_mode)
+        layer_results = asyncio.run(self._run_analysis_layers(session_data, context, None))
+        result = self._build_analysis_result(context, layer_results, start_time)
+        if result["partial"]:
+            raise TimeoutError(f"Layers past their deadline: {', '.join(result['timed_out_layers'])}")
+
+    def prepare_for_fork(self):
+        """Drain state forked workers must not inherit (see preload.py)
+
+        Queued audit events and unflushed rollups would otherwise be written
+        once per worker, and pools hold threads/processes of this process only.
+        Warm-up finishes first so workers inherit warm, ready models.
+        """
+        self.readiness.wait()
+        self.audit_logger.flush(timeout=10)
+        self.rollups.flush()
+        if self.layer_executor is not None:
+            self.layer_executor.shutdown(wait=True)
+        with self._layer_threads_lock:
+            if self._layer_threads is not None:
+                self._layer_threads.shutdown(wait=True)
+                self._layer_threads = None
+
+    async def append_to_session(self, delta: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        """Fold new turns into a live session and re-score it in O(delta)
+
+        The first append for a session (or one with ``reset``) must carry
+        ``participant_demographics``; later appends only send new
+        ``ai_responses``/``transcripts``. Running lexical counts, response
+        moments and sentiment means stand in for re-parsing earlier turns.
+        Handles live in this process, dropped after ``final`` or LRU eviction.
+        """
+        start_time = time.time()
+        session_id = delta["session_id"]
+        new_responses = delta.get("ai_responses", [])
+        new_transcripts = delta.get("transcripts", [])
+        new_content = delta.get("content", {})
+
+        with self._incremental_lock:
+            handle = self.incremental_sessions.get(session_id)
+            if handle is None or delta.get("reset"):
+                if "participant_demographics" not in delta:
+                    raise IncrementalSessionNotFound(
+                        f"Unknown incremental session: {session_id}"
+                    )
+                handle = IncrementalSession(
+                    session_data=SessionData(
+                        session_id=session_id,
+                        participant_demographics=delta["participant_demographics"],
+                        training_scenario=delta.get("training_scenario", {}),
+                        content={},
+                        ai_responses=[],
+                        expected_outcomes=[],
+                        transcripts=[],
+                        metadata=delta.get("metadata", {}),
+                    ),
+                    lexical_counts=np.zeros(len(LEXICAL_COUNT_COLUMNS)),
+                )
+                self.incremental_sessions[session_id] = handle
+            self.incremental_sessions.move_to_end(session_id)
+            while len(self.incremental_sessions) > self.config.incremental_session_limit:
+                self.incremental_sessions.popitem(last=False)
+
+        # Parse only the new text, outside the lock
+        delta_text = self._extract_text_content(
+            SessionData(
+                session_id=session_id,
+                participant_demographics={},
+                training_scenario={},
+                content=new_content,
+                ai_responses=new_responses,
+                expected_outcomes=[],
+                transcripts=new_transcripts,
+                metadata={},
+            )
+        )
+        delta_scan = None
+        if delta_text and self.nlp and NLP_AVAILABLE:
+            doc = self.nlp(delta_text)
+            scan = BIAS_LEXICON.scan(doc)
+            delta_scan = (
+                [scan.counts[column] for column in LEXICAL_COUNT_COLUMNS],
+                len(doc),
+                len(delta_text),
+                self._analyze_sentiment(delta_text),
+                self._detect_biased_terms(doc, scan),
+            )
+
+        with self._incremental_lock:
+            session_data = handle.session_data
+            session_data.ai_responses.extend(new_responses)
+            session_data.transcripts.extend(new_transcripts)
+            session_data.content.update(new_content)
+            session_data.expected_outcomes.extend(delta.get("expected_outcomes", []))
+            if "participant_demographics" in delta:
+                session_data.participant_demographics = delta["participant_demographics"]
+            handle.response_stats.update(new_responses)
+            if delta_scan is not None:
+                handle.add_text(*delta_scan)
+            handle.appends += 1
+
+            linguistic_bias = (
+                self._incremental_linguistic_bias(handle) if self.nlp and NLP_AVAILABLE else None
+            )
+            response_stats = deepcopy(handle.response_stats)
+            appends = handle.appends
+
+            if delta.get("final"):
+                self.incremental_sessions.pop(session_id, None)
+
+        await self.audit_logger.log_event(
+            "analysis_started",
+            session_id,
+            user_id,
+            {"analysis_type": "incremental_bias_detection", "append": appends},
+        )
+
+        context = AnalysisContext(
+            self, session_data, linguistic_bias=linguistic_bias, response_stats=response_stats
+        )
+        layer_results = await self._run_analysis_layers(session_data, context)
+        result = self._build_analysis_result(context, layer_results, start_time)
+        result["incremental"] = {
+            "appends": appends,
+            "appended_responses": len(new_responses),
+            "appended_transcripts": len(new_transcripts),
+            "total_responses": response_stats.count,
+            "final": bool(delta.get("final")),
+        }
+        if delta.get("final"):
+            # Intermediate appends are previews; count the session once
+            self._record_completed(result)
+
+        await self.audit_logger.log_event(
+            "analysis_completed",
+            session_id,
+            user_id,
+            {
+                "overall_bias_score": result["overall_bias_score"],
+                "alert_level": result["alert_level"],
+                "processing_time": time.time() - start_time,
+            },
+            sensitive_data=True,
+        )
+        return result
+
+    def _incremental_linguistic_bias(self, handle: IncrementalSession) -> Dict[str, Any]:
+        """Linguistic bias result from a session's running lexical totals"""
+        scores = self._score_lexical_counts(
+            handle.lexical_counts.reshape(1, -1), np.array([handle.token_count], dtype=float)
+        )[0]
+        gender_bias, racial_bias, age_bias, cultural_bias = scores.tolist()
+        return {
+            "overall_bias_score": float(np.mean(scores)),
+            "gender_bias": gender_bias,
+            "racial_bias": racial_bias,
+            "age_bias": age_bias,
+            "cultural_bias": cultural_bias,
+            "sentiment": handle.sentiment,
+            "biased_terms": list(handle.biased_terms),
+            "text_length": handle.text_length,
+            "word_count": handle.token_count,
+        }
+
+    async def analyze_sessions(
+        self,
+        sessions: List[SessionData],
+        user_id: str,
+        analysis_mode: str = DEFAULT_ANALYSIS_MODE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Analyze many sessions, yielding each result as it completes
+
+        Text for the whole batch is parsed with ``nlp.pipe`` and lexical
+        scores are computed for a chunk of sessions at once, so the per-session
+        layers only run the remaining analysis. The fast tier skips the batch
+        parse; its tokenizer-only pass is cheaper per session.
+        """
+        batch_size = max(1, self.config.nlp_batch_size)
+        texts = (self._extract_text_content(session) for session in sessions)
+        docs = (
+            self.nlp.pipe(texts, batch_size=batch_size, n_process=self.config.nlp_n_process)
+            if self.nlp and NLP_AVAILABLE and analysis_mode != "fast"
+            else None
+        )
+
+        for offset in range(0, len(sessions), batch_size):
+            chunk = sessions[offset : offset + batch_size]
+            linguistic_results: List[Optional[Dict[str, Any]]] = [None] * len(chunk)
+            if docs is not None:
+                try:
+                    linguistic_results = self._detect_linguistic_bias_batch(
+                        list(islice(docs, len(chunk)))
+                    )
+                except Exception as e:
+                    logger.error(f"Batch linguistic analysis failed: {e}")
+                    docs = None
+
+            tasks = [
+                asyncio.ensure_future(
+                    self._analyze_batch_item(session, user_id, linguistic, analysis_mode)
+                )
+                for session, linguistic in zip(chunk, linguistic_results)
+            ]
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+    async def _analyze_batch_item(
+        self,
+        session_data: SessionData,
+        user_id: str,
+        linguistic_bias: Optional[Dict[str, Any]],
+        analysis_mode: str = DEFAULT_ANALYSIS_MODE,
+    ) -> Dict[str, Any]:
+        """Analyze one batch session, reporting failures in-band"""
+        try:
+            return await self.analyze_session(
+                session_data, user_id, linguistic_bias, analysis_mode
+            )
+        except Exception as e:
+            return {"session_id": session_data.session_id, "error": str(e)}
+
+    async def _run_analysis_layers(
+        self,
+        session_data: SessionData,
+        context: Optional[AnalysisContext] = None,
+        deadline_ms: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run the context's tier of analysis layers, on the process pool when enabled
+
+        Every layer shares ``context``; pool workers receive a pickled copy
+        carrying the artifacts that were already built or seeded. The fast
+        tier always runs inline, as a pool round trip would exceed its budget.
+
+        The tier's deadline (or the tighter ``deadline_ms``) is split across
+        the layers. CPU-bound inline layers cannot be interrupted on the event
+        loop, so under a deadline they run on the layer thread pool, where a
+        layer past its share is abandoned rather than awaited.
+        """
+        context = self._analysis_context(session_data, context)
+        layers = MODE_LAYERS[context.analysis_mode]
+        tier_deadline_ms = self.config.analysis_deadlines_ms.get(context.analysis_mode)
+        if deadline_ms and tier_deadline_ms:
+            deadline_ms = min(deadline_ms, tier_deadline_ms)
+        deadline_ms = deadline_ms or tier_deadline_ms
+        timeouts = (
+            layer_timeouts(deadline_ms, layers, self.config.layer_deadline_shares)
+            if deadline_ms
+            else None
+        )
+
+        if self.layer_executor is not None and context.analysis_mode != "fast":
+            layer_kwargs = {layer: {"context": context} for layer in layers}
+            return await self.layer_executor.run_layers(
+                self, session_data, layer_kwargs, layers, timeouts
+            )
+
+        if timeouts is None:
+            tasks = [
+                getattr(self, f"_run_{layer}_analysis")(session_data, context) for layer in layers
+            ]
+            return list(await asyncio.gather(*tasks))
+
+        loop = asyncio.get_running_loop()
+        pool = self._layer_thread_pool()
+        threaded = {
+            layer: loop.run_in_executor(
+                pool, self._run_layer_blocking, layer, session_data, context
+            )
+            for layer in layers
+        }
+        return await gather_with_deadlines(threaded, timeouts)
+
+    def _run_layer_blocking(
+        self, layer: str, session_data: SessionData, context: AnalysisContext
+    ) -> Dict[str, Any]:
+        """Run one analysis layer to completion on a layer pool thread"""
+        return asyncio.run(getattr(self, f"_run_{layer}_analysis")(session_data, context))
+
+    def _layer_thread_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for deadline-bounded inline layers, recreated after a fork"""
+        if self._layer_threads is None or self._layer_threads_pid != os.getpid():
+            with self._layer_threads_lock:
+                if self._layer_threads is None or self._layer_threads_pid != os.getpid():
+                    # Abandoned layers keep their thread until they finish, so
+                    # leave room beyond one request's worth of layers
+                    self._layer_threads = ThreadPoolExecutor(
+                        max_workers=self.config.layer_thread_workers
+                        or max(8, 4 * (os.cpu_count() or 1)),
+                        thread_name_prefix="analysis-layer",
+                    )
+                    self._layer_threads_pid = os.getpid()
+        return self._layer_threads
+
+    def _analysis_context(
+        self, session_data: SessionData, context: Optional[AnalysisContext]
+    ) -> AnalysisContext:
+        """Reuse the request's context, or start one for a direct layer call"""
+        if context is None:
+            return AnalysisContext(self, session_data)
+        return context.bind(self)
+
+    async def _run_preprocessing_analysis(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Run preprocessing layer bias analysis using AIF360 and demographic analysis"""
+        context = self._analysis_context(session_data, context)
         try:
             result = {
                 "layer": "preprocessing",
@@ -430,15 +1093,14 @@ class BiasDetectionService:
             result["metrics"]["demographic_analysis"] = demo_analysis
 
             # Linguistic bias detection
-            if self.nlp and NLP_AVAILABLE:
-                text_content = self._extract_text_content(session_data)
-                linguistic_bias = await self._detect_linguistic_bias(text_content)
+            linguistic_bias = context.linguistic_bias
+            if linguistic_bias is not None:
                 result["metrics"]["linguistic_bias"] = linguistic_bias
                 result["bias_score"] += linguistic_bias.get("overall_bias_score", 0.0) * 0.6
 
-            # AIF360 preprocessing analysis
-            if AIF360_AVAILABLE:
-                aif360_analysis = await self._run_aif360_preprocessing(session_data)
+            # AIF360 preprocessing analysis (skipped by the fast tier)
+            if AIF360_AVAILABLE and context.analysis_mode != "fast":
+                aif360_analysis = await self._run_aif360_preprocessing(session_data, context)
                 result["metrics"]["aif360_preprocessing"] = aif360_analysis
                 result["bias_score"] += aif360_analysis.get("bias_score", 0.0) * 0.4
 
@@ -468,8 +1130,11 @@ class BiasDetectionService:
                 "recommendations": [],
             }
 
-    async def _run_model_level_analysis(self, session_data: SessionData) -> Dict[str, Any]:
+    async def _run_model_level_analysis(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Run model-level bias analysis using Fairlearn and interpretability tools"""
+        context = self._analysis_context(session_data, context)
         try:
             result = {
                 "layer": "model_level",
@@ -481,18 +1146,18 @@ class BiasDetectionService:
 
             # Fairlearn analysis
             if FAIRLEARN_AVAILABLE:
-                fairlearn_analysis = await self._run_fairlearn_analysis(session_data)
+                fairlearn_analysis = await self._run_fairlearn_analysis(session_data, context)
                 result["metrics"]["fairlearn"] = fairlearn_analysis
                 result["bias_score"] += fairlearn_analysis.get("bias_score", 0.0) * 0.5
 
-            # Model interpretability analysis
-            if INTERPRETABILITY_AVAILABLE:
+            # Model interpretability analysis (deep tier only)
+            if INTERPRETABILITY_AVAILABLE and context.analysis_mode == "deep":
                 interpretability_analysis = await self._run_interpretability_analysis(session_data)
                 result["metrics"]["interpretability"] = interpretability_analysis
                 result["bias_score"] += interpretability_analysis.get("bias_score", 0.0) * 0.3
 
             # Response consistency analysis
-            consistency_analysis = self._analyze_response_consistency(session_data)
+            consistency_analysis = self._analyze_response_consistency(session_data, context)
             result["metrics"]["consistency"] = consistency_analysis
             result["bias_score"] += consistency_analysis.get("bias_score", 0.0) * 0.2
 
@@ -522,7 +1187,9 @@ class BiasDetectionService:
                 "recommendations": [],
             }
 
-    async def _run_interactive_analysis(self, session_data: SessionData) -> Dict[str, Any]:
+    async def _run_interactive_analysis(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Run interactive analysis using What-If Tool concepts and user interaction patterns"""
         try:
             result = {
@@ -539,7 +1206,7 @@ class BiasDetectionService:
             result["bias_score"] += interaction_analysis.get("bias_score", 0.0) * 0.4
 
             # Response time analysis
-            response_time_analysis = self._analyze_response_times(session_data)
+            response_time_analysis = self._analyze_response_times(session_data, context)
             result["metrics"]["response_times"] = response_time_analysis
             result["bias_score"] += response_time_analysis.get("bias_score", 0.0) * 0.3
 
@@ -574,8 +1241,11 @@ class BiasDetectionService:
                 "recommendations": [],
             }
 
-    async def _run_evaluation_analysis(self, session_data: SessionData) -> Dict[str, Any]:
+    async def _run_evaluation_analysis(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Run evaluation analysis using Hugging Face evaluate and custom metrics"""
+        context = self._analysis_context(session_data, context)
         try:
             result = {
                 "layer": "evaluation",
@@ -590,9 +1260,9 @@ class BiasDetectionService:
             result["metrics"]["outcome_fairness"] = outcome_analysis
             result["bias_score"] += outcome_analysis.get("bias_score", 0.0) * 0.4
 
-            # Hugging Face evaluate metrics
-            if HF_EVALUATE_AVAILABLE:
-                hf_analysis = await self._run_hf_evaluate_analysis(session_data)
+            # Toxicity classifier (deep tier only)
+            if HF_EVALUATE_AVAILABLE and context.analysis_mode == "deep":
+                hf_analysis = await self._run_hf_evaluate_analysis(session_data, context)
                 result["metrics"]["hf_evaluate"] = hf_analysis
                 result["bias_score"] += hf_analysis.get("bias_score", 0.0) * 0.3
 
@@ -629,14 +1299,16 @@ class BiasDetectionService:
 
     # Helper methods for specific toolkit integrations
 
-    async def _run_aif360_preprocessing(self, session_data: SessionData) -> Dict[str, Any]:
+    async def _run_aif360_preprocessing(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Run AIF360 preprocessing analysis"""
         try:
             if not AIF360_AVAILABLE:
                 return {"bias_score": 0.0, "error": "AIF360 not available"}
 
-            # Create synthetic dataset for analysis
-            data = self._create_synthetic_dataset(session_data)
+            # Synthetic dataset, shared with the other toolkit analyses
+            data = self._analysis_context(session_data, context).dataset
             if data is None:
                 return {
                     "bias_score": 0.0,
@@ -644,14 +1316,14 @@ class BiasDetectionService:
                 }
 
             # Create AIF360 dataset
-            dataset = BinaryLabelDataset(
+            dataset = AIF360.BinaryLabelDataset(
                 df=data["df"],
                 label_names=data["label_names"],
                 protected_attribute_names=data["protected_attributes"],
             )
 
             # Calculate bias metrics
-            metric = BinaryLabelDatasetMetric(
+            metric = AIF360.BinaryLabelDatasetMetric(
                 dataset,
                 unprivileged_groups=data["unprivileged_groups"],
                 privileged_groups=data["privileged_groups"],
@@ -677,14 +1349,16 @@ class BiasDetectionService:
             logger.error(f"AIF360 preprocessing analysis failed: {e}")
             return {"bias_score": 0.0, "error": str(e)}
 
-    async def _run_fairlearn_analysis(self, session_data: SessionData) -> Dict[str, Any]:
+    async def _run_fairlearn_analysis(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Run Fairlearn analysis"""
         try:
             if not FAIRLEARN_AVAILABLE:
                 return {"bias_score": 0.0, "error": "Fairlearn not available"}
 
-            # Create synthetic dataset for analysis
-            data = self._create_synthetic_dataset(session_data)
+            # Synthetic dataset, shared with the other toolkit analyses
+            data = self._analysis_context(session_data, context).dataset
             if data is None:
                 return {
                     "bias_score": 0.0,
@@ -698,10 +1372,10 @@ class BiasDetectionService:
             # Calculate fairness metrics
             y_pred = np.random.choice([0, 1], size=len(y))  # Placeholder predictions
 
-            dp_diff = demographic_parity_difference(
+            dp_diff = FAIRLEARN.demographic_parity_difference(
                 y, y_pred, sensitive_features=sensitive_features.iloc[:, 0]
             )
-            eo_diff = equalized_odds_difference(
+            eo_diff = FAIRLEARN.equalized_odds_difference(
                 y, y_pred, sensitive_features=sensitive_features.iloc[:, 0]
             )
 
@@ -726,158 +1400,117 @@ class BiasDetectionService:
 
             doc = self.nlp(text_content)
 
-            # Detect various types of bias
-            gender_bias = self._detect_gender_bias(doc)
-            racial_bias = self._detect_racial_bias(doc)
-            age_bias = self._detect_age_bias(doc)
-            cultural_bias = self._detect_cultural_bias(doc)
+            # One lexicon pass yields every category count and term hit
+            scan = BIAS_LEXICON.scan(doc)
+            return self._build_linguistic_bias(doc, self._lexical_scores([scan])[0].tolist(), scan)
 
-            # Sentiment analysis
-            sentiment = self._analyze_sentiment(text_content)
-
-            # Detect biased terms
-            biased_terms = self._detect_biased_terms(doc)
-
-            # Calculate overall bias score
-            bias_scores = [gender_bias, racial_bias, age_bias, cultural_bias]
-            overall_bias_score = np.mean(bias_scores)
-
-            return {
-                "overall_bias_score": overall_bias_score,
-                "gender_bias": gender_bias,
-                "racial_bias": racial_bias,
-                "age_bias": age_bias,
-                "cultural_bias": cultural_bias,
-                "sentiment": sentiment,
-                "biased_terms": biased_terms,
-                "text_length": len(text_content),
-                "word_count": len(doc),
-            }
+        except Exception as e:
+            logger.error(f"Linguistic bias detection failed: {e}")
+            return {"overall_bias_score": 0.0, "error": str(e)}
 
+    def _linguistic_bias_for(self, context: AnalysisContext) -> Optional[Dict[str, Any]]:
+        """Linguistic bias from a context's shared parse and sentiment"""
+        if not self.nlp or not NLP_AVAILABLE:
+            return None
+        try:
+            doc = context.doc
+            scan = BIAS_LEXICON.scan(doc)
+            return self._build_linguistic_bias(
+                doc, self._lexical_scores([scan])[0].tolist(), scan, context.sentiment
+            )
         except Exception as e:
             logger.error(f"Linguistic bias detection failed: {e}")
             return {"overall_bias_score": 0.0, "error": str(e)}
 
-    def _detect_gender_bias(self, doc) -> float:
-        """Detect gender bias in text"""
-        gender_terms = {
-            "male": [
-                "he",
-                "him",
-                "his",
-                "man",
-                "men",
-                "boy",
-                "boys",
-                "male",
-                "father",
-                "son",
-                "brother",
-            ],
-            "female": [
-                "she",
-                "her",
-                "hers",
-                "woman",
-                "women",
-                "girl",
-                "girls",
-                "female",
-                "mother",
-                "daughter",
-                "sister",
-            ],
-        }
+    def _detect_linguistic_bias_batch(self, docs: List[Any]) -> List[Dict[str, Any]]:
+        """Detect linguistic bias for a batch of parsed docs with vectorized scoring"""
+        scans = [BIAS_LEXICON.scan(doc) for doc in docs]
+        scores = self._lexical_scores(scans)
+        return [
+            self._build_linguistic_bias(doc, row.tolist(), scan)
+            for doc, row, scan in zip(docs, scores, scans)
+        ]
 
-        male_count = sum(token.text.lower() in gender_terms["male"] for token in doc)
-        female_count = sum(token.text.lower() in gender_terms["female"] for token in doc)
+    def _build_linguistic_bias(
+        self,
+        doc,
+        bias_scores: List[float],
+        scan: Optional[LexiconScan] = None,
+        sentiment: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Assemble the linguistic bias result for a parsed doc"""
+        gender_bias, racial_bias, age_bias, cultural_bias = bias_scores
+        text_content = doc.text
+
+        # Sentiment analysis
+        if sentiment is None:
+            sentiment = self._analyze_sentiment(text_content)
 
-        total_gender_terms = male_count + female_count
-        if total_gender_terms == 0:
-            return 0.0
+        # Detect biased terms
+        biased_terms = self._detect_biased_terms(doc, scan)
+
+        # Calculate overall bias score
+        overall_bias_score = np.mean(bias_scores)
+
+        return {
+            "overall_bias_score": overall_bias_score,
+            "gender_bias": gender_bias,
+            "racial_bias": racial_bias,
+            "age_bias": age_bias,
+            "cultural_bias": cultural_bias,
+            "sentiment": sentiment,
+            "biased_terms": biased_terms,
+            "text_length": len(text_content),
+            "word_count": len(doc),
+        }
 
-        # Calculate imbalance
-        imbalance = abs(male_count - female_count) / total_gender_terms
-        return min(imbalance, 1.0)
+    def _count_lexical_terms(self, doc) -> List[int]:
+        """Count lexical category hits in one pass, ordered as LEXICAL_COUNT_COLUMNS"""
+        scan = BIAS_LEXICON.scan(doc)
+        return [scan.counts[column] for column in LEXICAL_COUNT_COLUMNS]
+
+    def _lexical_scores(self, scans: List[LexiconScan]) -> np.ndarray:
+        """Score a list of lexicon scans as an (n, 4) array"""
+        counts = np.array(
+            [[scan.counts[column] for column in LEXICAL_COUNT_COLUMNS] for scan in scans],
+            dtype=float,
+        ).reshape(len(scans), len(LEXICAL_COUNT_COLUMNS))
+        totals = np.array([scan.token_count for scan in scans], dtype=float)
+        return self._score_lexical_counts(counts, totals)
+
+    def _score_lexical_counts(self, counts: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        """Turn (n, 5) lexical counts into (n, 4) gender/racial/age/cultural scores
+
+        Matches _detect_gender_bias, _detect_racial_bias, _detect_age_bias and
+        _detect_cultural_bias applied to each row.
+        """
+        male, female, racial, age, cultural = counts.T
+        gendered = male + female
+        safe_gendered = np.where(gendered > 0, gendered, 1.0)
+        safe_totals = np.where(totals > 0, totals, 1.0)
+        has_tokens = totals > 0
+
+        gender = np.where(gendered > 0, np.abs(male - female) / safe_gendered, 0.0)
+        racial_score = np.where(has_tokens, racial / safe_totals * 10, 0.0)
+        age_score = np.where(has_tokens, age / safe_totals * 15, 0.0)
+        cultural_score = np.where(has_tokens, cultural / safe_totals * 12, 0.0)
+        return np.minimum(np.column_stack([gender, racial_score, age_score, cultural_score]), 1.0)
+
+    def _detect_gender_bias(self, doc) -> float:
+        """Detect gender bias in text"""
+        return float(self._lexical_scores([BIAS_LEXICON.scan(doc)])[0][0])
 
     def _detect_racial_bias(self, doc) -> float:
         """Detect racial bias in text"""
-        # Simplified racial bias detection based on potentially biased terms
-        biased_terms = [
-            "race",
-            "racial",
-            "ethnic",
-            "ethnicity",
-            "minority",
-            "majority",
-            "black",
-            "white",
-            "asian",
-            "hispanic",
-            "latino",
-            "native",
-        ]
-
-        bias_count = sum(token.text.lower() in biased_terms for token in doc)
-        total_tokens = len(doc)
-
-        if total_tokens == 0:
-            return 0.0
-
-        bias_ratio = bias_count / total_tokens
-        return min(bias_ratio * 10, 1.0)  # Scale up for detection
+        return float(self._lexical_scores([BIAS_LEXICON.scan(doc)])[0][1])
 
     def _detect_age_bias(self, doc) -> float:
         """Detect age bias in text"""
-        age_terms = [
-            "young",
-            "old",
-            "elderly",
-            "senior",
-            "youth",
-            "teenager",
-            "adult",
-            "child",
-            "children",
-            "baby",
-            "infant",
-            "toddler",
-            "adolescent",
-        ]
-        age_count = sum(token.text.lower() in age_terms for token in doc)
-        total_tokens = len(doc)
-
-        if total_tokens == 0:
-            return 0.0
-
-        age_ratio = age_count / total_tokens
-        return min(age_ratio * 15, 1.0)  # Scale up for detection
+        return float(self._lexical_scores([BIAS_LEXICON.scan(doc)])[0][2])
 
     def _detect_cultural_bias(self, doc) -> float:
         """Detect cultural bias in text"""
-        cultural_terms = [
-            "culture",
-            "cultural",
-            "religion",
-            "religious",
-            "tradition",
-            "traditional",
-            "foreign",
-            "immigrant",
-            "native",
-            "indigenous",
-            "western",
-            "eastern",
-        ]
-
-        cultural_count = sum(token.text.lower() in cultural_terms for token in doc)
-        total_tokens = len(doc)
-
-        if total_tokens == 0:
-            return 0.0
-
-        cultural_ratio = cultural_count / total_tokens
-        return min(cultural_ratio * 12, 1.0)  # Scale up for detection
+        return float(self._lexical_scores([BIAS_LEXICON.scan(doc)])[0][3])
 
     def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of text"""
@@ -898,7 +1531,7 @@ class BiasDetectionService:
     # TODO Rename this here and in `_analyze_sentiment`
     def _extracted_from__analyze_sentiment_(self, text):
         # Fallback to TextBlob
-        blob = TextBlob(text)
+        blob = NLP.TextBlob(text)
         sentiment_obj = getattr(blob, "sentiment", None)
         if not sentiment_obj:
             return {"polarity": 0.0, "subjectivity": 0.0}
@@ -906,32 +1539,34 @@ class BiasDetectionService:
         subjectivity = getattr(sentiment_obj, "subjectivity", 0.0)
         return {"polarity": float(polarity), "subjectivity": float(subjectivity)}
 
-    def _detect_biased_terms(self, doc) -> List[Dict[str, Any]]:
-        """Detect potentially biased terms in text"""
-        biased_terms_dict = {
-            "gender": ["mankind", "manpower", "chairman", "policeman", "fireman"],
-            "racial": ["exotic", "articulate", "urban", "ghetto", "primitive"],
-            "age": ["over the hill", "senior moment", "young blood", "old-fashioned"],
-            "ability": ["crazy", "insane", "lame", "blind to", "deaf to"],
-        }
+    def _detect_biased_terms(self, doc, scan: Optional[LexiconScan] = None) -> List[Dict[str, Any]]:
+        """Detect potentially biased terms, including multi-word phrases, in text"""
+        scan = scan or BIAS_LEXICON.scan(doc)
+
+        return [
+            {
+                "term": self._span_text(doc, hit.start, hit.end),
+                "category": hit.category[len(BIASED_TERM_PREFIX) :],
+                "position": doc[hit.start].idx,
+                "context": self._extract_context_span(doc, hit.start, hit.end),
+                "suggestion": self._suggest_alternative(hit.term),
+            }
+            for hit in scan.hits
+            if hit.category.startswith(BIASED_TERM_PREFIX)
+        ]
 
-        detected_terms = []
-        for token in doc:
-            detected_terms.extend(
-                [
-                    {
-                        "term": token.text,
-                        "category": category,
-                        "position": token.idx,
-                        "context": self._extract_context(doc, token.text),
-                        "suggestion": self._suggest_alternative(token.text.lower()),
-                    }
-                    for category, terms in biased_terms_dict.items()
-                    if token.text.lower() in terms
-                ]
-            )
+    def _span_text(self, doc, start: int, end: int) -> str:
+        """Original text of tokens [start, end)"""
+        if end - start == 1:
+            return doc[start].text
+        first, last = doc[start], doc[end - 1]
+        return doc.text[first.idx : last.idx + len(last.text)]
 
-        return detected_terms
+    def _extract_context_span(self, doc, start: int, end: int, window: int = 10) -> str:
+        """Extract context around the tokens [start, end)"""
+        lo = max(0, start - window)
+        hi = min(len(doc), end + window)
+        return " ".join(doc[i].text for i in range(lo, hi))
 
     def _extract_context(self, doc, term: str, window: int = 10) -> str:
         """Extract context around a term"""
@@ -1050,7 +1685,10 @@ class BiasDetectionService:
 
             df = pd.DataFrame(data)
 
-            # Encode categorical variables
+            # Encode categorical variables (sklearn is only needed by the
+            # fairness toolkits' layers, so it is not imported at startup)
+            from sklearn.preprocessing import LabelEncoder
+
             le_gender = LabelEncoder()
             le_ethnicity = LabelEncoder()
 
@@ -1098,19 +1736,19 @@ class BiasDetectionService:
             logger.error(f"Interpretability analysis failed: {e}")
             return {"bias_score": 0.0, "error": str(e)}
 
-    def _analyze_response_consistency(self, session_data: SessionData) -> Dict[str, Any]:
+    def _analyze_response_consistency(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Analyze consistency of AI responses across demographics"""
         try:
-            responses = session_data.ai_responses or []
-            if not responses:
+            stats = self._analysis_context(session_data, context).response_stats
+            total_responses = stats.count
+            if not total_responses:
                 return {"bias_score": 0.0, "error": "No responses to analyze"}
 
             # Calculate response consistency metrics
-            response_lengths = [len(r.get("content", "")) for r in responses]
-            response_times = [r.get("response_time", 0) for r in responses]
-
-            length_variance = np.var(response_lengths) if response_lengths else 0
-            time_variance = np.var(response_times) if response_times else 0
+            length_variance = stats.lengths.variance
+            time_variance = stats.times.variance
 
             # Higher variance indicates potential bias
             bias_score = float(min(float(length_variance + time_variance) / 1000, 1.0))
@@ -1119,7 +1757,7 @@ class BiasDetectionService:
                 "bias_score": bias_score,
                 "response_length_variance": length_variance,
                 "response_time_variance": time_variance,
-                "total_responses": len(responses),
+                "total_responses": total_responses,
             }
 
         except Exception as e:
@@ -1138,17 +1776,17 @@ class BiasDetectionService:
         except Exception as e:
             return {"bias_score": 0.0, "error": str(e)}
 
-    def _analyze_response_times(self, session_data: SessionData) -> Dict[str, Any]:
+    def _analyze_response_times(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
         """Analyze response time patterns for bias"""
         try:
-            responses = session_data.ai_responses or []
-            response_times = [r.get("response_time", 0) for r in responses]
-
-            if not response_times:
+            stats = self._analysis_context(session_data, context).response_stats
+            if not stats.count:
                 return {"bias_score": 0.0, "error": "No response times available"}
 
-            mean_time = np.mean(response_times)
-            std_time = np.std(response_times)
+            mean_time = stats.times.mean
+            std_time = stats.times.std
 
             # High variance in response times might indicate bias
             bias_score = float(min(float(std_time) / (float(mean_time) + 1), 1.0))
@@ -1192,20 +1830,29 @@ class BiasDetectionService:
         except Exception as e:
             return {"bias_score": 0.0, "error": str(e)}
 
-    async def _run_hf_evaluate_analysis(self, session_data: SessionData) -> Dict[str, Any]:
-        """Run Hugging Face evaluate analysis"""
+    async def _run_hf_evaluate_analysis(
+        self, session_data: SessionData, context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
+        """Score session text with toxic-bert through the micro-batcher"""
+        context = self._analysis_context(session_data, context)
         try:
             if not HF_EVALUATE_AVAILABLE:
                 return {"bias_score": 0.0, "error": "HF evaluate not available"}
+            if self.toxicity_batcher is None:
+                return {"bias_score": 0.0, "error": "Toxicity classifier not loaded"}
 
-            # Placeholder for HF evaluate analysis
+            windows = chunk_windows(
+                context.text,
+                getattr(self.bias_classifier, "tokenizer", None),
+                self.config.toxicity_window_tokens,
+            )
+            toxicity = aggregate_scores(await self.toxicity_batcher.score(windows))
+            worst = toxicity["max"]
             return {
-                "bias_score": np.random.uniform(0, 0.3),
-                "toxicity_score": np.random.uniform(0, 0.2),
-                "fairness_metrics": {
-                    "regard": np.random.uniform(0.7, 1.0),
-                    "honest": np.random.uniform(0.7, 1.0),
-                },
+                # Identity-directed hate is the bias signal; general toxicity is reported
+                "bias_score": worst.get("identity_hate", 0.0),
+                "toxicity_score": worst.get("toxic", 0.0),
+                "labels": toxicity,
             }
         except Exception as e:
             return {"bias_score": 0.0, "error": str(e)}
@@ -1260,7 +1907,10 @@ class BiasDetectionService:
             "evaluation": 0.25,
         }
 
+        # Layers abandoned at their deadline have no score; renormalize over the rest
         for result in layer_results:
+            if result.get("timed_out"):
+                continue
             layer = result.get("layer", "")
             bias_score = result.get("bias_score", 0.0)
             weight = layer_weights.get(layer, 0.25)
@@ -1276,7 +1926,9 @@ class BiasDetectionService:
         data_quality_scores = []
 
         for result in layer_results:
-            if "error" not in result:
+            if result.get("timed_out"):
+                data_quality_scores.append(0.0)  # No evidence from an abandoned layer
+            elif "error" not in result:
                 data_quality_scores.append(0.8)  # Good quality if no errors
             else:
                 data_quality_scores.append(0.2)  # Low quality if errors
@@ -1333,8 +1985,43 @@ class BiasDetectionService:
 
 
 # Initialize service
-config = BiasDetectionConfig()
+config = BiasDetectionConfig(
+    layer_execution=os.environ.get("BIAS_LAYER_EXECUTION", "inline"),
+    layer_executor_workers=int(os.environ["BIAS_LAYER_WORKERS"])
+    if os.environ.get("BIAS_LAYER_WORKERS")
+    else None,
+    enable_result_cache=os.environ.get("BIAS_RESULT_CACHE", "true").lower() != "false",
+    enable_analysis_profiling=os.environ.get("BIAS_ANALYSIS_PROFILING", "false").lower() == "true",
+    audit_buffered=os.environ.get("BIAS_AUDIT_BUFFERED", "true").lower() != "false",
+    audit_store_dir=os.environ.get("BIAS_AUDIT_DIR") or None,
+    result_cache_dir=os.environ.get("BIAS_RESULT_CACHE_DIR") or None,
+    dashboard_rollup_path=os.environ.get("BIAS_DASHBOARD_ROLLUPS") or None,
+    result_store_dir=os.environ.get("BIAS_RESULT_STORE_DIR") or None,
+    rate_limit_per_minute=int(os.environ.get("BIAS_RATE_LIMIT_PER_MINUTE", "60")),
+    rate_limit_path=os.environ.get("BIAS_RATE_LIMIT_PATH") or None,
+    inference_backend=os.environ.get("BIAS_INFERENCE_BACKEND", "pytorch"),
+    onnx_model_path=os.environ.get("BIAS_ONNX_MODEL_PATH") or None,
+    resource_dir=os.environ.get("BIAS_RESOURCE_DIR") or None,
+    allow_resource_downloads=os.environ.get("BIAS_ALLOW_RESOURCE_DOWNLOADS", "false").lower()
+    == "true",
+    warmup_on_start=os.environ.get("BIAS_WARMUP", "true").lower() != "false",
+)
 bias_service = BiasDetectionService(config)
+# Warm up in the background so /health answers at once; /ready waits for it
+if config.warmup_on_start:
+    bias_service.readiness.start(bias_service.warmup_steps())
+else:
+    bias_service.readiness.mark_ready()
+# Werkzeug rejects larger bodies from Content-Length or while streaming them
+app.config["MAX_CONTENT_LENGTH"] = config.max_session_size_mb * 1024 * 1024
+
+
+def check_rate_limit(user_id: str) -> int:
+    """Charge one request to a user's bucket; seconds to wait if over the limit, else 0"""
+    if not bias_service.rate_limiter:
+        return 0
+    allowed, retry_after = bias_service.rate_limiter.acquire(user_id)
+    return 0 if allowed else retry_after_seconds(retry_after)
 
 
 # Authentication decorator
@@ -1355,32 +2042,241 @@ def require_auth(f):
         except Exception as e:
             return jsonify({"error": str(e)}), 401
 
+        retry_after = check_rate_limit(g.user_id)
+        if retry_after:
+            response = jsonify({"error": "Rate limit exceeded", "retry_after": retry_after})
+            response.headers["Retry-After"] = str(retry_after)
+            return response, 429
+
         return f(*args, **kwargs)
 
     return decorated_function
 
 
+# Request helpers shared by the Flask routes and the ASGI app (asgi_app.py)
+
+REQUIRED_SESSION_FIELDS = ("session_id", "participant_demographics", "content")
+EXPORT_FIELDS = ["session_id", "bias_score", "alert_level", "timestamp"]
+
+# Demographic dimensions whose dashboard key differs from the session field
+DASHBOARD_DIMENSION_NAMES = {"age": "age_group", "age_range": "age_group"}
+
+
+def max_body_bytes(batch: bool = False) -> int:
+    """Request body limit in bytes for single-session or batch routes"""
+    return (config.max_batch_size_mb if batch else config.max_session_size_mb) * 1024 * 1024
+
+
+def read_request_json(required: Tuple[str, ...] = (), batch: bool = False) -> Dict[str, Any]:
+    """Read and decode the Flask request body within its size limit
+
+    Raises PayloadError (400) or PayloadTooLarge (413).
+    """
+    max_bytes = max_body_bytes(batch)
+    request.max_content_length = max_bytes
+    check_content_length(request.headers.get("Content-Length"), max_bytes)
+    try:
+        body = request.get_data(cache=False)
+    except RequestEntityTooLarge:
+        raise PayloadTooLarge(max_bytes) from None
+    return decode_json(body, required)
+
+
+def build_session_data(data: Dict[str, Any]) -> SessionData:
+    """Validate a request payload and build SessionData from it"""
+    for field in REQUIRED_SESSION_FIELDS:
+        if field not in data:
+            raise BadRequest(f"Missing required field: {field}")
+
+    return SessionData(
+        session_id=data["session_id"],
+        participant_demographics=data["participant_demographics"],
+        training_scenario=data.get("training_scenario", {}),
+        content=data["content"],
+        ai_responses=data.get("ai_responses", []),
+        expected_outcomes=data.get("expected_outcomes", []),
+        transcripts=data.get("transcripts", []),
+        metadata=data.get("metadata", {}),
+    )
+
+
+def build_analysis_mode(data: Dict[str, Any]) -> str:
+    """Validate the requested analysis tier"""
+    try:
+        return parse_analysis_mode(data.get("analysis_mode"))
+    except ValueError as e:
+        raise BadRequest(str(e)) from e
+
+
+def build_deadline_ms(data: Dict[str, Any]) -> Optional[float]:
+    """Validate an optional per-request deadline in milliseconds"""
+    deadline_ms = data.get("deadline_ms")
+    if deadline_ms is None:
+        return None
+    if isinstance(deadline_ms, bool) or not isinstance(deadline_ms, (int, float)) or deadline_ms <= 0:
+        raise BadRequest("Field 'deadline_ms' must be a positive number")
+    return float(deadline_ms)
+
+
+def build_batch_sessions(data: Dict[str, Any]) -> List[SessionData]:
+    """Validate a batch request payload and build SessionData for each entry"""
+    sessions = data.get("sessions")
+    if not isinstance(sessions, list) or not sessions:
+        raise BadRequest("Field 'sessions' must be a non-empty list")
+
+    batch = []
+    for index, item in enumerate(sessions):
+        try:
+            batch.append(build_session_data(item))
+        except BadRequest as e:
+            raise BadRequest(f"sessions[{index}]: {e.description}") from e
+    return batch
+
+
+def build_append_delta(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate an incremental append payload"""
+    if "session_id" not in data:
+        raise BadRequest("Missing required field: session_id")
+    for field in ("ai_responses", "transcripts", "expected_outcomes"):
+        if not isinstance(data.get(field, []), list):
+            raise BadRequest(f"Field '{field}' must be a list")
+    if not isinstance(data.get("content", {}), dict):
+        raise BadRequest("Field 'content' must be an object")
+    return data
+
+
+def to_ndjson_line(result: Dict[str, Any]) -> str:
+    """Encode one result as a newline-delimited JSON record"""
+    return dumps(result).decode() + "\n"
+
+
+def json_response(payload: Dict[str, Any], status: int = 200) -> Response:
+    """Flask JSON response encoded numpy-natively, compressed if accepted"""
+    body, headers = encode_json_response(
+        payload, request.headers.get("Accept-Encoding"), config.response_compression_min_bytes
+    )
+    return Response(body, status=status, headers=headers)
+
+
+def iter_ndjson(results: AsyncIterator[Dict[str, Any]]) -> Iterator[str]:
+    """Drive an async result iterator from sync code, yielding NDJSON lines"""
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                result = loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+            yield to_ndjson_line(result)
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.close()
+
+
+def build_health_data() -> Dict[str, Any]:
+    """Health check payload"""
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "version": "1.0.0",
+        "components": {
+            "aif360": AIF360_AVAILABLE,
+            "fairlearn": FAIRLEARN_AVAILABLE,
+            "hf_evaluate": HF_EVALUATE_AVAILABLE,
+            "nlp": NLP_AVAILABLE,
+            "interpretability": INTERPRETABILITY_AVAILABLE,
+            "visualization": VISUALIZATION_AVAILABLE,
+        },
+        "inference_backend": bias_service.config.inference_backend,
+        "ready": bias_service.readiness.ready,
+        # Per worker; compare PSS across workers to see copy-on-write sharing
+        "worker": {"pid": os.getpid(), "memory": memory_usage()},
+        "result_cache": bias_service.result_cache.stats() if bias_service.result_cache else None,
+    }
+
+
+def build_readiness_data() -> Tuple[Dict[str, Any], int]:
+    """Readiness payload and status: 200 once warm-up finished, 503 before"""
+    status = bias_service.readiness.status()
+    return status, 200 if status["ready"] else 503
+
+
+def build_dashboard_data(time_range: str = "24h", demographic: str = "all") -> Dict[str, Any]:
+    """Dashboard payload for bias monitoring, aggregated from the rollups"""
+    try:
+        rollup = bias_service.rollups.query(time_range, demographic)
+    except ValueError as e:
+        raise BadRequest(str(e)) from e
+
+    alerts = rollup["alert_levels"]
+    series = rollup["series"]
+    return {
+        "summary": {
+            "total_sessions_analyzed": rollup["total_sessions"],
+            "average_bias_score": rollup["average_bias_score"],
+            "high_risk_sessions": alerts["high"] + alerts["critical"],
+            "critical_alerts": alerts["critical"],
+            "alert_distribution": alerts,
+            "bias_score_percentiles": rollup["percentiles"],
+        },
+        # One entry per bucket_seconds bucket; the key name predates the rollups
+        "trends": {
+            "daily_bias_scores": series["average_bias_scores"],
+            "alert_counts": series["alert_counts"],
+            "session_counts": series["session_counts"],
+            "timestamps": series["timestamps"],
+            "bucket_seconds": rollup["bucket_seconds"],
+        },
+        "demographics": {
+            f"bias_by_{DASHBOARD_DIMENSION_NAMES.get(dimension, dimension)}": {
+                group: stats["average_bias_score"] for group, stats in groups.items()
+            }
+            for dimension, groups in rollup["demographics"].items()
+        },
+        "filters": {"timeRange": time_range, "demographic": demographic},
+    }
+
+
+def build_export_stream(
+    export_format: str, date_range: Optional[Dict[str, Any]]
+) -> Tuple[Iterator[bytes], str, Dict[str, str]]:
+    """Chunked export body, mimetype and headers for stored analysis results
+
+    Rows are read from the result store lazily, so the body is produced as the
+    response is sent. Raises BadRequest for an unknown format or bad range.
+    """
+    try:
+        rows = bias_service.iter_results(date_range)
+        chunks = iter_export(export_format, rows, EXPORT_FIELDS, config.export_chunk_rows)
+    except ValueError as e:
+        raise BadRequest(str(e)) from e
+
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    headers = {}
+    if export_format != "json":
+        headers["Content-Disposition"] = (
+            f"attachment; filename=bias_analysis_export.{extension}"
+        )
+    return chunks, mimetype, headers
+
+
 # Flask routes
 
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
-    return jsonify(
-        {
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "version": "1.0.0",
-            "components": {
-                "aif360": AIF360_AVAILABLE,
-                "fairlearn": FAIRLEARN_AVAILABLE,
-                "hf_evaluate": HF_EVALUATE_AVAILABLE,
-                "nlp": NLP_AVAILABLE,
-                "interpretability": INTERPRETABILITY_AVAILABLE,
-                "visualization": VISUALIZATION_AVAILABLE,
-            },
-        }
-    )
+    return jsonify(build_health_data())
+
+
+@app.route("/ready", methods=["GET"])
+def readiness_check():
+    """Readiness endpoint: 503 until the worker has warmed up"""
+    data, status = build_readiness_data()
+    response = jsonify(data)
+    if status == 503:
+        response.headers["Retry-After"] = "1"
+    return response, status
 
 
 @app.route("/analyze", methods=["POST"])
@@ -1392,40 +2288,108 @@ def analyze_session():
         if os.environ.get("ENV") != "production" and not hasattr(g, "user_id"):
             g.user_id = "development-user"
 
-        data = request.get_json()
+        try:
+            data = read_request_json(REQUIRED_SESSION_FIELDS)
+        except PayloadError as e:
+            return jsonify({"error": str(e)}), e.status_code
         if not data:
             return jsonify({"error": "No data provided"}), 400
 
-        # Validate required fields
-        required_fields = ["session_id", "participant_demographics", "content"]
-        for field in required_fields:
-            if field not in data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
-
-        # Create SessionData object
-        session_data = SessionData(
-            session_id=data["session_id"],
-            participant_demographics=data["participant_demographics"],
-            training_scenario=data.get("training_scenario", {}),
-            content=data["content"],
-            ai_responses=data.get("ai_responses", []),
-            expected_outcomes=data.get("expected_outcomes", []),
-            transcripts=data.get("transcripts", []),
-            metadata=data.get("metadata", {}),
-        )
+        # Validate required fields and create SessionData object
+        try:
+            session_data = build_session_data(data)
+            analysis_mode = build_analysis_mode(data)
+            deadline_ms = build_deadline_ms(data)
+        except BadRequest as e:
+            return jsonify({"error": e.description}), 400
 
         # Run analysis
         result = asyncio.run(
-            bias_service.analyze_session(session_data, getattr(g, "user_id", "unknown"))
+            bias_service.analyze_session(
+                session_data,
+                getattr(g, "user_id", "unknown"),
+                analysis_mode=analysis_mode,
+                deadline_ms=deadline_ms,
+            )
         )
 
-        return jsonify(result)
+        return json_response(result)
 
     except Exception as e:
         logger.error(f"Analysis endpoint error: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/analyze/append", methods=["POST"])
+@require_auth if os.environ.get("ENV") == "production" else (lambda f: f)
+def analyze_append():
+    """Append new turns to a live session and return its updated analysis"""
+    try:
+        # Set default user_id only in development
+        if os.environ.get("ENV") != "production" and not hasattr(g, "user_id"):
+            g.user_id = "development-user"
+
+        try:
+            data = read_request_json(("session_id",))
+        except PayloadError as e:
+            return jsonify({"error": str(e)}), e.status_code
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            delta = build_append_delta(data)
+        except BadRequest as e:
+            return jsonify({"error": e.description}), 400
+
+        try:
+            result = asyncio.run(
+                bias_service.append_to_session(delta, getattr(g, "user_id", "unknown"))
+            )
+        except IncrementalSessionNotFound as e:
+            return jsonify({"error": str(e)}), 404
+
+        return json_response(result)
+
+    except Exception as e:
+        logger.error(f"Incremental analysis endpoint error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/analyze/batch", methods=["POST"])
+@require_auth if os.environ.get("ENV") == "production" else (lambda f: f)
+def analyze_batch():
+    """Analyze many sessions, streaming results back as NDJSON"""
+    try:
+        # Set default user_id only in development
+        if os.environ.get("ENV") != "production" and not hasattr(g, "user_id"):
+            g.user_id = "development-user"
+
+        try:
+            data = read_request_json(("sessions",), batch=True)
+        except PayloadError as e:
+            return jsonify({"error": str(e)}), e.status_code
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            sessions = build_batch_sessions(data)
+            analysis_mode = build_analysis_mode(data)
+        except BadRequest as e:
+            return jsonify({"error": e.description}), 400
+
+        results = bias_service.analyze_sessions(
+            sessions, getattr(g, "user_id", "unknown"), analysis_mode
+        )
+        return Response(
+            stream_with_context(iter_ndjson(results)),
+            mimetype="application/x-ndjson",
+        )
+
+    except Exception as e:
+        logger.error(f"Batch analysis endpoint error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/dashboard", methods=["GET"])
 @require_auth if os.environ.get("ENV") == "production" else (lambda f: f)
 def get_dashboard_data():
@@ -1435,31 +2399,14 @@ def get_dashboard_data():
         if os.environ.get("ENV") != "production" and not hasattr(g, "user_id"):
             g.user_id = "development-user"
 
-        # Placeholder dashboard data
-        dashboard_data = {
-            "summary": {
-                "total_sessions_analyzed": 1250,
-                "average_bias_score": 0.23,
-                "high_risk_sessions": 45,
-                "critical_alerts": 3,
-            },
-            "trends": {
-                "daily_bias_scores": [0.2, 0.25, 0.18, 0.3, 0.22, 0.19, 0.24],
-                "alert_counts": [2, 3, 1, 5, 2, 1, 3],
-            },
-            "demographics": {
-                "bias_by_age_group": {
-                    "18-25": 0.18,
-                    "26-35": 0.22,
-                    "36-45": 0.25,
-                    "46-55": 0.28,
-                    "55+": 0.31,
-                },
-                "bias_by_gender": {"male": 0.21, "female": 0.24, "other": 0.19},
-            },
-        }
+        return json_response(
+            build_dashboard_data(
+                request.args.get("timeRange", "24h"), request.args.get("demographic", "all")
+            )
+        )
 
-        return jsonify(dashboard_data)
+    except BadRequest as e:
+        return jsonify({"error": e.description}), 400
 
     except Exception as e:
         logger.error(f"Dashboard endpoint error: {e}")
@@ -1475,48 +2422,17 @@ def export_data():
         if os.environ.get("ENV") != "production" and not hasattr(g, "user_id"):
             g.user_id = "development-user"
 
-        data = request.get_json()
-        export_format = data.get("format", "json")
-        date_range = data.get("date_range", {})
-
-        # Placeholder export data
-        export_data = {
-            "sessions": [
-                {
-                    "session_id": "session_001",
-                    "bias_score": 0.25,
-                    "alert_level": "warning",
-                    "timestamp": "2024-01-01T10:00:00Z",
-                }
-            ],
-            "metadata": {
-                "export_timestamp": datetime.now().isoformat(),
-                "format": export_format,
-                "total_records": 1,
-            },
-        }
-
-        if export_format == "csv":
-            # Convert to CSV format
-            import csv
-            import io
-
-            output = io.StringIO()
-            writer = csv.DictWriter(
-                output,
-                fieldnames=["session_id", "bias_score", "alert_level", "timestamp"],
-            )
-            writer.writeheader()
-            writer.writerows(export_data["sessions"])
-
-            return Response(
-                output.getvalue(),
-                mimetype="text/csv",
-                headers={"Content-Disposition": "attachment; filename=bias_analysis_export.csv"},
-            )
-
-        return jsonify(export_data)
+        try:
+            data = read_request_json()
+        except PayloadError as e:
+            return jsonify({"error": str(e)}), e.status_code
+        chunks, mimetype, headers = build_export_stream(
+            data.get("format", "json"), data.get("date_range", {})
+        )
+        return Response(chunks, mimetype=mimetype, headers=headers)
 
+    except BadRequest as e:
+        return jsonify({"error": e.description}), 400
     except Exception as e:
         logger.error(f"Export endpoint error: {e}")
         return jsonify({"error": str(e)}), 500
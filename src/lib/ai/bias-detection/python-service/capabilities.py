@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+capabilities.py
+Lazy registry of the optional analysis toolkits
+
+Importing aif360, fairlearn, transformers, spaCy, NLTK, SHAP/LIME and the
+plotting libraries used to add seconds to every worker start. Availability is
+now probed with ``importlib.util.find_spec``, which locates a package without
+executing it, and each toolkit symbol is imported the first time a layer
+touches it:
+
+    AIF360 = toolkit("aif360")
+    if AIF360.available:
+        dataset = AIF360.BinaryLabelDataset(...)  # aif360.datasets imported here
+
+Imported symbols are cached on the toolkit, so later lookups are plain
+attribute reads. With preloading (see preload.py) whatever the master
+imported is inherited by the workers.
+"""
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Dict, List
+
+# Capability -> attribute -> "module" or "module:member"
+TOOLKITS: Dict[str, Dict[str, str]] = {
+    "aif360": {
+        "BinaryLabelDataset": "aif360.datasets:BinaryLabelDataset",
+        "BinaryLabelDatasetMetric": "aif360.metrics:BinaryLabelDatasetMetric",
+    },
+    "fairlearn": {
+        "demographic_parity_difference": "fairlearn.metrics:demographic_parity_difference",
+        "equalized_odds_difference": "fairlearn.metrics:equalized_odds_difference",
+    },
+    "hf_evaluate": {
+        "evaluate": "evaluate",
+        "transformers": "transformers",
+    },
+    "nlp": {
+        "spacy": "spacy",
+        "nltk": "nltk",
+        "SentimentIntensityAnalyzer": "nltk.sentiment:SentimentIntensityAnalyzer",
+        "TextBlob": "textblob:TextBlob",
+    },
+    "interpretability": {
+        "lime": "lime",
+        "shap": "shap",
+        "LimeTextExplainer": "lime.lime_text:LimeTextExplainer",
+    },
+    "visualization": {
+        "matplotlib": "matplotlib",
+        "plotly": "plotly",
+        "seaborn": "seaborn",
+    },
+}
+
+
+def package_available(package: str) -> bool:
+    """Whether a top-level package is installed, without importing it"""
+    if package in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class Toolkit:
+    """Optional toolkit whose symbols are imported on first attribute access"""
+
+    def __init__(self, name: str, symbols: Dict[str, str]):
+        self.name = name
+        self.symbols = symbols
+        self.packages = sorted({target.split(":")[0].split(".")[0] for target in symbols.values()})
+        self.missing = [package for package in self.packages if not package_available(package)]
+        self.available = not self.missing
+
+    @property
+    def loaded(self) -> List[str]:
+        """Symbols imported so far"""
+        return [name for name in self.symbols if name in self.__dict__]
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for symbols not imported yet; instance attributes and
+        # cached symbols are found in __dict__ first
+        symbols = self.__dict__.get("symbols", {})
+        if attr not in symbols:
+            raise AttributeError(f"Toolkit {self.__dict__.get('name')!r} has no symbol {attr!r}")
+        if not self.available:
+            raise ImportError(f"{self.name} not available: missing {', '.join(self.missing)}")
+
+        module_name, _, member = symbols[attr].partition(":")
+        value = importlib.import_module(module_name)
+        if member:
+            value = getattr(value, member)
+        self.__dict__[attr] = value
+        return value
+
+    def __repr__(self) -> str:
+        state = "available" if self.available else f"missing {', '.join(self.missing)}"
+        return f"<Toolkit {self.name}: {state}>"
+
+
+_REGISTRY: Dict[str, Toolkit] = {}
+
+
+def toolkit(name: str) -> Toolkit:
+    """Registered toolkit by capability name (probed once per process)"""
+    if name not in _REGISTRY:
+        _REGISTRY[name] = Toolkit(name, TOOLKITS[name])
+    return _REGISTRY[name]
+
+
+def capabilities() -> Dict[str, bool]:
+    """Availability of every registered toolkit"""
+    return {name: toolkit(name).available for name in TOOLKITS}
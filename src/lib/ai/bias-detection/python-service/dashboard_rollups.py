@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+dashboard_rollups.py
+Time-bucketed dashboard aggregates updated on every completed analysis
+
+Each completed analysis adds O(1) work to fixed-width ring buckets held in
+numpy arrays: session count, score sum, alert-level counts, a score histogram
+(for percentiles) and per-demographic weights/score sums. A dashboard query
+sums the buckets in the requested window, so it costs O(buckets) however many
+analyses ran.
+
+With a ``path`` each process accumulates a local delta and periodically
+merges it into a shared ``.npz`` file under an exclusive lock, so all gunicorn
+workers see the same totals (within ``flush_interval_seconds``).
+"""
+
+import atexit
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process persistence only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+ALERT_LEVELS = ("low", "warning", "high", "critical")
+SCORE_BINS = 20
+
+# (bucket width in seconds, number of ring slots): 5 minutes for 2 days,
+# 1 hour for 90 days
+RESOLUTIONS: Tuple[Tuple[int, int], ...] = ((300, 576), (3600, 2160))
+
+_TIME_RANGE_RE = re.compile(r"^(\d+)([mhd])$")
+_TIME_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+
+def parse_time_range(time_range: str) -> int:
+    """Convert a range like "15m", "24h" or "7d" to seconds"""
+    match = _TIME_RANGE_RE.match(time_range or "")
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid timeRange: {time_range!r} (expected e.g. 1h, 24h, 7d)")
+    seconds = int(match.group(1)) * _TIME_UNITS[match.group(2)]
+    longest = RESOLUTIONS[-1][0] * RESOLUTIONS[-1][1]
+    if seconds > longest:
+        raise ValueError(f"timeRange {time_range!r} exceeds the {longest // 86400}d retention")
+    return seconds
+
+
+def demographic_shares(demographics: Dict[str, Any]) -> Iterable[Tuple[str, float]]:
+    """Yield ("dimension:group", share) pairs for a session's demographics
+
+    Accepts distributions ({"gender_distribution": {"male": 40, ...}}) and
+    single values ({"gender": "female"}).
+    """
+    for key, value in (demographics or {}).items():
+        dimension = key[: -len("_distribution")] if key.endswith("_distribution") else key
+        if isinstance(value, dict):
+            numeric = {g: float(v) for g, v in value.items() if isinstance(v, (int, float))}
+            total = sum(v for v in numeric.values() if v > 0)
+            for group, weight in numeric.items():
+                if total and weight > 0:
+                    yield f"{dimension}:{group}", weight / total
+        elif isinstance(value, str):
+            yield f"{dimension}:{value}", 1.0
+
+
+class _Buckets:
+    """Ring of fixed-width time buckets backed by numpy arrays"""
+
+    ARRAYS = ("count", "score_sum", "alerts", "hist", "group_weight", "group_score")
+
+    def __init__(self, width: int, slots: int, n_groups: int = 0):
+        self.width = width
+        self.slots = slots
+        self.start = np.full(slots, -1, dtype=np.int64)
+        self.count = np.zeros(slots, dtype=np.int64)
+        self.score_sum = np.zeros(slots)
+        self.alerts = np.zeros((slots, len(ALERT_LEVELS)), dtype=np.int64)
+        self.hist = np.zeros((slots, SCORE_BINS), dtype=np.int64)
+        self.group_weight = np.zeros((slots, n_groups))
+        self.group_score = np.zeros((slots, n_groups))
+
+    def _slot(self, bucket_start: int) -> Optional[int]:
+        index = (bucket_start // self.width) % self.slots
+        if self.start[index] != bucket_start:
+            if self.start[index] > bucket_start:
+                return None  # older than the ring retains
+            self._clear(np.array([index]))
+            self.start[index] = bucket_start
+        return index
+
+    def _clear(self, mask):
+        for name in self.ARRAYS:
+            getattr(self, name)[mask] = 0
+
+    def grow_groups(self, n_groups: int):
+        extra = n_groups - self.group_weight.shape[1]
+        if extra > 0:
+            self.group_weight = np.pad(self.group_weight, ((0, 0), (0, extra)))
+            self.group_score = np.pad(self.group_score, ((0, 0), (0, extra)))
+
+    def add(self, timestamp: float, score: float, alert: int, groups: List[Tuple[int, float]]):
+        index = self._slot(int(timestamp // self.width) * self.width)
+        if index is None:
+            return
+        self.count[index] += 1
+        self.score_sum[index] += score
+        if alert >= 0:
+            self.alerts[index, alert] += 1
+        self.hist[index, min(int(score * SCORE_BINS), SCORE_BINS - 1)] += 1
+        for column, share in groups:
+            self.group_weight[index, column] += share
+            self.group_score[index, column] += share * score
+
+    def merge(self, other: "_Buckets", columns: np.ndarray):
+        """Add ``other`` into this ring; ``columns`` maps other's groups to ours"""
+        newer = other.start > self.start
+        self._clear(newer)
+        self.start[newer] = other.start[newer]
+        same = (other.start == self.start) & (other.start >= 0)
+        for name in self.ARRAYS[:4]:
+            getattr(self, name)[same] += getattr(other, name)[same]
+        if len(columns):
+            rows = np.nonzero(same)[0]
+            self.group_weight[np.ix_(rows, columns)] += other.group_weight[same]
+            self.group_score[np.ix_(rows, columns)] += other.group_score[same]
+
+    def window(self, since: float, until: float) -> np.ndarray:
+        """Slot indices covering [since, until], oldest first"""
+        first = int(since // self.width) * self.width
+        mask = (self.start >= first) & (self.start <= until)
+        indices = np.nonzero(mask)[0]
+        return indices[np.argsort(self.start[indices])]
+
+
+class DashboardRollups:
+    """Incremental dashboard aggregates, optionally shared through a file"""
+
+    def __init__(self, path: Optional[str] = None, flush_interval_seconds: float = 5.0):
+        self.path = path
+        self.flush_interval_seconds = flush_interval_seconds
+        self.groups: List[str] = []
+        self._group_index: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Totals as of the last merge, and records added since
+        self._shared = [_Buckets(width, slots) for width, slots in RESOLUTIONS]
+        self._delta = [_Buckets(width, slots) for width, slots in RESOLUTIONS]
+        self._last_flush = time.monotonic()
+        self._pending = 0
+        self._loaded_mtime: Optional[int] = None
+
+        if self.path:
+            with self._lock:
+                self._load_shared()
+            atexit.register(self.flush)
+
+    def record(self, result: Dict[str, Any], timestamp: Optional[float] = None):
+        """Fold one completed analysis result into the aggregates"""
+        timestamp = time.time() if timestamp is None else timestamp
+        score = float(min(max(result.get("overall_bias_score", 0.0), 0.0), 1.0))
+        alert_level = result.get("alert_level")
+        alert = ALERT_LEVELS.index(alert_level) if alert_level in ALERT_LEVELS else -1
+
+        with self._lock:
+            groups = [
+                (self._column(name), share)
+                for name, share in demographic_shares(result.get("demographics"))
+            ]
+            for buckets in self._delta:
+                buckets.add(timestamp, score, alert, groups)
+            self._pending += 1
+
+        if self.path and time.monotonic() - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def flush(self):
+        """Merge the local delta into the shared totals (and the file, if any)"""
+        with self._lock:
+            if not self._pending:
+                return
+            if self.path:
+                try:
+                    self._merge_into_file()
+                except OSError as e:
+                    logger.error(f"Dashboard rollup flush failed: {e}")
+                    return
+            else:
+                self._merge(self._shared, self._delta, np.arange(len(self.groups)))
+            self._delta = [
+                _Buckets(width, slots, len(self.groups)) for width, slots in RESOLUTIONS
+            ]
+            self._last_flush = time.monotonic()
+            self._pending = 0
+
+    def query(
+        self, time_range: str = "24h", demographic: str = "all", now: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Aggregate the buckets in the requested window
+
+        ``demographic`` is "all", a dimension ("gender") or a single group
+        ("gender:female"); it limits the per-group breakdown.
+        """
+        seconds = parse_time_range(time_range)
+        now = time.time() if now is None else now
+        level = next(
+            i for i, (width, slots) in enumerate(RESOLUTIONS) if width * slots >= seconds
+        )
+
+        with self._lock:
+            if self.path:
+                self._refresh_shared()
+            shared, delta = self._shared[level], self._delta[level]
+            since = now - seconds
+            # Bucket starts both views know about, oldest first
+            starts = np.union1d(
+                shared.start[shared.window(since, now)], delta.start[delta.window(since, now)]
+            )
+            series = {name: [] for name in ("count", "score_sum", "alerts")}
+            totals = {
+                "hist": np.zeros(SCORE_BINS, dtype=np.int64),
+                "alerts": np.zeros(len(ALERT_LEVELS), dtype=np.int64),
+                "group_weight": np.zeros(len(self.groups)),
+                "group_score": np.zeros(len(self.groups)),
+            }
+            for start in starts:
+                count, score_sum, alerts = 0, 0.0, np.zeros(len(ALERT_LEVELS), dtype=np.int64)
+                for buckets in (shared, delta):
+                    index = (start // buckets.width) % buckets.slots
+                    if buckets.start[index] != start:
+                        continue
+                    count += buckets.count[index]
+                    score_sum += buckets.score_sum[index]
+                    alerts = alerts + buckets.alerts[index]
+                    totals["hist"] += buckets.hist[index]
+                    width = buckets.group_weight.shape[1]
+                    totals["group_weight"][:width] += buckets.group_weight[index]
+                    totals["group_score"][:width] += buckets.group_score[index]
+                series["count"].append(int(count))
+                series["score_sum"].append(float(score_sum))
+                series["alerts"].append(alerts)
+                totals["alerts"] += alerts
+            groups = list(self.groups)
+
+        total = int(sum(series["count"]))
+        alert_totals = dict(zip(ALERT_LEVELS, totals["alerts"].tolist()))
+        breakdown: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for column, name in enumerate(groups):
+            if not _matches(name, demographic):
+                continue
+            weight = totals["group_weight"][column]
+            if weight <= 0:
+                continue
+            dimension, group = name.split(":", 1)
+            breakdown.setdefault(dimension, {})[group] = {
+                "weight": float(weight),
+                "average_bias_score": float(totals["group_score"][column] / weight),
+            }
+
+        return {
+            "time_range": time_range,
+            "demographic": demographic,
+            "bucket_seconds": RESOLUTIONS[level][0],
+            "total_sessions": total,
+            "average_bias_score": float(sum(series["score_sum"]) / total) if total else 0.0,
+            "alert_levels": alert_totals,
+            "percentiles": _histogram_percentiles(totals["hist"], (50, 90, 99)),
+            "series": {
+                "timestamps": [
+                    datetime.fromtimestamp(int(s), tz=timezone.utc).isoformat() for s in starts
+                ],
+                "session_counts": series["count"],
+                "average_bias_scores": [
+                    s / c if c else 0.0 for s, c in zip(series["score_sum"], series["count"])
+                ],
+                "alert_counts": [int(a[1:].sum()) for a in series["alerts"]],
+            },
+            "demographics": breakdown,
+        }
+
+    # Internal helpers
+
+    def _column(self, name: str) -> int:
+        """Column for a demographic group, growing the arrays for new groups"""
+        column = self._group_index.get(name)
+        if column is None:
+            column = self._group_index[name] = len(self.groups)
+            self.groups.append(name)
+            for buckets in self._shared + self._delta:
+                buckets.grow_groups(len(self.groups))
+        return column
+
+    def _merge(self, target: List[_Buckets], source: List[_Buckets], columns: np.ndarray):
+        for into, buckets in zip(target, source):
+            into.merge(buckets, columns)
+
+    def _merge_into_file(self):
+        """Load the shared file, add our delta, write it back; lock held"""
+        lock_fd = os.open(f"{self.path}.lock", os.O_WRONLY | os.O_CREAT, 0o600)
+        try:
+            if fcntl:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            self._load_shared()
+            self._merge(self._shared, self._delta, np.arange(len(self.groups)))
+            self._save_shared()
+        finally:
+            os.close(lock_fd)  # also releases the flock
+
+    def _refresh_shared(self):
+        """Reload the shared file if another process replaced it"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime != self._loaded_mtime:
+            self._load_shared()
+
+    def _load_shared(self):
+        """Replace the shared view with the file contents"""
+        self._shared = [_Buckets(width, slots, len(self.groups)) for width, slots in RESOLUTIONS]
+        if not os.path.exists(self.path):
+            return
+        self._loaded_mtime = os.stat(self.path).st_mtime_ns
+        with np.load(self.path, allow_pickle=False) as data:
+            file_groups = [str(g) for g in data["groups"]]
+            columns = np.array([self._column(g) for g in file_groups], dtype=np.int64)
+            for level, (width, slots) in enumerate(RESOLUTIONS):
+                stored = _Buckets(width, slots, len(file_groups))
+                stored.start = data[f"r{level}_start"]
+                for name in _Buckets.ARRAYS:
+                    setattr(stored, name, data[f"r{level}_{name}"])
+                self._shared[level].merge(stored, columns)
+
+    def _save_shared(self):
+        arrays = {"groups": np.array(self.groups, dtype=str)}
+        for level, buckets in enumerate(self._shared):
+            arrays[f"r{level}_start"] = buckets.start
+            for name in _Buckets.ARRAYS:
+                arrays[f"r{level}_{name}"] = getattr(buckets, name)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, self.path)
+        self._loaded_mtime = os.stat(self.path).st_mtime_ns
+
+
+def _matches(name: str, demographic: str) -> bool:
+    if not demographic or demographic == "all":
+        return True
+    if ":" in demographic:
+        return name == demographic
+    return name.startswith(f"{demographic}:")
+
+
+def _histogram_percentiles(hist: np.ndarray, percentiles: Iterable[int]) -> Dict[str, float]:
+    """Approximate score percentiles from the fixed-width histogram"""
+    total = hist.sum()
+    if not total:
+        return {f"p{p}": 0.0 for p in percentiles}
+    cumulative = np.cumsum(hist)
+    result = {}
+    for p in percentiles:
+        rank = total * p / 100
+        index = int(np.searchsorted(cumulative, rank))
+        below = cumulative[index - 1] if index else 0
+        fraction = (rank - below) / hist[index] if hist[index] else 0.0
+        result[f"p{p}"] = float((index + fraction) / SCORE_BINS)
+    return result
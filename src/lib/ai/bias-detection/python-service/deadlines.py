@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+deadlines.py
+Request deadlines split into per-layer timeouts
+
+An analysis request has one deadline. Each layer of the tier gets a share of
+it, measured from when the layers start; a layer still running when its share
+is used up is abandoned (cancelled if it never started) and reported as timed
+out, so the response carries the layers that finished instead of waiting for
+the slowest one.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Share of the request deadline each layer may use, by typical cost; shares
+# are renormalized over the layers a tier runs
+DEFAULT_LAYER_DEADLINE_SHARES: Dict[str, float] = {
+    "preprocessing": 0.35,
+    "model_level": 0.30,
+    "interactive": 0.10,
+    "evaluation": 0.25,
+}
+
+
+def layer_timeouts(
+    deadline_ms: float,
+    layers: Sequence[str],
+    shares: Optional[Mapping[str, float]] = None,
+) -> Dict[str, float]:
+    """Seconds each layer may run, splitting ``deadline_ms`` by share"""
+    shares = shares or DEFAULT_LAYER_DEADLINE_SHARES
+    weights = [max(shares.get(layer, 0.0), 0.0) for layer in layers]
+    total = sum(weights)
+    if total <= 0:
+        weights, total = [1.0] * len(layers), float(len(layers))
+    return {layer: deadline_ms / 1000 * weight / total for layer, weight in zip(layers, weights)}
+
+
+def timed_out_result(layer: str, timeout: float) -> Dict[str, Any]:
+    """Placeholder result for a layer abandoned at its deadline"""
+    return {
+        "layer": layer,
+        "bias_score": 0.0,
+        "error": f"Layer exceeded its {timeout * 1000:.0f}ms deadline",
+        "timed_out": True,
+        "detected_biases": [],
+        "metrics": {},
+        "recommendations": [],
+    }
+
+
+async def gather_with_deadlines(
+    tasks: Mapping[str, Awaitable[Dict[str, Any]]], timeouts: Mapping[str, float]
+) -> List[Dict[str, Any]]:
+    """Await layer tasks concurrently, each bounded by its own timeout, in task order"""
+
+    async def bounded(layer: str, task: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            return await asyncio.wait_for(task, timeouts[layer])
+        except asyncio.TimeoutError:
+            logger.warning(f"Analysis layer {layer} abandoned after {timeouts[layer]:.3f}s")
+            return timed_out_result(layer, timeouts[layer])
+
+    return list(await asyncio.gather(*(bounded(layer, task) for layer, task in tasks.items())))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+export_stream.py
+Chunked encoders for streaming /export responses
+
+Each encoder consumes an iterator of row dicts and yields ``bytes`` chunks of
+about ``chunk_rows`` rows, so a response can start before the underlying scan
+finishes and only one chunk is ever held in memory.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    "json": ("application/json", "json"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def iter_export(
+    export_format: str, rows: Iterable[Dict[str, Any]], fields: List[str], chunk_rows: int = 500
+) -> Iterator[bytes]:
+    """Encode ``rows`` in ``export_format``, one chunk at a time"""
+    if export_format == "csv":
+        return _iter_csv(rows, fields, chunk_rows)
+    if export_format == "jsonl":
+        return _iter_jsonl(rows, fields, chunk_rows)
+    if export_format == "json":
+        return _iter_json(rows, fields, chunk_rows)
+    if export_format == "parquet":
+        if not PARQUET_AVAILABLE:
+            raise ValueError("Parquet export requires pyarrow")
+        return _iter_parquet(rows, fields, chunk_rows)
+    raise ValueError(
+        f"Unsupported export format: {export_format} (expected one of {', '.join(EXPORT_FORMATS)})"
+    )
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], fields: List[str], size: int) -> Iterator[List[Dict]]:
+    chunk = []
+    for row in rows:
+        chunk.append({name: row.get(name) for name in fields})
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_csv(rows, fields, chunk_rows) -> Iterator[bytes]:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=fields)
+    writer.writeheader()
+    for chunk in _chunks(rows, fields, chunk_rows):
+        yield output.getvalue().encode()
+        output.seek(0)
+        output.truncate()
+        writer.writerows(chunk)
+    yield output.getvalue().encode()
+
+
+def _iter_jsonl(rows, fields, chunk_rows) -> Iterator[bytes]:
+    for chunk in _chunks(rows, fields, chunk_rows):
+        yield "".join(json.dumps(row, default=str) + "\n" for row in chunk).encode()
+
+
+def _iter_json(rows, fields, chunk_rows) -> Iterator[bytes]:
+    """``{"sessions": [...], "metadata": {...}}`` with the count written last"""
+    total = 0
+    yield b'{"sessions": ['
+    for chunk in _chunks(rows, fields, chunk_rows):
+        prefix = ", " if total else ""
+        total += len(chunk)
+        yield (prefix + ", ".join(json.dumps(row, default=str) for row in chunk)).encode()
+    metadata = {
+        "export_timestamp": datetime.now().isoformat(),
+        "format": "json",
+        "total_records": total,
+    }
+    yield f'], "metadata": {json.dumps(metadata)}}}'.encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file whose contents are drained after each row group"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+def _iter_parquet(rows, fields, chunk_rows) -> Iterator[bytes]:
+    """One Parquet row group per chunk; the footer is written on close"""
+    schema = pa.schema(
+        [(name, pa.float64() if name.endswith("_score") else pa.string()) for name in fields]
+    )
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for chunk in _chunks(rows, fields, chunk_rows):
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
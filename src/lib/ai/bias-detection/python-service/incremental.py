@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+incremental.py
+Running state for incremental analysis of growing sessions
+
+Live training sessions keep appending AI responses and transcript turns. An
+IncrementalSession keeps the aggregates the analysis layers need (lexical
+counts, response length/time moments, sentiment means, biased term hits) so
+each append only processes the new turns.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+
+class IncrementalSessionNotFound(LookupError):
+    """Raised when appending to a session that has no live handle"""
+
+
+@dataclass
+class RunningMoments:
+    """Count, mean and population variance updated one value at a time (Welford)"""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, values: Iterable[float]):
+        for value in values:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Population variance, matching np.var"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation, matching np.std"""
+        return math.sqrt(self.variance)
+
+
+@dataclass
+class ResponseStats:
+    """Response length and response time moments for a session"""
+
+    lengths: RunningMoments = field(default_factory=RunningMoments)
+    times: RunningMoments = field(default_factory=RunningMoments)
+
+    @classmethod
+    def from_responses(cls, responses: List[Dict[str, Any]]) -> "ResponseStats":
+        stats = cls()
+        stats.update(responses)
+        return stats
+
+    def update(self, responses: List[Dict[str, Any]]):
+        self.lengths.update(len(r.get("content", "")) for r in responses)
+        self.times.update(r.get("response_time", 0) for r in responses)
+
+    @property
+    def count(self) -> int:
+        return self.lengths.count
+
+
+@dataclass
+class IncrementalSession:
+    """Aggregates for one live session, updated per appended delta
+
+    ``session_data`` is the accumulated SessionData; layers that only need
+    its size or static fields (demographics, outcomes) read it directly.
+    """
+
+    session_data: Any
+    lexical_counts: np.ndarray
+    token_count: int = 0
+    text_length: int = 0
+    response_stats: ResponseStats = field(default_factory=ResponseStats)
+    sentiment_sums: Dict[str, float] = field(default_factory=dict)
+    sentiment_weight: float = 0.0
+    biased_terms: List[Dict[str, Any]] = field(default_factory=list)
+    appends: int = 0
+
+    def add_text(
+        self,
+        counts: Iterable[int],
+        token_count: int,
+        text_length: int,
+        sentiment: Dict[str, Any],
+        biased_terms: List[Dict[str, Any]],
+    ):
+        """Fold the lexical scan and sentiment of a delta's text into the totals"""
+        # Deltas are joined with a single space, as _extract_text_content does
+        offset = self.text_length + 1 if self.text_length else 0
+        self.lexical_counts += np.asarray(list(counts), dtype=float)
+        self.token_count += token_count
+        self.text_length = offset + text_length
+
+        for term in biased_terms:
+            self.biased_terms.append({**term, "position": term["position"] + offset})
+
+        # Token-weighted mean of the per-delta sentiment scores
+        if "error" not in sentiment and token_count:
+            for key, value in sentiment.items():
+                self.sentiment_sums[key] = self.sentiment_sums.get(key, 0.0) + value * token_count
+            self.sentiment_weight += token_count
+
+    @property
+    def sentiment(self) -> Dict[str, float]:
+        if not self.sentiment_weight:
+            return {}
+        return {key: total / self.sentiment_weight for key, total in self.sentiment_sums.items()}
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+inference_backend.py
+CPU inference backends for the toxic-bert bias classifier
+
+Three interchangeable backends score a batch of text windows and return
+per-label sigmoid probabilities (toxic-bert is multi-label):
+
+- ``pytorch``: the fp32 model, as loaded by transformers
+- ``int8``: the same model with its Linear layers dynamically quantized to
+  int8 (weights stored as int8, activations quantized per batch)
+- ``onnx``: the fp32 model exported once to an ONNX graph and run by
+  onnxruntime's CPU execution provider with full graph optimizations
+
+All three share tokenization and post-processing so their outputs differ
+only by numerics. torch, transformers and onnxruntime are imported when a
+model is loaded, not when this module is.
+"""
+
+import importlib.util
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_BACKENDS = ("pytorch", "int8", "onnx")
+
+# Encoder inputs in the positional order BERT-style forward() accepts them
+_MODEL_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def backend_available(backend: str) -> bool:
+    """Whether the packages ``backend`` needs are installed"""
+    required = ["torch", "transformers"]
+    if backend == "onnx":
+        required.append("onnxruntime")
+    return all(importlib.util.find_spec(name) is not None for name in required)
+
+
+def default_onnx_path(model_name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), "bias-models", model_name.replace("/", "--") + ".onnx")
+
+
+def scores_from_logits(logits: np.ndarray, labels: List[str]) -> List[Dict[str, float]]:
+    """Per-window label -> sigmoid probability"""
+    probabilities = 1.0 / (1.0 + np.exp(-np.asarray(logits, dtype=np.float64)))
+    return [dict(zip(labels, map(float, row))) for row in probabilities]
+
+
+def _labels(model: Any) -> List[str]:
+    id2label = model.config.id2label
+    return [id2label[i] for i in range(len(id2label))]
+
+
+class TorchTextClassifier:
+    """Batch classifier over a PyTorch sequence-classification model"""
+
+    def __init__(self, model: Any, tokenizer: Any, max_length: int = 512):
+        self.model = model.eval()
+        self.tokenizer = tokenizer
+        self.labels = _labels(model)
+        self.max_length = max_length
+
+    def __call__(self, windows: List[str]) -> List[Dict[str, float]]:
+        import torch
+
+        encoded = self.tokenizer(
+            windows, padding=True, truncation=True, max_length=self.max_length, return_tensors="pt"
+        )
+        with torch.inference_mode():
+            logits = self.model(**encoded).logits
+        return scores_from_logits(logits.float().numpy(), self.labels)
+
+
+class OnnxTextClassifier:
+    """Batch classifier over an exported ONNX graph on the CPU execution provider"""
+
+    def __init__(
+        self,
+        model_path: str,
+        tokenizer: Any,
+        labels: List[str],
+        max_length: int = 512,
+        num_threads: Optional[int] = None,
+    ):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.tokenizer = tokenizer
+        self.labels = labels
+        self.max_length = max_length
+
+    def __call__(self, windows: List[str]) -> List[Dict[str, float]]:
+        encoded = self.tokenizer(
+            windows, padding=True, truncation=True, max_length=self.max_length, return_tensors="np"
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self.input_names}
+        logits = self.session.run(None, feeds)[0]
+        return scores_from_logits(logits, self.labels)
+
+
+def quantize_int8(model: Any) -> Any:
+    """Dynamically quantize a model's Linear layers to int8"""
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def export_onnx(model: Any, tokenizer: Any, path: str) -> str:
+    """Export a sequence-classification model to ``path`` with dynamic batch/sequence axes"""
+    import torch
+
+    sample = tokenizer(["onnx export sample"], return_tensors="pt")
+    names = [name for name in _MODEL_INPUTS if name in sample]
+    axes = {name: {0: "batch", 1: "sequence"} for name in names}
+    axes["logits"] = {0: "batch"}
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Workers may export concurrently; each writes its own file and the last rename wins
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            model.eval(),
+            tuple(sample[name] for name in names),
+            tmp_path,
+            input_names=names,
+            output_names=["logits"],
+            dynamic_axes=axes,
+            opset_version=17,
+        )
+    os.replace(tmp_path, path)
+    return path
+
+
+def build_classifier(
+    model: Any,
+    tokenizer: Any,
+    backend: str = "pytorch",
+    onnx_path: Optional[str] = None,
+    num_threads: Optional[int] = None,
+):
+    """Wrap a loaded fp32 model in the requested backend"""
+    if backend not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend}")
+    if backend == "pytorch":
+        return TorchTextClassifier(model, tokenizer)
+    if backend == "int8":
+        return TorchTextClassifier(quantize_int8(model), tokenizer)
+
+    if not onnx_path:
+        raise ValueError("onnx backend needs an onnx_path")
+    if not os.path.exists(onnx_path):
+        logger.info(f"Exporting ONNX graph to {onnx_path}")
+        export_onnx(model, tokenizer, onnx_path)
+    return OnnxTextClassifier(onnx_path, tokenizer, _labels(model), num_threads=num_threads)
+
+
+def load_classifier(
+    model_name: str,
+    backend: str = "pytorch",
+    onnx_path: Optional[str] = None,
+    num_threads: Optional[int] = None,
+):
+    """Load ``model_name`` from the Hugging Face hub/cache with the requested backend"""
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    return build_classifier(
+        model, tokenizer, backend, onnx_path or default_onnx_path(model_name), num_threads
+    )
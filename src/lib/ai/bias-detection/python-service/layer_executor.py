@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+layer_executor.py
+Process-pool execution engine for the bias analysis layers
+
+The analysis layers are CPU-bound (spaCy parsing, AIF360/Fairlearn metrics,
+sentiment scoring) and never await real I/O, so ``asyncio.gather`` runs them
+one after another on a single core. The LayerExecutor sends the CPU-bound
+layers to a warm pool of worker processes, each holding its own initialized
+BiasDetectionService, and merges the results back in layer order.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from deadlines import gather_with_deadlines
+
+logger = logging.getLogger(__name__)
+
+# Layer order matches the result order expected by analyze_session
+ANALYSIS_LAYERS = ("preprocessing", "model_level", "interactive", "evaluation")
+
+# Layers worth the inter-process round trip; the interactive layer is cheap
+CPU_BOUND_LAYERS = ("preprocessing", "model_level", "evaluation")
+
+# Service instance owned by each pool process
+_worker_service = None
+
+
+def _initialize_worker(service_factory: Callable[[], Any]):
+    """Build the per-process service once, when the pool process starts"""
+    global _worker_service
+    _worker_service = service_factory()
+
+
+def _worker_pid() -> int:
+    """No-op task used to force pool processes to start"""
+    return os.getpid()
+
+
+def _run_layer_in_worker(
+    layer: str, session_data: Any, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run a single analysis layer inside a pool process"""
+    if _worker_service is None:
+        raise RuntimeError("Layer executor worker was not initialized")
+    runner = getattr(_worker_service, f"_run_{layer}_analysis")
+    return asyncio.run(runner(session_data, **kwargs))
+
+
+def _pool_context():
+    """Prefer fork so workers inherit already-imported modules"""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+class LayerExecutor:
+    """Runs analysis layers concurrently on a warm process pool"""
+
+    def __init__(
+        self,
+        service_factory: Callable[[], Any],
+        max_workers: Optional[int] = None,
+        offloaded_layers: Iterable[str] = CPU_BOUND_LAYERS,
+    ):
+        self.service_factory = service_factory
+        self.offloaded_layers = tuple(offloaded_layers)
+        self.max_workers = max_workers or max(
+            1, min(len(self.offloaded_layers), os.cpu_count() or 1)
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=_pool_context(),
+                initializer=_initialize_worker,
+                initargs=(self.service_factory,),
+            )
+            logger.info(f"Layer executor pool started with {self.max_workers} workers")
+        return self._pool
+
+    def warm_up(self) -> List[int]:
+        """Start every pool process and wait for their services to initialize"""
+        pool = self._get_pool()
+        futures = [pool.submit(_worker_pid) for _ in range(self.max_workers)]
+        return [future.result() for future in futures]
+
+    async def run_layers(
+        self,
+        service: Any,
+        session_data: Any,
+        layer_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+        layers: Sequence[str] = ANALYSIS_LAYERS,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run analysis layers and return their results in ``layers`` order
+
+        ``layer_kwargs`` maps a layer name to extra keyword arguments for its
+        ``_run_<layer>_analysis`` coroutine. With ``timeouts``, a layer still
+        running after its timeout is abandoned and reported as timed out; its
+        pool task is cancelled if it has not started.
+        """
+        layer_kwargs = layer_kwargs or {}
+        try:
+            pool = self._get_pool()
+            tasks = {
+                layer: (
+                    asyncio.wrap_future(
+                        pool.submit(
+                            _run_layer_in_worker, layer, session_data, layer_kwargs.get(layer, {})
+                        )
+                    )
+                    if layer in self.offloaded_layers
+                    else getattr(service, f"_run_{layer}_analysis")(
+                        session_data, **layer_kwargs.get(layer, {})
+                    )
+                )
+                for layer in layers
+            }
+            if timeouts:
+                return await gather_with_deadlines(tasks, timeouts)
+            return list(await asyncio.gather(*tasks.values()))
+        except BrokenProcessPool as e:
+            # A worker died (OOM kill, segfault in a native extension); rebuild
+            # the pool on the next request and finish this one inline.
+            logger.error(f"Layer executor pool broken, running layers inline: {e}")
+            self.shutdown()
+            return list(
+                await asyncio.gather(
+                    *[
+                        getattr(service, f"_run_{layer}_analysis")(
+                            session_data, **layer_kwargs.get(layer, {})
+                        )
+                        for layer in layers
+                    ]
+                )
+            )
+
+    def shutdown(self, wait: bool = False):
+        """Stop the pool processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
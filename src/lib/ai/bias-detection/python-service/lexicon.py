@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+lexicon.py
+Single-pass compiled lexicon matcher for the linguistic bias detectors
+
+Compiles category term lists into one ``lower -> (category, weight)`` hash map
+for single-token terms plus a token-level phrase trie for multi-word terms
+("over the hill", "senior moment", "old-fashioned"). One pass over a token
+sequence returns every category count and every term hit.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Splits a phrase the way spaCy tokenizes it: words, with hyphens and other
+# punctuation as separate tokens ("old-fashioned" -> "old", "-", "fashioned")
+_PHRASE_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+@dataclass
+class LexiconHit:
+    """A lexicon term found in a token sequence"""
+
+    term: str
+    category: str
+    weight: float
+    start: int  # index of the first matched token
+    end: int  # index one past the last matched token
+
+
+@dataclass
+class LexiconScan:
+    """Result of scanning a token sequence against a compiled lexicon"""
+
+    counts: Dict[str, int]
+    weights: Dict[str, float]
+    hits: List[LexiconHit] = field(default_factory=list)
+    token_count: int = 0
+
+
+class _PhraseNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[str, "_PhraseNode"] = {}
+        self.entries: List[Tuple[str, str, float]] = []
+
+
+class CompiledLexicon:
+    """Category lexicon compiled for one-pass matching over tokens"""
+
+    def __init__(
+        self,
+        categories: Mapping[str, Iterable[str]],
+        weights: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        ``categories`` maps a category name to its terms. ``weights`` optionally
+        maps a category or an individual term to a weight (default 1.0).
+        """
+        weights = weights or {}
+        self.categories: Tuple[str, ...] = tuple(categories)
+        self.single: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+        self._phrases = _PhraseNode()
+        self.max_phrase_length = 1
+
+        single: Dict[str, List[Tuple[str, float]]] = {}
+        for category, terms in categories.items():
+            for term in terms:
+                lower = term.lower()
+                weight = float(weights.get(lower, weights.get(category, 1.0)))
+                tokens = _PHRASE_TOKEN_RE.findall(lower)
+                if " " not in lower:
+                    # Also match tokenizers that keep "old-fashioned" whole
+                    single.setdefault(lower, []).append((category, weight))
+                if len(tokens) > 1:
+                    self._add_phrase(tokens, lower, category, weight)
+
+        self.single = {term: tuple(entries) for term, entries in single.items()}
+
+    def _add_phrase(self, tokens: Sequence[str], term: str, category: str, weight: float):
+        node = self._phrases
+        for token in tokens:
+            node = node.children.setdefault(token, _PhraseNode())
+        node.entries.append((term, category, weight))
+        self.max_phrase_length = max(self.max_phrase_length, len(tokens))
+
+    def scan(self, tokens: Iterable[Any]) -> LexiconScan:
+        """Scan tokens (objects with ``.text`` or plain strings) in one pass"""
+        lowers = [getattr(token, "text", token).lower() for token in tokens]
+        counts = dict.fromkeys(self.categories, 0)
+        weights = dict.fromkeys(self.categories, 0.0)
+        hits: List[LexiconHit] = []
+        single = self.single
+        phrase_roots = self._phrases.children
+
+        for index, lower in enumerate(lowers):
+            for category, weight in single.get(lower, ()):
+                counts[category] += 1
+                weights[category] += weight
+                hits.append(LexiconHit(lower, category, weight, index, index + 1))
+
+            node = phrase_roots.get(lower)
+            end = index + 1
+            while node is not None:
+                for term, category, weight in node.entries:
+                    counts[category] += 1
+                    weights[category] += weight
+                    hits.append(LexiconHit(term, category, weight, index, end))
+                if end >= len(lowers):
+                    break
+                node = node.children.get(lowers[end])
+                end += 1
+
+        return LexiconScan(counts=counts, weights=weights, hits=hits, token_count=len(lowers))
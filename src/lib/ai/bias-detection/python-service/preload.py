@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+preload.py
+Fork-safe model sharing for pre-forking servers
+
+With ``gunicorn --preload`` (GUNICORN_PRELOAD_APP=true) the service module is
+imported once in the master: spaCy, the VADER lexicon, toxic-bert and the
+fairness toolkits load a single time and every worker inherits them
+copy-on-write. Sharing only lasts while the pages stay untouched. CPython's
+cyclic GC writes to the header of every tracked object it scans, so the
+master moves its heap to the permanent generation (``gc.freeze``) right
+before forking.
+
+State that must not cross a fork (queued audit events, unflushed dashboard
+rollups, process and thread pools) is drained first. Background threads, file
+locks and mmaps are recreated lazily in each worker by the components that own
+them.
+
+``memory_usage`` reports RSS next to PSS and private/shared pages. RSS counts
+every shared page once per worker, so summing it overstates the total.
+"""
+
+import gc
+import logging
+import os
+import random
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_SMAPS_FIELDS = {
+    "Rss": "rss_kb",
+    "Pss": "pss_kb",
+    "Shared_Clean": "shared_clean_kb",
+    "Shared_Dirty": "shared_dirty_kb",
+    "Private_Clean": "private_clean_kb",
+    "Private_Dirty": "private_dirty_kb",
+}
+
+
+def memory_usage(pid: Any = "self") -> Dict[str, int]:
+    """RSS, PSS and shared/private totals in kB for a process (empty off Linux)"""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            lines = f.readlines()
+    except OSError:
+        return {}
+    usage = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        if name in _SMAPS_FIELDS:
+            usage[_SMAPS_FIELDS[name]] = int(value.split()[0])
+    return usage
+
+
+def prepare_for_fork(service: Optional[Any] = None):
+    """Drain per-process state and freeze the heap, in the master before forking"""
+    if service is not None and hasattr(service, "prepare_for_fork"):
+        service.prepare_for_fork()
+    gc.collect()
+    gc.freeze()
+
+
+def reinit_after_fork():
+    """Per-worker setup right after fork"""
+    # Workers would otherwise share the master's RNG state and draw identical sequences
+    seed = int.from_bytes(os.urandom(8), "little")
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
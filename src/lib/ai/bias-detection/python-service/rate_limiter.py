@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+rate_limiter.py
+Per-user token buckets shared by every worker process on the host
+
+Buckets live in a fixed-size, open-addressed table in an mmap'd file (under
+/dev/shm when available), so all gunicorn workers charge the same counters
+without an external service. Each acquire probes a short window of slots and
+updates one bucket under an exclusive file lock; the critical section is a few
+microseconds.
+
+A bucket idle long enough to have refilled completely is indistinguishable
+from a new one, so its slot is reused freely. If a probe window is full of
+active buckets, the least recently used one is evicted, which at worst hands
+that user a fresh bucket.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from audit_writer import locked
+
+_MAGIC = b"BIASRL1\0"
+_HEADER = struct.Struct("<8sQ")  # magic, slot count
+_SLOT = np.dtype([("key", "<u8"), ("tokens", "<f8"), ("updated", "<f8")])
+_PROBE = 16
+
+
+def default_table_path() -> str:
+    """Path shared by all workers on the host, in RAM when /dev/shm exists"""
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, "bias_detection_rate_limit.bin")
+
+
+def retry_after_seconds(retry_after: float) -> int:
+    """Whole seconds for a Retry-After header, at least 1"""
+    return max(1, math.ceil(retry_after))
+
+
+def _key_hash(key: str) -> int:
+    # Never 0, which marks an empty slot
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") | 1
+
+
+class RateLimiter:
+    """Token bucket per key: ``burst`` capacity refilled at ``rate_per_minute``"""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: Optional[float] = None,
+        path: Optional[str] = None,
+        slots: int = 4096,
+    ):
+        self.rate = rate_per_minute / 60
+        self.capacity = float(burst or rate_per_minute)
+        self.path = path or default_table_path()
+        self.slots = slots
+
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._fd: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._table: Optional[np.ndarray] = None
+
+    def acquire(self, key: str, cost: float = 1.0, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Take ``cost`` tokens from ``key``'s bucket
+
+        Returns (allowed, retry_after_seconds); retry_after is 0 when allowed.
+        """
+        if self.rate <= 0:
+            return True, 0.0
+        now = time.time() if now is None else now
+        key_hash = _key_hash(key)
+
+        # flock does not exclude threads sharing the descriptor
+        with self._lock:
+            self._open()
+            with locked(self._fd):
+                table = self._table
+                slot = self._find_slot(key_hash, now)
+                if table["key"][slot] == key_hash:
+                    elapsed = max(0.0, now - table["updated"][slot])
+                    tokens = min(self.capacity, table["tokens"][slot] + elapsed * self.rate)
+                else:
+                    tokens = self.capacity
+
+                allowed = tokens >= cost
+                if allowed:
+                    tokens -= cost
+                table["key"][slot] = key_hash
+                table["tokens"][slot] = tokens
+                table["updated"][slot] = now
+
+        return allowed, 0.0 if allowed else (cost - tokens) / self.rate
+
+    def close(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                self._table = None
+                self._mmap.close()
+                os.close(self._fd)
+            self._pid = self._fd = self._mmap = self._table = None
+
+    def _find_slot(self, key_hash: int, now: float) -> int:
+        """Slot holding ``key_hash``, else a reusable or least recently used one"""
+        table = self._table
+        window = (key_hash % len(table) + np.arange(_PROBE)) % len(table)
+        keys = table["key"][window]
+
+        match = np.nonzero(keys == key_hash)[0]
+        if len(match):
+            return int(window[match[0]])
+
+        # Empty, or idle long enough to have refilled to capacity
+        updated = table["updated"][window]
+        reusable = np.nonzero((keys == 0) | (now - updated >= self.capacity / self.rate))[0]
+        if len(reusable):
+            return int(window[reusable[0]])
+        return int(window[np.argmin(updated)])
+
+    def _open(self):
+        """Map the shared table, creating it if needed; reopen after a fork"""
+        if self._pid == os.getpid():
+            return
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with locked(fd):
+            header = os.pread(fd, _HEADER.size, 0)
+            if len(header) < _HEADER.size or _HEADER.unpack(header)[0] != _MAGIC:
+                os.ftruncate(fd, 0)  # zero any stale contents
+                os.ftruncate(fd, _HEADER.size + self.slots * _SLOT.itemsize)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, self.slots), 0)
+                header = os.pread(fd, _HEADER.size, 0)
+            # An existing table keeps its own size
+            slots = _HEADER.unpack(header)[1]
+
+        buffer = mmap.mmap(fd, _HEADER.size + slots * _SLOT.itemsize)
+        self._table = np.ndarray(slots, dtype=_SLOT, buffer=buffer, offset=_HEADER.size)
+        # Descriptors inherited across fork are left to the parent
+        self._fd, self._mmap, self._pid = fd, buffer, os.getpid()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+request_body.py
+Size-limited request body reading and fail-fast JSON decoding
+
+Bodies are rejected from the Content-Length header before anything is read,
+and chunked bodies are counted as they stream in, so an oversized payload
+costs at most ``max_bytes`` of reading. Before parsing, the raw bytes are
+checked for each required top-level key, so a payload missing one is
+rejected without being decoded. Keys spelled with JSON unicode escapes do not
+match that check.
+
+orjson is used for decoding when installed.
+"""
+
+import json
+from typing import Any, AsyncIterable, Dict, Optional, Sequence
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+class PayloadError(ValueError):
+    """Request body rejected before analysis"""
+
+    status_code = 400
+
+
+class PayloadTooLarge(PayloadError):
+    """Request body exceeds the configured size limit"""
+
+    status_code = 413
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Payload exceeds the {max_bytes / (1024 * 1024):g} MB limit")
+        self.max_bytes = max_bytes
+
+
+def check_content_length(content_length: Optional[str], max_bytes: int):
+    """Reject a request from its Content-Length header alone"""
+    if content_length is None:
+        return
+    try:
+        declared = int(content_length)
+    except ValueError:
+        raise PayloadError("Invalid Content-Length header") from None
+    if declared > max_bytes:
+        raise PayloadTooLarge(max_bytes)
+
+
+async def read_limited(chunks: AsyncIterable[bytes], max_bytes: int) -> bytes:
+    """Collect a streamed body, stopping as soon as it exceeds ``max_bytes``"""
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+        if len(body) > max_bytes:
+            raise PayloadTooLarge(max_bytes)
+    return bytes(body)
+
+
+def decode_json(body: bytes, required: Sequence[str] = ()) -> Dict[str, Any]:
+    """Decode a JSON object body; an empty body decodes to ``{}``
+
+    Raises PayloadError for a missing required key (checked on the raw bytes,
+    before parsing), invalid JSON or a non-object document.
+    """
+    if not body or body.isspace():
+        return {}
+    for field in required:
+        if b'"%s"' % field.encode() not in body:
+            raise PayloadError(f"Missing required field: {field}")
+
+    try:
+        data = _loads(body)
+    except ValueError:  # orjson.JSONDecodeError subclasses ValueError too
+        raise PayloadError("Invalid JSON payload") from None
+    if not isinstance(data, dict):
+        raise PayloadError("JSON payload must be an object")
+    return data
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+resources.py
+Offline NLTK and spaCy resources
+
+The service used to call ``nltk.download("vader_lexicon")`` on every start,
+which costs a network round trip per worker and fails without a network.
+Resources are now bundled once, at image build or setup time, into a
+resource directory:
+
+    python resources.py [--dir DIR]
+
+    DIR/nltk_data/sentiment/vader_lexicon.zip
+    DIR/spacy/en_core_web_sm/
+
+At runtime they are loaded from that directory without network access. If
+nothing is bundled, an installed en_core_web_sm package and NLTK data already
+on ``nltk.data.path`` are used instead. Downloads at runtime only happen when
+explicitly allowed (BIAS_ALLOW_RESOURCE_DOWNLOADS=true).
+"""
+
+import argparse
+import importlib
+import logging
+import os
+from typing import Optional
+
+from capabilities import package_available
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+SPACY_MODEL = "en_core_web_sm"
+
+# NLTK resource -> path nltk.data.find looks it up by
+NLTK_RESOURCES = {"vader_lexicon": "sentiment/vader_lexicon.zip"}
+
+
+def spacy_model_path(resource_dir: Optional[str] = None, model: str = SPACY_MODEL) -> Optional[str]:
+    """Bundled model directory, else the installed package name, else None"""
+    bundled = os.path.join(resource_dir or DEFAULT_RESOURCE_DIR, "spacy", model)
+    if os.path.isfile(os.path.join(bundled, "config.cfg")):
+        return bundled
+    if package_available(model):
+        return model
+    return None
+
+
+def ensure_nltk_resource(
+    name: str, resource_dir: Optional[str] = None, allow_download: bool = False
+) -> bool:
+    """Make a bundled NLTK resource findable; download it only when allowed"""
+    import nltk
+
+    data_dir = os.path.join(resource_dir or DEFAULT_RESOURCE_DIR, "nltk_data")
+    if data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+    try:
+        nltk.data.find(NLTK_RESOURCES[name])
+        return True
+    except LookupError:
+        if not allow_download:
+            return False
+
+    logger.warning(f"NLTK resource {name} not bundled, downloading it to {data_dir}")
+    return bool(nltk.download(name, download_dir=data_dir, quiet=True))
+
+
+def bundle(resource_dir: Optional[str] = None, model: str = SPACY_MODEL):
+    """Download the NLTK resources and copy the spaCy model into ``resource_dir``"""
+    import nltk
+    import spacy
+
+    resource_dir = resource_dir or DEFAULT_RESOURCE_DIR
+    data_dir = os.path.join(resource_dir, "nltk_data")
+    for name in NLTK_RESOURCES:
+        if not nltk.download(name, download_dir=data_dir, quiet=True):
+            raise RuntimeError(f"Failed to download NLTK resource {name}")
+        logger.info(f"Bundled NLTK resource {name} in {data_dir}")
+
+    if not package_available(model):
+        spacy.cli.download(model)
+        importlib.invalidate_caches()
+    model_dir = os.path.join(resource_dir, "spacy", model)
+    spacy.load(model).to_disk(model_dir)
+    logger.info(f"Bundled spaCy model {model} in {model_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--dir", default=DEFAULT_RESOURCE_DIR, help="resource directory")
+    parser.add_argument("--spacy-model", default=SPACY_MODEL)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    bundle(args.dir, args.spacy_model)
+
+
+if __name__ == "__main__":
+    main()
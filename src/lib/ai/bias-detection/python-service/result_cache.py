@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+result_cache.py
+Content-addressed cache for bias analysis results
+
+Results are keyed by a canonical SHA-256 of the session payload plus the
+configuration values that change the outcome (thresholds and layer weights).
+A bounded in-memory LRU tier sits in front of an optional on-disk tier whose
+entries are encrypted with the service's Fernet key. Both tiers honour a TTL
+and can be invalidated per session or cleared entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken
+
+logger = logging.getLogger(__name__)
+
+# SessionData fields that do not affect the analysis outcome
+_VOLATILE_SESSION_FIELDS = ("timestamp",)
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback JSON encoding for numpy scalars and arrays"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_json_default)
+
+
+def session_fingerprint(session_id: str) -> str:
+    """Short stable hash used to group cache entries by session"""
+    return hashlib.sha256(session_id.encode()).hexdigest()[:16]
+
+
+def compute_cache_key(session_data: Any, config: Any, analysis_mode: str = "standard") -> str:
+    """Canonical hash of a SessionData payload, its analysis tier and the outcome-relevant config"""
+    payload = {
+        key: value
+        for key, value in asdict(session_data).items()
+        if key not in _VOLATILE_SESSION_FIELDS
+    }
+    config_part = {
+        "warning_threshold": config.warning_threshold,
+        "high_threshold": config.high_threshold,
+        "critical_threshold": config.critical_threshold,
+        "layer_weights": config.layer_weights,
+        # Quantized backends score slightly differently from fp32
+        "inference_backend": config.inference_backend,
+    }
+    digest = hashlib.sha256(
+        _canonical_json({"session": payload, "mode": analysis_mode, "config": config_part}).encode()
+    ).hexdigest()
+    # Prefix with the session fingerprint so a session's entries can be
+    # invalidated together, in memory and on disk
+    return f"{session_fingerprint(session_data.session_id)}_{digest}"
+
+
+class ResultCache:
+    """Two-tier (memory LRU + encrypted disk) cache for analysis results"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        disk_dir: Optional[str] = None,
+        fernet: Optional[Fernet] = None,
+    ):
+        if disk_dir and fernet is None:
+            raise ValueError("An encryption key is required for the on-disk cache tier")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self.fernet = fernet
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``key`` or None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["hits"] += 1
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+            self._store_memory(key, value, now + self.ttl_seconds)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store a result in every enabled tier"""
+        with self._lock:
+            self._store_memory(key, value, time.time() + self.ttl_seconds)
+        self._write_disk(key, value)
+
+    def invalidate(self, key: str):
+        """Drop a single entry"""
+        with self._lock:
+            self._memory.pop(key, None)
+            self._stats["invalidations"] += 1
+        if self.disk_dir:
+            self._remove_disk_file(key)
+
+    def invalidate_session(self, session_id: str) -> int:
+        """Drop every entry for a session; returns the number removed"""
+        prefix = f"{session_fingerprint(session_id)}_"
+        removed = 0
+        with self._lock:
+            for key in [k for k in self._memory if k.startswith(prefix)]:
+                del self._memory[key]
+                removed += 1
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.startswith(prefix):
+                    removed += self._remove_disk_file(name[: -len(".bin")])
+        with self._lock:
+            self._stats["invalidations"] += removed
+        return removed
+
+    def clear(self):
+        """Drop every entry in every tier"""
+        with self._lock:
+            self._stats["invalidations"] += len(self._memory)
+            self._memory.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".bin"):
+                    self._remove_disk_file(name[: -len(".bin")])
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_enabled": bool(self.disk_dir),
+            }
+
+    # Internal helpers
+
+    def _store_memory(self, key: str, value: Dict[str, Any], expires_at: float):
+        """Insert into the LRU tier; caller holds the lock"""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.bin")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.disk_dir or self.fernet is None:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                token = f.read()
+            # Fernet tokens carry their creation time, so the TTL check is free
+            return json.loads(self.fernet.decrypt(token, ttl=int(self.ttl_seconds)))
+        except FileNotFoundError:
+            return None
+        except InvalidToken:
+            # Expired or written with another key
+            self._remove_disk_file(key)
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Result cache disk read failed for {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, value: Dict[str, Any]):
+        if not self.disk_dir or self.fernet is None:
+            return
+        try:
+            token = self.fernet.encrypt(_canonical_json(value).encode())
+            tmp_path = f"{self._disk_path(key)}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(token)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError as e:
+            logger.warning(f"Result cache disk write failed for {key}: {e}")
+
+    def _remove_disk_file(self, key: str) -> int:
+        try:
+            os.remove(self._disk_path(key))
+            return 1
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+result_store.py
+Append-only history of completed analyses, partitioned by day
+
+Each completed analysis appends one row to ``results-YYYY-MM-DD.jsonl``
+(Fernet-encrypted per line when a key is given). /export streams rows back
+with ``scan``, which opens only the partitions inside the requested range and
+reads them line by line, so memory stays flat however long the range is.
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from audit_writer import AuditFileSink
+
+_PARTITION_RE = re.compile(r"^results-(\d{4}-\d{2}-\d{2})\.jsonl$")
+
+
+def parse_date_range(
+    date_range: Optional[Dict[str, Any]]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Inclusive (start, end) local datetimes from ``{"start": ..., "end": ...}``
+
+    Accepts ISO dates or datetimes; a date-only ``end`` covers that whole day.
+    """
+    bounds = []
+    for name, day_time in (("start", time.min), ("end", time.max)):
+        value = (date_range or {}).get(name)
+        if not value:
+            bounds.append(None)
+            continue
+        try:
+            if len(value) == 10:
+                parsed = datetime.combine(date.fromisoformat(value), day_time)
+            else:
+                parsed = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid date_range {name}: {value!r}") from None
+        if parsed.tzinfo is not None:
+            # Stored timestamps are naive local time
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        bounds.append(parsed)
+
+    start, end = bounds
+    if start and end and start > end:
+        raise ValueError("date_range start is after end")
+    return start, end
+
+
+class ResultStore:
+    """Day-partitioned JSONL rows of completed analyses"""
+
+    def __init__(self, directory: str, fernet: Optional[Any] = None):
+        self.directory = directory
+        self.fernet = fernet
+        os.makedirs(directory, exist_ok=True)
+        self._sink: Optional[AuditFileSink] = None
+        self._lock = threading.Lock()
+
+    def append(self, row: Dict[str, Any]):
+        """Append one row; ``row["timestamp"]`` (ISO) selects the partition"""
+        line = json.dumps(row, separators=(",", ":"), default=str)
+        if self.fernet is not None:
+            line = self.fernet.encrypt(line.encode()).decode()
+
+        path = self._partition_path(row["timestamp"][:10])
+        with self._lock:
+            if self._sink is None or self._sink.path != path:
+                if self._sink is not None:
+                    self._sink.close()
+                self._sink = AuditFileSink(path)
+            self._sink.append([(line + "\n", None, None)])
+
+    def close(self):
+        with self._lock:
+            if self._sink is not None:
+                self._sink.close()
+                self._sink = None
+
+    def scan(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield rows with start <= timestamp <= end, oldest partition first"""
+        first = start.date().isoformat() if start else None
+        last = end.date().isoformat() if end else None
+
+        for day in self.partitions():
+            if (first and day < first) or (last and day > last):
+                continue
+            with open(self._partition_path(day), "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # append in progress
+                    row = self._decode(line.rstrip(b"\n"))
+                    timestamp = datetime.fromisoformat(row["timestamp"])
+                    if timestamp.tzinfo is not None:
+                        timestamp = timestamp.astimezone().replace(tzinfo=None)
+                    if (start and timestamp < start) or (end and timestamp > end):
+                        continue
+                    yield row
+
+    def partitions(self) -> List[str]:
+        """Partition days present on disk, oldest first"""
+        return sorted(
+            match.group(1)
+            for match in map(_PARTITION_RE.match, os.listdir(self.directory))
+            if match
+        )
+
+    def _decode(self, line: bytes) -> Dict[str, Any]:
+        if not line.startswith(b"{"):
+            if self.fernet is None:
+                raise ValueError("Encrypted result row but no key configured")
+            line = self.fernet.decrypt(line)
+        return json.loads(line)
+
+    def _partition_path(self, day: str) -> str:
+        return os.path.join(self.directory, f"results-{day}.jsonl")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+serialization.py
+numpy-aware JSON encoding and Accept-Encoding negotiation for responses
+
+Analysis results carry numpy scalars and arrays several levels deep. With
+orjson installed they are encoded natively (OPT_SERIALIZE_NUMPY); otherwise
+the stdlib C encoder is used with a default hook that converts numpy values
+via ``.item()``/``.tolist()``. Either way the output is compact, unsorted
+JSON as bytes.
+
+Bodies above ``min_size`` are compressed with brotli (when installed) or gzip
+if the client's Accept-Encoding allows it.
+"""
+
+import gzip
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Server preference when the client accepts several encodings equally
+_ENCODINGS = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON encoders do not handle natively"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact JSON bytes for ``obj``, converting numpy values natively"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. non-contiguous arrays or integers beyond 64 bits
+            pass
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick a supported content coding from an Accept-Encoding header"""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in _ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        # Quality 5 keeps brotli's ratio advantage at gzip-like speed
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def encode_json_response(
+    obj: Any, accept_encoding: Optional[str] = None, min_size: int = 1024
+) -> Tuple[bytes, Dict[str, str]]:
+    """JSON body and headers, compressed when worthwhile and accepted"""
+    body = dumps(obj)
+    headers = {"Content-Type": "application/json", "Vary": "Accept-Encoding"}
+    encoding = negotiate_encoding(accept_encoding) if len(body) >= min_size else None
+    if encoding:
+        body = compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+    return body, headers
@@ -173,6 +173,14 @@ except Exception as e:
 	print_success "NLTK data downloaded"
 }
 
+# Bundle NLTK and spaCy resources for offline loading
+bundle_resources() {
+	print_status "Bundling offline NLTK and spaCy resources..."
+
+	python resources.py
+	print_success "Resources bundled in resources/"
+}
+
 # Test installation
 test_installation() {
 	print_status "Testing installation..."
@@ -302,6 +310,7 @@ main() {
 	install_dependencies
 	download_spacy_model
 	download_nltk_data
+	bundle_resources
 	test_installation
 	create_env_template
 	create_startup_script
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+test_analysis_context.py
+Unit tests for analysis_context.py
+"""
+
+import pickle
+import unittest
+from types import SimpleNamespace
+
+from analysis_context import AnalysisContext
+from incremental import ResponseStats
+
+
+class _CountingService:
+    """Minimal service recording how often each helper runs"""
+
+    def __init__(self):
+        self.calls = {}
+        self.nlp = lambda text: self._count("nlp", text.split())
+
+    def _count(self, name, value):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        return value
+
+    def _extract_text_content(self, session_data):
+        return self._count("text", " ".join(r["content"] for r in session_data.ai_responses))
+
+    def _analyze_sentiment(self, text):
+        return self._count("sentiment", {"compound": 0.5})
+
+    def _create_synthetic_dataset(self, session_data):
+        return self._count("dataset", {"df": object()})
+
+    def _linguistic_bias_for(self, context):
+        return self._count("linguistic", {"word_count": len(context.doc)})
+
+
+class TestAnalysisContext(unittest.TestCase):
+    """Test lazy, at-most-once artifact materialization"""
+
+    def setUp(self):
+        self.service = _CountingService()
+        self.session = SimpleNamespace(
+            ai_responses=[
+                {"content": "how are you", "response_time": 1.0},
+                {"content": "tell me more", "response_time": 3.0},
+            ]
+        )
+
+    def test_artifacts_built_once(self):
+        """Test repeated access across consumers builds each artifact once"""
+        context = AnalysisContext(self.service, self.session)
+        for _ in range(3):
+            context.linguistic_bias
+            context.doc
+            context.sentiment
+            context.dataset
+            context.response_stats
+
+        self.assertEqual(
+            self.service.calls,
+            {"text": 1, "nlp": 1, "linguistic": 1, "sentiment": 1, "dataset": 1},
+        )
+        self.assertTrue(all(count == 1 for count in context.profile()["materialized"].values()))
+        self.assertEqual(context.response_times.tolist(), [1.0, 3.0])
+        self.assertEqual(context.response_stats.times.variance, 1.0)
+
+    def test_seeded_artifacts_are_not_built(self):
+        """Test seeded artifacts skip their factories"""
+        stats = ResponseStats.from_responses(self.session.ai_responses)
+        context = AnalysisContext(
+            self.service, self.session, linguistic_bias={"word_count": 9}, response_stats=stats
+        )
+
+        self.assertEqual(context.linguistic_bias, {"word_count": 9})
+        self.assertIs(context.response_stats, stats)
+        self.assertEqual(self.service.calls, {})
+        self.assertEqual(context.profile()["seeded"], ["linguistic_bias", "response_stats"])
+
+    def test_pickle_drops_service_and_live_objects(self):
+        """Test a pickled context keeps plain artifacts and rebinds to a service"""
+        context = AnalysisContext(self.service, self.session)
+        context.doc
+        context.sentiment
+
+        clone = pickle.loads(pickle.dumps(context))
+        self.assertIsNone(clone.service)
+
+        other = _CountingService()
+        clone.bind(other)
+        clone.sentiment
+        clone.doc
+        self.assertEqual(other.calls, {"nlp": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+test_asgi_app.py
+Unit tests for the ASGI serving mode in asgi_app.py
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("starlette")
+pytest.importorskip("httpx")
+
+from starlette.testclient import TestClient
+
+import jwt
+
+from asgi_app import app
+from bias_detection_service import app as flask_app, bias_service
+from rate_limiter import RateLimiter
+from warmup import Readiness
+
+
+class TestASGIEndpoints(unittest.TestCase):
+    """Test ASGI API endpoints mirror the Flask routes"""
+
+    def setUp(self):
+        os.environ["ENV"] = "development"  # Disable auth for testing
+        self.client = TestClient(app)
+
+    def test_health_check(self):
+        """Test health check endpoint"""
+        response = self.client.get("/health")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "healthy")
+
+    def test_ready_check(self):
+        """Test readiness mirrors the Flask endpoint"""
+        with patch.object(bias_service, "readiness", Readiness()):
+            response = self.client.get("/ready")
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers["Retry-After"], "1")
+
+            bias_service.readiness.mark_ready()
+            self.assertEqual(self.client.get("/ready").status_code, 200)
+
+    def test_analyze_endpoint_valid_data(self):
+        """Test analyze endpoint awaits the service on the app loop"""
+        test_data = {
+            "session_id": "test_session_001",
+            "participant_demographics": {"gender_distribution": {"male": 50, "female": 50}},
+            "content": {"session_notes": "Test session"},
+            "ai_responses": [{"content": "How are you?", "response_time": 1.0}],
+            "transcripts": [{"text": "I feel good"}],
+        }
+
+        response = self.client.post("/analyze", json=test_data)
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data["session_id"], "test_session_001")
+        self.assertIn("layer_results", data)
+
+    def test_analyze_endpoint_missing_required_fields(self):
+        """Test analyze endpoint with missing required fields"""
+        response = self.client.post("/analyze", json={"session_id": "test_session_001"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Missing required field", response.json()["error"])
+
+    def test_analyze_endpoint_no_data(self):
+        """Test analyze endpoint with no data"""
+        response = self.client.post("/analyze")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "No data provided")
+
+    def test_analyze_endpoint_rejects_oversized_payload(self):
+        """Test Content-Length and streamed bodies over the limit get 413"""
+        with patch("asgi_app.max_body_bytes", return_value=100):
+            response = self.client.post("/analyze", content=b"x" * 101)
+            self.assertEqual(response.status_code, 413)
+
+            def chunked():
+                yield b"x" * 60
+                yield b"x" * 60
+
+            response = self.client.post("/analyze", content=chunked())
+            self.assertEqual(response.status_code, 413)
+
+    def test_analyze_batch_endpoint_streams_ndjson(self):
+        """Test batch analyze endpoint streams one NDJSON record per session"""
+        session = {"participant_demographics": {}, "content": {"session_notes": "Test session"}}
+        batch = {"sessions": [{**session, "session_id": f"batch_{i}"} for i in range(2)]}
+
+        response = self.client.post("/analyze/batch", json=batch)
+        self.assertEqual(response.status_code, 200)
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(sorted(r["session_id"] for r in records), ["batch_0", "batch_1"])
+
+    def test_analyze_append_endpoint(self):
+        """Test append endpoint scores deltas against the live session"""
+        first = {"session_id": "asgi_live", "participant_demographics": {}, "ai_responses": []}
+        self.assertEqual(self.client.post("/analyze/append", json=first).status_code, 200)
+
+        delta = {"session_id": "asgi_live", "ai_responses": [{"content": "Hi", "response_time": 1.0}]}
+        response = self.client.post("/analyze/append", json=delta)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["incremental"]["total_responses"], 1)
+
+        missing = self.client.post("/analyze/append", json={"session_id": "asgi_missing"})
+        self.assertEqual(missing.status_code, 404)
+
+    def test_dashboard_query_parameters(self):
+        """Test dashboard reads timeRange/demographic and rejects bad ranges"""
+        response = self.client.get("/dashboard", params={"timeRange": "7d", "demographic": "age"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["trends"]["bucket_seconds"], 3600)
+        self.assertEqual(self.client.get("/dashboard?timeRange=7x").status_code, 400)
+
+    def test_export_endpoint_csv(self):
+        """Test export endpoint with CSV format"""
+        response = self.client.post("/export", json={"format": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+
+    def test_rate_limit_per_user(self):
+        """Test an authenticated user over the limit gets 429 with Retry-After"""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        limiter = RateLimiter(60, burst=2, path=os.path.join(temp_dir, "rate_limit.bin"))
+
+        def headers(user_id):
+            token = jwt.encode({"user_id": user_id}, flask_app.config["JWT_SECRET_KEY"], "HS256")
+            return {"Authorization": f"Bearer {token}"}
+
+        with patch.dict(os.environ, {"ENV": "production"}), \
+                patch.object(bias_service, "rate_limiter", limiter):
+            statuses = [
+                self.client.get("/dashboard", headers=headers("noisy")).status_code
+                for _ in range(3)
+            ]
+            self.assertEqual(statuses, [200, 200, 429])
+            limited = self.client.get("/dashboard", headers=headers("noisy"))
+            self.assertEqual(limited.headers["Retry-After"], "1")
+            self.assertEqual(self.client.get("/dashboard", headers=headers("quiet")).status_code, 200)
+
+    def test_404_endpoint(self):
+        """Test 404 error handling"""
+        response = self.client.get("/nonexistent")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["error"], "Endpoint not found")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+test_audit_store.py
+Unit tests for audit_store.py
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+
+from audit_store import AuditStore
+from audit_writer import AuditWriter
+
+
+def _record(session: str, event: str, seq: int, encrypted: bool = False):
+    entry = {"session_id_hash": session, "event_type": event, "seq": seq}
+    if encrypted:
+        entry["encrypted_details"] = json.dumps({"seq": seq})
+    return (json.dumps(entry) + "\n", session, event)
+
+
+class TestAuditStore(unittest.TestCase):
+    """Test segment rotation and indexed lookups"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_rotates_by_size(self):
+        """Test a new segment starts once the current one is full"""
+        store = AuditStore(self.directory, max_segment_bytes=200)
+        for seq in range(10):
+            store.append([_record("h1", "analysis_started", seq)])
+        store.close()
+
+        self.assertGreater(len(store.segments()), 1)
+        self.assertEqual([r["seq"] for r in store.query("h1")], list(range(10)))
+
+    def test_rotates_by_age(self):
+        """Test a segment older than the age limit is rotated"""
+        store = AuditStore(self.directory, max_segment_age_seconds=0)
+        store.append([_record("h1", "analysis_started", 0)])
+        store.append([_record("h1", "analysis_started", 1)])
+
+        self.assertEqual(len(store.segments()), 2)
+
+    def test_query_decrypts_only_hits(self):
+        """Test lookups by hash and event type decrypt just the matching records"""
+        store = AuditStore(self.directory)
+        store.append(
+            [
+                _record("h1", "analysis_started", 0),
+                _record("h2", "analysis_completed", 1, encrypted=True),
+                _record("h1", "analysis_completed", 2, encrypted=True),
+                _record("h3", "analysis_completed", 3, encrypted=True),
+            ]
+        )
+        decrypted = []
+
+        def decrypt(token):
+            decrypted.append(token)
+            return token
+
+        hits = list(store.query("h1", "analysis_completed", decrypt))
+
+        self.assertEqual([r["seq"] for r in hits], [2])
+        self.assertEqual(hits[0]["details"], {"seq": 2})
+        self.assertEqual(len(decrypted), 1)
+        self.assertEqual(
+            [r["seq"] for r in store.query(event_type="analysis_completed")], [1, 2, 3]
+        )
+
+    def test_index_picks_up_new_records(self):
+        """Test a cached index sees records appended after the first query"""
+        writer_store = AuditStore(self.directory)
+        reader_store = AuditStore(self.directory)
+        writer_store.append([_record("h1", "analysis_started", 0)])
+        self.assertEqual(len(list(reader_store.query("h1"))), 1)
+
+        writer_store.append([_record("h1", "analysis_completed", 1)])
+        self.assertEqual([r["seq"] for r in reader_store.query("h1")], [0, 1])
+
+    def test_audit_writer_sink(self):
+        """Test the background writer indexes records it appends"""
+        store = AuditStore(self.directory)
+        writer = AuditWriter(store)
+        writer.submit(json.dumps({"seq": 0}), "h1", "analysis_started")
+        writer.submit(json.dumps({"seq": 1}), "h2", "analysis_started")
+        writer.close()
+
+        self.assertEqual([r["seq"] for r in store.query("h2")], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
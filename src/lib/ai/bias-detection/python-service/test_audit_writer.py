@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+test_audit_writer.py
+Unit tests for audit_writer.py
+"""
+
+import json
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from audit_writer import AuditWriter
+
+
+def _write_events(path: str, worker: int, count: int):
+    writer = AuditWriter(path, batch_size=16)
+    for i in range(count):
+        writer.submit(json.dumps({"worker": worker, "seq": i, "pad": "x" * 512}))
+    writer.close()
+
+
+class TestAuditWriter(unittest.TestCase):
+    """Test buffered group-commit audit writes"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".log")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _records(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_flush_makes_events_durable_in_order(self):
+        """Test flush waits for every submitted event, preserving order"""
+        writer = AuditWriter(self.path, batch_size=8)
+        for i in range(50):
+            writer.submit(json.dumps({"seq": i}))
+
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual([r["seq"] for r in self._records()], list(range(50)))
+        self.assertLess(writer.stats["batches"], 50)
+        writer.close()
+
+    def test_fsync_every_n_events(self):
+        """Test the event-count fsync rule"""
+        writer = AuditWriter(self.path, batch_size=1, fsync_every_events=5, fsync_interval_ms=0)
+        with patch("audit_writer.os.fsync") as fsync:
+            for i in range(10):
+                writer.submit(json.dumps({"seq": i}))
+            writer.close()
+
+        self.assertEqual(fsync.call_count, 2)
+
+    def test_submit_after_close_writes_through(self):
+        """Test late events are still appended after shutdown"""
+        writer = AuditWriter(self.path)
+        writer.submit(json.dumps({"seq": 0}))
+        writer.close()
+        writer.submit(json.dumps({"seq": 1}))
+
+        self.assertEqual([r["seq"] for r in self._records()], [0, 1])
+
+    def test_multi_process_appends_do_not_interleave(self):
+        """Test concurrent writers in several processes produce whole records"""
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_write_events, args=(self.path, worker, 200))
+            for worker in range(4)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(30)
+
+        records = self._records()
+        self.assertEqual(len(records), 800)
+        for worker in range(4):
+            seqs = [r["seq"] for r in records if r["worker"] == worker]
+            self.assertEqual(seqs, list(range(200)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ Bias Detection Flask Service, covering all major components and endpoints.
 import asyncio
 import json
 import os
+import shutil
 import tempfile
 import unittest
 from datetime import datetime
@@ -21,14 +22,21 @@ import pytest
 from flask import Flask
 
 # Import the service and related classes
+from audit_store import AuditStore
+from audit_writer import AuditWriter
 from bias_detection_service import (
     AuditLogger,
     BiasDetectionConfig,
     BiasDetectionService,
+    IncrementalSessionNotFound,
     SecurityManager,
     SessionData,
     app,
+    bias_service,
+    config,
 )
+from result_store import ResultStore
+from warmup import Readiness
 
 
 class TestBiasDetectionConfig(unittest.TestCase):
@@ -229,6 +237,27 @@ class TestAuditLogger(unittest.TestCase):
         self.assertEqual(log_entry["encrypted_details"], "encrypted_data")
         self.security_manager.encrypt_data.assert_called_once()
 
+    def test_find_events_uses_audit_store(self):
+        """Test session lookups go through the indexed audit store"""
+        store_dir = tempfile.mkdtemp()
+        self.security_manager.decrypt_data.return_value = '{"bias_score": 0.75}'
+        audit_logger = AuditLogger(self.security_manager, AuditWriter(AuditStore(store_dir)))
+
+        for event_type in ("analysis_started", "analysis_completed"):
+            asyncio.run(
+                audit_logger.log_event(
+                    event_type, "test_session", "test_user", {"bias_score": 0.75},
+                    sensitive_data=event_type == "analysis_completed",
+                )
+            )
+        audit_logger.close()
+
+        events = list(audit_logger.find_events("test_session", "analysis_completed"))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["details"], {"bias_score": 0.75})
+        self.security_manager.decrypt_data.assert_called_once_with("encrypted_data")
+        shutil.rmtree(store_dir)
+
 
 class TestBiasDetectionService(unittest.TestCase):
     """Test BiasDetectionService main functionality"""
@@ -321,6 +350,21 @@ class TestBiasDetectionService(unittest.TestCase):
         bias_score = self.service._detect_gender_bias(unbalanced_tokens)
         self.assertEqual(bias_score, 1.0)  # Completely unbalanced
 
+    def test_detect_biased_terms_matches_phrases(self):
+        """Test biased-term detection finds multi-word phrases with context"""
+        spacy = pytest.importorskip("spacy")
+        doc = spacy.blank("en")("My chairman is over the hill and a bit old-fashioned.")
+
+        terms = self.service._detect_biased_terms(doc)
+        found = {(t["term"], t["category"]) for t in terms}
+
+        self.assertIn(("chairman", "gender"), found)
+        self.assertIn(("over the hill", "age"), found)
+        self.assertIn(("old-fashioned", "age"), found)
+        phrase = next(t for t in terms if t["term"] == "over the hill")
+        self.assertEqual(phrase["position"], doc.text.index("over the hill"))
+        self.assertIn("over the hill", phrase["context"])
+
     def test_calculate_overall_bias_score(self):
         """Test overall bias score calculation"""
         layer_results = [
@@ -416,6 +460,226 @@ class TestBiasDetectionService(unittest.TestCase):
         
         self.assertEqual(result["total_responses"], 2)
 
+    def test_score_lexical_counts_matches_detectors(self):
+        """Test vectorized lexical scoring matches the per-doc detectors"""
+        docs = [
+            [Mock(text=t) for t in "He said the old man and the young boy were native".split()],
+            [Mock(text=t) for t in "She felt her culture and religion were foreign".split()],
+            [],
+        ]
+        counts = np.array([self.service._count_lexical_terms(doc) for doc in docs], dtype=float)
+        totals = np.array([len(doc) for doc in docs], dtype=float)
+
+        scores = self.service._score_lexical_counts(counts, totals)
+
+        for doc, row in zip(docs, scores):
+            expected = [
+                self.service._detect_gender_bias(doc),
+                self.service._detect_racial_bias(doc),
+                self.service._detect_age_bias(doc),
+                self.service._detect_cultural_bias(doc),
+            ]
+            np.testing.assert_allclose(row, expected)
+
+    def test_analyze_sessions_yields_every_session(self):
+        """Test batch analysis yields one result per session"""
+        sessions = [
+            SessionData(**{**self.test_session_data.__dict__, "session_id": f"batch_{i}"})
+            for i in range(5)
+        ]
+
+        async def collect():
+            return [r async for r in self.service.analyze_sessions(sessions, "test_user")]
+
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock):
+            results = asyncio.run(collect())
+
+        self.assertEqual(
+            sorted(r["session_id"] for r in results), [f"batch_{i}" for i in range(5)]
+        )
+        self.assertTrue(all("overall_bias_score" in r for r in results))
+
+    def test_analyze_sessions_uses_batch_parse(self):
+        """Test batch analysis hands pre-parsed linguistic results to each session"""
+        spacy = pytest.importorskip("spacy")
+        self.service.nlp = spacy.blank("en")
+        self.service.config.nlp_batch_size = 2
+        sessions = [
+            SessionData(**{**self.test_session_data.__dict__, "session_id": f"batch_{i}"})
+            for i in range(3)
+        ]
+
+        async def collect():
+            return [r async for r in self.service.analyze_sessions(sessions, "test_user")]
+
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock), \
+                patch.object(self.service, "_detect_linguistic_bias") as per_session_parse:
+            results = asyncio.run(collect())
+
+        per_session_parse.assert_not_called()
+        for result in results:
+            linguistic = result["layer_results"]["preprocessing"]["metrics"]["linguistic_bias"]
+            self.assertGreater(linguistic["word_count"], 0)
+
+    def test_analyze_session_served_from_cache(self):
+        """Test repeated analysis of the same session hits the result cache"""
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock), \
+                patch.object(self.service, "_run_analysis_layers", wraps=self.service._run_analysis_layers) as layers:
+            first = asyncio.run(self.service.analyze_session(self.test_session_data, "test_user"))
+            resubmitted = SessionData(**{**self.test_session_data.__dict__, "timestamp": None})
+            second = asyncio.run(self.service.analyze_session(resubmitted, "test_user"))
+
+        self.assertEqual(layers.call_count, 1)
+        self.assertFalse(first["cache_hit"])
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(first["overall_bias_score"], second["overall_bias_score"])
+        self.assertEqual(self.service.result_cache.stats()["hits"], 1)
+
+        self.assertEqual(self.service.invalidate_cached_results("test_session_001"), 1)
+
+    def test_analysis_context_builds_artifacts_once(self):
+        """Test one analysis parses the text and builds response arrays only once"""
+        spacy = pytest.importorskip("spacy")
+        self.service.nlp = spacy.blank("en")
+        self.service.config.enable_analysis_profiling = True
+        self.service.result_cache = None
+
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock), \
+                patch("bias_detection_service.NLP_AVAILABLE", True), \
+                patch.object(self.service, "nlp", wraps=self.service.nlp) as nlp:
+            result = asyncio.run(self.service.analyze_session(self.test_session_data, "test_user"))
+
+        nlp.assert_called_once()
+        materialized = result["analysis_profile"]["materialized"]
+        self.assertEqual(materialized["doc"], 1)
+        self.assertEqual(materialized["response_times"], 1)
+        self.assertTrue(all(count == 1 for count in materialized.values()))
+
+    def test_append_to_session_matches_full_analysis(self):
+        """Test incremental appends reproduce the full-session lexical and response metrics"""
+        spacy = pytest.importorskip("spacy")
+        self.service.nlp = spacy.blank("en")
+        responses = [
+            {"content": "He said the chairman is old", "response_time": 1.2},
+            {"content": "She is young and the men agreed", "response_time": 2.6},
+            {"content": "Tell me more", "response_time": 0.4},
+        ]
+        base = {
+            "session_id": "live_001",
+            "participant_demographics": self.test_session_data.participant_demographics,
+        }
+
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock), \
+                patch("bias_detection_service.NLP_AVAILABLE", True):
+            asyncio.run(self.service.append_to_session({**base, "ai_responses": responses[:1]}, "u"))
+            result = asyncio.run(
+                self.service.append_to_session(
+                    {"session_id": "live_001", "ai_responses": responses[1:]}, "u"
+                )
+            )
+            full = SessionData(**{**self.test_session_data.__dict__, "ai_responses": responses,
+                                  "transcripts": [], "content": {}})
+            expected = asyncio.run(
+                self.service._detect_linguistic_bias(self.service._extract_text_content(full))
+            )
+
+        self.assertEqual(result["incremental"]["appends"], 2)
+        self.assertEqual(result["incremental"]["total_responses"], 3)
+        linguistic = result["layer_results"]["preprocessing"]["metrics"]["linguistic_bias"]
+        for key in ("gender_bias", "age_bias", "word_count"):
+            self.assertAlmostEqual(linguistic[key], expected[key])
+        consistency = result["layer_results"]["model_level"]["metrics"]["consistency"]
+        self.assertAlmostEqual(
+            consistency["response_length_variance"],
+            float(np.var([len(r["content"]) for r in responses])),
+        )
+
+    def test_fast_mode_runs_lexical_screen_only(self):
+        """Test the fast tier runs only preprocessing, on a tokenizer-only parse"""
+        spacy = pytest.importorskip("spacy")
+        self.service.nlp = spacy.blank("en")
+
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock), \
+                patch("bias_detection_service.NLP_AVAILABLE", True), \
+                patch.object(self.service, "nlp", wraps=self.service.nlp) as nlp, \
+                patch.object(self.service, "_create_synthetic_dataset") as dataset:
+            result = asyncio.run(
+                self.service.analyze_session(self.test_session_data, "test_user", analysis_mode="fast")
+            )
+
+        nlp.assert_not_called()
+        dataset.assert_not_called()
+        self.assertEqual(list(result["layer_results"]), ["preprocessing"])
+        self.assertGreater(
+            result["layer_results"]["preprocessing"]["metrics"]["linguistic_bias"]["word_count"], 0
+        )
+        self.assertEqual(result["analysis_mode"], "fast")
+        self.assertEqual(result["latency_budget_ms"], 10.0)
+        self.assertIn("within_latency_budget", result)
+
+    def test_deep_mode_adds_classifier(self):
+        """Test only the deep tier scores text with the toxicity classifier"""
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock), \
+                patch("bias_detection_service.HF_EVALUATE_AVAILABLE", True), \
+                patch.object(self.service, "_run_hf_evaluate_analysis", new_callable=AsyncMock) as hf:
+            hf.return_value = {"bias_score": 0.5}
+            standard = asyncio.run(self.service.analyze_session(self.test_session_data, "test_user"))
+            deep = asyncio.run(
+                self.service.analyze_session(self.test_session_data, "test_user", analysis_mode="deep")
+            )
+
+        self.assertEqual(hf.await_count, 1)
+        self.assertNotIn("hf_evaluate", standard["layer_results"]["evaluation"]["metrics"])
+        self.assertIn("hf_evaluate", deep["layer_results"]["evaluation"]["metrics"])
+        # Each tier has its own cache entry
+        self.assertFalse(deep["cache_hit"])
+        self.assertEqual(deep["analysis_mode"], "deep")
+
+    def test_slow_layer_abandoned_at_deadline(self):
+        """Test a layer past its deadline share is dropped from the score and the cache"""
+        import time
+
+        async def slow_layer(session_data, context=None):
+            time.sleep(0.5)  # CPU-bound work never yields to the event loop
+            return {"layer": "model_level", "bias_score": 1.0}
+
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock), \
+                patch.object(self.service, "_run_model_level_analysis", slow_layer):
+            start = time.perf_counter()
+            result = asyncio.run(
+                self.service.analyze_session(self.test_session_data, "test_user", deadline_ms=200)
+            )
+            elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.45)
+        self.assertTrue(result["partial"])
+        self.assertEqual(result["timed_out_layers"], ["model_level"])
+        self.assertTrue(result["layer_results"]["model_level"]["timed_out"])
+        finished = [r for r in result["layer_results"].values() if not r.get("timed_out")]
+        self.assertAlmostEqual(
+            result["overall_bias_score"], self.service._calculate_overall_bias_score(finished)
+        )
+        self.assertLess(result["confidence"], 0.8)
+        self.assertEqual(self.service.result_cache.stats()["memory_entries"], 0)
+
+    def test_warmup_runs_every_tier_without_side_effects(self):
+        """Test warm-up analyzes the synthetic session per tier but records nothing"""
+        with patch.object(self.service.audit_logger, "log_event", new_callable=AsyncMock) as log:
+            self.service.readiness.run(self.service.warmup_steps())
+
+        status = self.service.readiness.status()
+        self.assertTrue(status["ready"])
+        self.assertEqual(list(status["steps"]), ["fast_analysis", "standard_analysis", "deep_analysis"])
+        self.assertTrue(all(step["error"] is None for step in status["steps"].values()))
+        log.assert_not_called()
+        self.assertEqual(self.service.result_cache.stats()["memory_entries"], 0)
+        self.assertEqual(self.service.rollups.query("24h", "all")["total_sessions"], 0)
+
+    def test_append_to_unknown_session(self):
+        """Test appending to a session without a live handle is rejected"""
+        with self.assertRaises(IncrementalSessionNotFound):
+            asyncio.run(self.service.append_to_session({"session_id": "missing"}, "u"))
+
     def test_create_synthetic_dataset(self):
         """Test synthetic dataset creation for ML analysis"""
         dataset = self.service._create_synthetic_dataset(self.test_session_data)
@@ -451,6 +715,19 @@ class TestFlaskEndpoints(unittest.TestCase):
         self.assertIn('timestamp', data)
         self.assertIn('version', data)
 
+    def test_ready_check(self):
+        """Test readiness is 503 with Retry-After until warm-up finished"""
+        with patch.object(bias_service, "readiness", Readiness()):
+            response = self.client.get('/ready')
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers['Retry-After'], '1')
+            self.assertFalse(response.get_json()['ready'])
+
+            bias_service.readiness.mark_ready()
+            response = self.client.get('/ready')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['status'], 'ready')
+
     def test_analyze_endpoint_valid_data(self):
         """Test analyze endpoint with valid data"""
         test_data = {
@@ -497,6 +774,98 @@ class TestFlaskEndpoints(unittest.TestCase):
         self.assertIn('error', data)
         self.assertEqual(data['error'], 'No data provided')
 
+    def test_analyze_batch_endpoint_streams_ndjson(self):
+        """Test batch analyze endpoint streams one NDJSON record per session"""
+        session = {
+            "participant_demographics": {"gender_distribution": {"male": 50, "female": 50}},
+            "content": {"session_notes": "Test session"},
+            "ai_responses": [{"content": "How are you?", "response_time": 1.0}],
+        }
+        batch = {"sessions": [{**session, "session_id": f"batch_{i}"} for i in range(3)]}
+
+        response = self.client.post('/analyze/batch', json=batch)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+
+        records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(sorted(r['session_id'] for r in records), ['batch_0', 'batch_1', 'batch_2'])
+
+    def test_analyze_batch_endpoint_invalid_session(self):
+        """Test batch analyze endpoint reports the index of an invalid session"""
+        response = self.client.post('/analyze/batch', json={"sessions": [{"session_id": "x"}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('sessions[0]', response.get_json()['error'])
+
+    def test_analyze_endpoint_gzip_response(self):
+        """Test results are gzip encoded when the client accepts it"""
+        import gzip
+
+        test_data = {
+            "session_id": "gzip_session",
+            "participant_demographics": {"gender_distribution": {"male": 50, "female": 50}},
+            "content": {"session_notes": "Compressed session"},
+            "ai_responses": [{"content": "How are you?", "response_time": 1.0}],
+        }
+        response = self.client.post(
+            '/analyze', json=test_data, headers={"Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        data = json.loads(gzip.decompress(response.get_data()))
+        self.assertEqual(data["session_id"], "gzip_session")
+
+    def test_analyze_endpoint_rejects_oversized_payload(self):
+        """Test bodies over max_session_size_mb get 413 without being parsed"""
+        with patch.object(config, "max_session_size_mb", 1), \
+                patch("bias_detection_service.decode_json") as decode:
+            response = self.client.post(
+                '/analyze', data=b"x" * (1024 * 1024 + 1), content_type='application/json'
+            )
+        self.assertEqual(response.status_code, 413)
+        decode.assert_not_called()
+
+    def test_analyze_endpoint_analysis_mode(self):
+        """Test the analysis_mode parameter selects the tier, and unknown tiers are rejected"""
+        test_data = {
+            "session_id": "fast_session",
+            "participant_demographics": {"gender_distribution": {"male": 50, "female": 50}},
+            "content": {"session_notes": "Quick screen"},
+            "analysis_mode": "fast",
+        }
+        response = self.client.post('/analyze', json=test_data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['analysis_mode'], 'fast')
+
+        response = self.client.post('/analyze', json={**test_data, "analysis_mode": "thorough"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('analysis_mode', response.get_json()['error'])
+
+    def test_analyze_endpoint_malformed_json(self):
+        """Test invalid JSON is a 400, not a server error"""
+        body = b'{"session_id": "s", "participant_demographics": {}, "content": {'
+        response = self.client.post('/analyze', data=body, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_analyze_append_endpoint(self):
+        """Test append endpoint creates a live session and then accepts deltas"""
+        first = {
+            "session_id": "live_endpoint",
+            "participant_demographics": {"gender_distribution": {"male": 50, "female": 50}},
+            "ai_responses": [{"content": "How are you?", "response_time": 1.0}],
+        }
+        response = self.client.post('/analyze/append', json=first)
+        self.assertEqual(response.status_code, 200)
+
+        delta = {"session_id": "live_endpoint", "transcripts": [{"text": "Better now"}], "final": True}
+        response = self.client.post('/analyze/append', json=delta)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['incremental']['appends'], 2)
+
+    def test_analyze_append_endpoint_unknown_session(self):
+        """Test append endpoint returns 404 for a session without a live handle"""
+        response = self.client.post('/analyze/append', json={"session_id": "never_started"})
+        self.assertEqual(response.status_code, 404)
+
     def test_dashboard_endpoint(self):
         """Test dashboard data endpoint"""
         response = self.client.get('/dashboard')
@@ -507,6 +876,32 @@ class TestFlaskEndpoints(unittest.TestCase):
         self.assertIn('trends', data)
         self.assertIn('demographics', data)
 
+    def test_dashboard_reflects_completed_analyses(self):
+        """Test dashboard totals come from the rollups and honor the filters"""
+        before = self.client.get('/dashboard?timeRange=1h').get_json()['summary']
+        test_data = {
+            "session_id": "dashboard_session",
+            "participant_demographics": {"gender_distribution": {"male": 50, "female": 50}},
+            "content": {"session_notes": "Dashboard session"},
+            "ai_responses": [{"content": "How are you?", "response_time": 1.0}],
+            "expected_outcomes": [],
+            "transcripts": [],
+            "metadata": {},
+        }
+        self.assertEqual(self.client.post('/analyze', json=test_data).status_code, 200)
+
+        data = self.client.get('/dashboard?timeRange=1h&demographic=gender').get_json()
+        self.assertEqual(
+            data['summary']['total_sessions_analyzed'], before['total_sessions_analyzed'] + 1
+        )
+        self.assertEqual(set(data['demographics']), {'bias_by_gender'})
+        self.assertEqual(data['filters'], {'timeRange': '1h', 'demographic': 'gender'})
+
+    def test_dashboard_invalid_time_range(self):
+        """Test dashboard rejects an unparseable timeRange"""
+        response = self.client.get('/dashboard?timeRange=forever')
+        self.assertEqual(response.status_code, 400)
+
     def test_export_endpoint_json(self):
         """Test export endpoint with JSON format"""
         export_data = {
@@ -532,6 +927,38 @@ class TestFlaskEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.mimetype, 'text/csv')
 
+    def test_export_streams_stored_results(self):
+        """Test export streams analyses recorded in the result store"""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        test_data = {
+            "session_id": "export_session",
+            "participant_demographics": {"gender_distribution": {"male": 50, "female": 50}},
+            "content": {"session_notes": "Export session"},
+            "ai_responses": [{"content": "How are you?", "response_time": 1.0}],
+            "expected_outcomes": [],
+            "transcripts": [],
+            "metadata": {},
+        }
+
+        with patch.object(bias_service, "result_store", ResultStore(temp_dir)), \
+                patch.object(bias_service, "result_cache", None):
+            self.assertEqual(self.client.post('/analyze', json=test_data).status_code, 200)
+            response = self.client.post('/export', json={"format": "jsonl"})
+            self.assertTrue(response.is_streamed)
+            rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+            self.assertEqual([row["session_id"] for row in rows], ["export_session"])
+
+            past = {"format": "csv", "date_range": {"start": "2000-01-01", "end": "2000-01-02"}}
+            body = self.client.post('/export', json=past).get_data(as_text=True)
+            self.assertEqual(body.strip(), "session_id,bias_score,alert_level,timestamp")
+
+    def test_export_rejects_bad_format_and_range(self):
+        """Test export validates format and date_range before streaming"""
+        self.assertEqual(self.client.post('/export', json={"format": "xml"}).status_code, 400)
+        bad_range = {"format": "csv", "date_range": {"start": "not-a-date"}}
+        self.assertEqual(self.client.post('/export', json=bad_range).status_code, 400)
+
     def test_404_endpoint(self):
         """Test 404 error handling"""
         response = self.client.get('/nonexistent')
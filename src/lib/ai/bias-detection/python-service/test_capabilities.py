@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+test_capabilities.py
+Unit tests for capabilities.py and the service's import-time footprint
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from capabilities import TOOLKITS, Toolkit, capabilities, package_available, toolkit
+
+SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Optional toolkits that must not be imported by ``import bias_detection_service``
+HEAVY_MODULES = (
+    "aif360",
+    "fairlearn",
+    "evaluate",
+    "transformers",
+    "torch",
+    "onnxruntime",
+    "spacy",
+    "nltk",
+    "textblob",
+    "shap",
+    "lime",
+    "matplotlib",
+    "plotly",
+    "seaborn",
+    "sklearn",
+)
+
+
+def model_modules():
+    """Toolkits the service's models import when it is constructed at module load"""
+    modules = set()
+    if toolkit("nlp").available and package_available("en_core_web_sm"):
+        modules |= {"spacy", "nltk"}
+    if toolkit("hf_evaluate").available:
+        modules |= {"transformers", "torch", "onnxruntime"}
+    return modules
+
+
+def import_profile(module: str):
+    """Imported module -> cumulative microseconds for importing ``module`` in a fresh interpreter"""
+    env = {
+        **os.environ,
+        "FLASK_SECRET_KEY": os.environ.get("FLASK_SECRET_KEY", "test-flask-secret"),
+        "JWT_SECRET_KEY": os.environ.get("JWT_SECRET_KEY", "test-jwt-secret"),
+    }
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SERVICE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+class TestCapabilities(unittest.TestCase):
+    """Test availability probing and lazy symbol imports"""
+
+    def test_probe_does_not_import(self):
+        """Test availability is answered without importing the package"""
+        kit = Toolkit("probe", {"wave": "wave", "missing": "no_such_package_xyz:thing"})
+        self.assertFalse(kit.available)
+        self.assertEqual(kit.missing, ["no_such_package_xyz"])
+        self.assertTrue(package_available("json"))
+        self.assertFalse(package_available("no_such_package_xyz"))
+
+    def test_symbols_imported_on_first_use(self):
+        """Test a symbol is imported on first access and then cached"""
+        sys.modules.pop("colorsys", None)
+        kit = Toolkit("stdlib", {"colorsys": "colorsys", "rgb_to_hsv": "colorsys:rgb_to_hsv"})
+        self.assertTrue(kit.available)
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertEqual(kit.loaded, [])
+
+        self.assertEqual(kit.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertIn("colorsys", sys.modules)
+        self.assertEqual(kit.loaded, ["rgb_to_hsv"])
+        with self.assertRaises(AttributeError):
+            kit.not_registered
+
+    def test_unavailable_toolkit_raises_import_error(self):
+        """Test using a missing toolkit fails like the import would have"""
+        kit = Toolkit("missing", {"thing": "no_such_package_xyz:thing"})
+        with self.assertRaises(ImportError):
+            kit.thing
+
+    def test_registry(self):
+        """Test every registered capability is probed once"""
+        self.assertIs(toolkit("nlp"), toolkit("nlp"))
+        self.assertEqual(set(capabilities()), set(TOOLKITS))
+
+
+class TestStartupImports(unittest.TestCase):
+    """Import-time benchmark of the service module (python -X importtime)"""
+
+    def test_service_import_skips_optional_toolkits(self):
+        """Test importing the service loads no optional toolkit its models do not need"""
+        profile = import_profile("bias_detection_service")
+        self.assertIn("bias_detection_service", profile)
+        heavy = set(HEAVY_MODULES) - model_modules()
+        imported = sorted(heavy & {name.split(".")[0] for name in profile})
+        self.assertEqual(imported, [])
+
+        print(f"\nbias_detection_service import: {profile['bias_detection_service'] / 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
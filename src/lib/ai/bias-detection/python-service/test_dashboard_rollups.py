@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+test_dashboard_rollups.py
+Unit tests for dashboard_rollups.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dashboard_rollups import DashboardRollups, demographic_shares, parse_time_range
+
+NOW = 1_700_000_000.0
+
+
+def _result(score, alert_level, demographics=None):
+    return {
+        "overall_bias_score": score,
+        "alert_level": alert_level,
+        "demographics": demographics or {},
+    }
+
+
+class TestHelpers(unittest.TestCase):
+    """Test time range parsing and demographic shares"""
+
+    def test_parse_time_range(self):
+        """Test supported units and rejected values"""
+        self.assertEqual(parse_time_range("15m"), 900)
+        self.assertEqual(parse_time_range("24h"), 86400)
+        self.assertEqual(parse_time_range("7d"), 7 * 86400)
+        for invalid in ("", "24", "0h", "1w", "365d"):
+            with self.assertRaises(ValueError):
+                parse_time_range(invalid)
+
+    def test_demographic_shares(self):
+        """Test distributions are normalized and scalars count fully"""
+        shares = dict(
+            demographic_shares(
+                {"gender_distribution": {"male": 30, "female": 10}, "age": "26-35", "size": 4}
+            )
+        )
+        self.assertEqual(shares, {"gender:male": 0.75, "gender:female": 0.25, "age:26-35": 1.0})
+
+
+class TestDashboardRollups(unittest.TestCase):
+    """Test aggregation and queries"""
+
+    def test_summary_and_alerts(self):
+        """Test counts, mean score and alert-level totals over a window"""
+        rollups = DashboardRollups()
+        rollups.record(_result(0.1, "low"), NOW - 60)
+        rollups.record(_result(0.5, "warning"), NOW - 30)
+        rollups.record(_result(0.9, "critical"), NOW - 10)
+        rollups.record(_result(0.7, "high"), NOW - 2 * 86400)  # outside 24h
+
+        data = rollups.query("24h", now=NOW)
+        self.assertEqual(data["total_sessions"], 3)
+        self.assertAlmostEqual(data["average_bias_score"], 0.5)
+        self.assertEqual(data["alert_levels"], {"low": 1, "warning": 1, "high": 0, "critical": 1})
+        self.assertEqual(data["bucket_seconds"], 300)
+
+        week = rollups.query("7d", now=NOW)
+        self.assertEqual(week["total_sessions"], 4)
+        self.assertEqual(week["bucket_seconds"], 3600)
+
+    def test_series_is_per_bucket(self):
+        """Test the trend series has one ordered point per non-empty bucket"""
+        rollups = DashboardRollups()
+        rollups.record(_result(0.2, "low"), NOW - 3600)
+        rollups.record(_result(0.4, "warning"), NOW - 3600)
+        rollups.record(_result(0.8, "high"), NOW)
+
+        series = rollups.query("2h", now=NOW)["series"]
+        self.assertEqual(series["session_counts"], [2, 1])
+        self.assertAlmostEqual(series["average_bias_scores"][0], 0.3)
+        self.assertEqual(series["alert_counts"], [1, 1])
+        self.assertLess(series["timestamps"][0], series["timestamps"][1])
+
+    def test_percentiles(self):
+        """Test histogram percentiles fall in the right score bin"""
+        rollups = DashboardRollups()
+        for i in range(100):
+            rollups.record(_result(i / 100, "low"), NOW)
+
+        percentiles = rollups.query("1h", now=NOW)["percentiles"]
+        self.assertAlmostEqual(percentiles["p50"], 0.5, delta=0.05)
+        self.assertAlmostEqual(percentiles["p90"], 0.9, delta=0.05)
+
+    def test_demographic_breakdown_and_filter(self):
+        """Test per-group weighted scores and the demographic filter"""
+        rollups = DashboardRollups()
+        rollups.record(_result(0.2, "low", {"gender": "female", "age": "18-25"}), NOW)
+        rollups.record(_result(0.6, "high", {"gender_distribution": {"male": 1, "female": 1}}), NOW)
+
+        groups = rollups.query("1h", now=NOW)["demographics"]
+        self.assertAlmostEqual(groups["gender"]["female"]["weight"], 1.5)
+        self.assertAlmostEqual(groups["gender"]["female"]["average_bias_score"], (0.2 + 0.3) / 1.5)
+        self.assertAlmostEqual(groups["gender"]["male"]["average_bias_score"], 0.6)
+
+        self.assertEqual(set(rollups.query("1h", "gender", now=NOW)["demographics"]), {"gender"})
+        only = rollups.query("1h", "gender:male", now=NOW)["demographics"]
+        self.assertEqual(only, {"gender": {"male": groups["gender"]["male"]}})
+
+    def test_ring_drops_expired_buckets(self):
+        """Test a slot reused by a newer bucket forgets the old one"""
+        rollups = DashboardRollups()
+        rollups.record(_result(0.5, "low"), NOW)
+        # Same 5-minute slot two days later
+        later = NOW + 576 * 300
+        rollups.record(_result(0.1, "low"), later)
+        self.assertEqual(rollups.query("2d", now=later)["total_sessions"], 1)
+
+
+class TestPersistence(unittest.TestCase):
+    """Test file-backed rollups shared between instances"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "rollups.npz")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_flush_merges_across_instances(self):
+        """Test two writers (e.g. two workers) add up in the shared file"""
+        first = DashboardRollups(self.path, flush_interval_seconds=3600)
+        second = DashboardRollups(self.path, flush_interval_seconds=3600)
+        first.record(_result(0.2, "low", {"gender": "female"}), NOW)
+        second.record(_result(0.6, "high", {"age": "26-35"}), NOW)
+        first.flush()
+        second.flush()
+
+        reader = DashboardRollups(self.path)
+        data = reader.query("1h", now=NOW)
+        self.assertEqual(data["total_sessions"], 2)
+        self.assertAlmostEqual(data["average_bias_score"], 0.4)
+        self.assertEqual(set(data["demographics"]), {"gender", "age"})
+
+        # Existing readers pick up later flushes from other writers
+        first.record(_result(0.4, "warning"), NOW)
+        first.flush()
+        self.assertEqual(reader.query("1h", now=NOW)["total_sessions"], 3)
+
+    def test_unflushed_records_are_visible_locally(self):
+        """Test a worker's own pending records show up in its queries"""
+        rollups = DashboardRollups(self.path, flush_interval_seconds=3600)
+        rollups.record(_result(0.3, "warning"), NOW)
+        self.assertEqual(rollups.query("1h", now=NOW)["total_sessions"], 1)
+        self.assertFalse(os.path.exists(self.path))
+        rollups.flush()
+        self.assertTrue(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+test_deadlines.py
+Unit tests for deadlines.py
+"""
+
+import asyncio
+import unittest
+
+from deadlines import gather_with_deadlines, layer_timeouts
+
+
+class TestLayerTimeouts(unittest.TestCase):
+    """Test splitting a request deadline across layers"""
+
+    def test_shares_renormalized_over_tier_layers(self):
+        """Test shares are rescaled to the layers that actually run"""
+        timeouts = layer_timeouts(1000, ["preprocessing", "interactive"])
+        self.assertAlmostEqual(sum(timeouts.values()), 1.0)
+        self.assertAlmostEqual(timeouts["preprocessing"], 0.35 / 0.45)
+        self.assertAlmostEqual(layer_timeouts(100, ["preprocessing"])["preprocessing"], 0.1)
+
+    def test_unknown_layers_split_evenly(self):
+        """Test layers without a share fall back to an even split"""
+        timeouts = layer_timeouts(200, ["a", "b"], {"c": 1.0})
+        self.assertAlmostEqual(timeouts["a"], 0.1)
+        self.assertAlmostEqual(timeouts["b"], 0.1)
+
+
+class TestGatherWithDeadlines(unittest.TestCase):
+    """Test abandoning layers that overrun"""
+
+    def test_slow_layer_reported_as_timed_out(self):
+        """Test finished layers keep their results and the slow one is replaced"""
+
+        async def layer(name, delay):
+            await asyncio.sleep(delay)
+            return {"layer": name, "bias_score": 0.5}
+
+        async def run():
+            return await gather_with_deadlines(
+                {"fast": layer("fast", 0), "slow": layer("slow", 5)},
+                {"fast": 1.0, "slow": 0.05},
+            )
+
+        fast, slow = asyncio.run(run())
+        self.assertEqual(fast, {"layer": "fast", "bias_score": 0.5})
+        self.assertTrue(slow["timed_out"])
+        self.assertEqual(slow["layer"], "slow")
+        self.assertEqual(slow["bias_score"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
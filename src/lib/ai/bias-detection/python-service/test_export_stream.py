@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+test_export_stream.py
+Unit tests for export_stream.py
+"""
+
+import csv
+import io
+import json
+import unittest
+
+from export_stream import PARQUET_AVAILABLE, iter_export
+
+FIELDS = ["session_id", "bias_score", "alert_level", "timestamp"]
+
+
+def _rows(count):
+    for i in range(count):
+        yield {
+            "session_id": f"s{i}",
+            "bias_score": i / count,
+            "alert_level": "low",
+            "timestamp": "2024-01-01T10:00:00",
+        }
+
+
+class TestIterExport(unittest.TestCase):
+    """Test chunked encoders"""
+
+    def test_csv(self):
+        """Test CSV output has a header and every row"""
+        body = b"".join(iter_export("csv", _rows(25), FIELDS, chunk_rows=10)).decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[24]["session_id"], "s24")
+
+    def test_csv_without_rows_has_header(self):
+        """Test an empty export is still a valid CSV"""
+        body = b"".join(iter_export("csv", iter(()), FIELDS)).decode()
+        self.assertEqual(body.strip(), ",".join(FIELDS))
+
+    def test_jsonl(self):
+        """Test JSONL output is one object per line"""
+        body = b"".join(iter_export("jsonl", _rows(7), FIELDS, chunk_rows=3)).decode()
+        lines = body.splitlines()
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(json.loads(lines[0])["session_id"], "s0")
+
+    def test_json_document(self):
+        """Test JSON output keeps the sessions/metadata shape"""
+        body = b"".join(iter_export("json", _rows(12), FIELDS, chunk_rows=5))
+        data = json.loads(body)
+        self.assertEqual(len(data["sessions"]), 12)
+        self.assertEqual(data["metadata"]["total_records"], 12)
+        self.assertEqual(json.loads(b"".join(iter_export("json", iter(()), FIELDS)))["sessions"], [])
+
+    def test_streams_before_scan_finishes(self):
+        """Test the first chunks are produced without draining the row source"""
+        consumed = []
+
+        def source():
+            for row in _rows(1000):
+                consumed.append(row)
+                yield row
+
+        chunks = iter_export("jsonl", source(), FIELDS, chunk_rows=10)
+        next(chunks)
+        self.assertEqual(len(consumed), 10)
+
+    def test_unknown_format(self):
+        """Test unsupported formats are rejected up front"""
+        with self.assertRaises(ValueError):
+            iter_export("xml", _rows(1), FIELDS)
+
+    @unittest.skipUnless(PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_parquet_row_groups(self):
+        """Test Parquet output has one row group per chunk"""
+        import pyarrow.parquet as pq
+
+        body = b"".join(iter_export("parquet", _rows(25), FIELDS, chunk_rows=10))
+        parquet = pq.ParquetFile(io.BytesIO(body))
+        self.assertEqual(parquet.metadata.num_rows, 25)
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+
+    @unittest.skipIf(PARQUET_AVAILABLE, "pyarrow installed")
+    def test_parquet_requires_pyarrow(self):
+        """Test Parquet is rejected when pyarrow is missing"""
+        with self.assertRaises(ValueError):
+            iter_export("parquet", _rows(1), FIELDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+test_incremental.py
+Unit tests for incremental.py
+"""
+
+import unittest
+
+import numpy as np
+
+from incremental import IncrementalSession, ResponseStats, RunningMoments
+
+
+class TestRunningMoments(unittest.TestCase):
+    """Test streaming moments against numpy"""
+
+    def test_matches_numpy_across_chunks(self):
+        """Test chunked updates match np.mean/np.var/np.std on all values"""
+        values = np.random.default_rng(3).uniform(0, 500, 97)
+        moments = RunningMoments()
+        for chunk in np.array_split(values, 7):
+            moments.update(chunk.tolist())
+
+        self.assertEqual(moments.count, 97)
+        self.assertAlmostEqual(moments.mean, float(np.mean(values)))
+        self.assertAlmostEqual(moments.variance, float(np.var(values)), places=6)
+        self.assertAlmostEqual(moments.std, float(np.std(values)))
+
+    def test_empty(self):
+        """Test empty moments report zero variance"""
+        self.assertEqual(RunningMoments().variance, 0.0)
+
+    def test_response_stats(self):
+        """Test response stats track lengths and times"""
+        stats = ResponseStats.from_responses(
+            [{"content": "abc", "response_time": 1.0}, {"content": "a", "response_time": 3.0}]
+        )
+
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.lengths.variance, 1.0)
+        self.assertEqual(stats.times.mean, 2.0)
+
+
+class TestIncrementalSession(unittest.TestCase):
+    """Test folding deltas into a session handle"""
+
+    def test_add_text_accumulates(self):
+        """Test counts, term offsets and token-weighted sentiment accumulate"""
+        handle = IncrementalSession(session_data=None, lexical_counts=np.zeros(5))
+        handle.add_text([1, 0, 0, 0, 0], 4, 10, {"compound": 1.0}, [{"term": "a", "position": 2}])
+        handle.add_text([1, 2, 0, 0, 0], 12, 30, {"compound": 0.0}, [{"term": "b", "position": 5}])
+
+        self.assertEqual(handle.lexical_counts.tolist(), [2, 2, 0, 0, 0])
+        self.assertEqual(handle.token_count, 16)
+        self.assertEqual(handle.text_length, 41)
+        self.assertEqual([t["position"] for t in handle.biased_terms], [2, 16])
+        self.assertAlmostEqual(handle.sentiment["compound"], 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+test_inference_backend.py
+Unit tests for inference_backend.py
+
+The parity tests build a small randomly initialised BERT classifier and a
+local vocabulary, so they need torch and transformers but no downloads.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from inference_backend import backend_available, build_classifier, scores_from_logits
+
+LABELS = ["toxic", "severe_toxic", "obscene", "threat", "insult", "identity_hate"]
+WINDOWS = [
+    "i feel anxious about my job",
+    "you are not listening to me at all and i feel ignored",
+    "thank you",
+]
+
+
+def _tiny_model(directory: str):
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    words = sorted({word for window in WINDOWS for word in window.split()})
+    vocab_path = os.path.join(directory, "vocab.txt")
+    with open(vocab_path, "w") as f:
+        f.write("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + words))
+
+    config = BertConfig(
+        vocab_size=5 + len(words),
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        num_labels=len(LABELS),
+        id2label=dict(enumerate(LABELS)),
+        label2id={label: i for i, label in enumerate(LABELS)},
+    )
+    model = BertForSequenceClassification(config)
+    return model, BertTokenizerFast(vocab_file=vocab_path)
+
+
+def _as_matrix(scores):
+    return np.array([[s[label] for label in LABELS] for s in scores])
+
+
+class TestScores(unittest.TestCase):
+    """Test backend-independent post-processing"""
+
+    def test_scores_from_logits(self):
+        """Test logits map to per-label sigmoid probabilities"""
+        scores = scores_from_logits(np.array([[0.0, 100.0, -100.0]]), ["a", "b", "c"])
+        self.assertEqual(len(scores), 1)
+        self.assertAlmostEqual(scores[0]["a"], 0.5)
+        self.assertAlmostEqual(scores[0]["b"], 1.0)
+        self.assertAlmostEqual(scores[0]["c"], 0.0)
+
+    def test_unknown_backend_rejected(self):
+        """Test an unknown backend name fails before any model work"""
+        with self.assertRaises(ValueError):
+            build_classifier(None, None, backend="tensorrt")
+
+
+@unittest.skipUnless(backend_available("pytorch"), "torch/transformers not installed")
+class TestBackendParity(unittest.TestCase):
+    """Test quantized and ONNX outputs against fp32"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.model, cls.tokenizer = _tiny_model(cls.directory)
+        cls.reference = _as_matrix(build_classifier(cls.model, cls.tokenizer, "pytorch")(WINDOWS))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def test_int8_close_to_fp32(self):
+        """Test dynamic int8 quantization stays within quantization error"""
+        classifier = build_classifier(self.model, self.tokenizer, "int8")
+        scores = _as_matrix(classifier(WINDOWS))
+        np.testing.assert_allclose(scores, self.reference, atol=0.05)
+
+    @unittest.skipUnless(backend_available("onnx"), "onnxruntime not installed")
+    def test_onnx_matches_fp32(self):
+        """Test the exported graph reproduces fp32 scores, and the export is reused"""
+        path = os.path.join(self.directory, "model.onnx")
+        classifier = build_classifier(self.model, self.tokenizer, "onnx", onnx_path=path)
+        np.testing.assert_allclose(_as_matrix(classifier(WINDOWS)), self.reference, atol=1e-4)
+
+        mtime = os.path.getmtime(path)
+        build_classifier(self.model, self.tokenizer, "onnx", onnx_path=path)
+        self.assertEqual(os.path.getmtime(path), mtime)
+
+    def test_batch_independent(self):
+        """Test a window scores the same alone as in a padded batch"""
+        classifier = build_classifier(self.model, self.tokenizer, "pytorch")
+        alone = _as_matrix(classifier(WINDOWS[2:]))
+        np.testing.assert_allclose(alone[0], self.reference[2], atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+test_layer_executor.py
+Unit tests for layer_executor.py
+"""
+
+import asyncio
+import os
+import unittest
+
+from layer_executor import ANALYSIS_LAYERS, LayerExecutor
+
+
+class _FakeLayerService:
+    """Minimal stand-in exposing the four layer coroutines"""
+
+    def __init__(self):
+        for layer in ANALYSIS_LAYERS:
+            setattr(self, f"_run_{layer}_analysis", self._make_runner(layer))
+
+    @staticmethod
+    def _make_runner(layer):
+        async def runner(session_data):
+            return {"layer": layer, "bias_score": 0.1, "pid": os.getpid(), "session": session_data}
+
+        return runner
+
+
+class TestLayerExecutor(unittest.TestCase):
+    """Test LayerExecutor process-pool execution"""
+
+    def setUp(self):
+        self.executor = LayerExecutor(_FakeLayerService, max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def test_results_in_layer_order(self):
+        """Test results are merged back in layer order"""
+        results = asyncio.run(self.executor.run_layers(_FakeLayerService(), "session_001"))
+
+        self.assertEqual([r["layer"] for r in results], list(ANALYSIS_LAYERS))
+        self.assertTrue(all(r["session"] == "session_001" for r in results))
+
+    def test_cpu_bound_layers_run_in_pool(self):
+        """Test offloaded layers run outside the calling process"""
+        results = asyncio.run(self.executor.run_layers(_FakeLayerService(), "session_001"))
+        by_layer = {r["layer"]: r for r in results}
+
+        self.assertEqual(by_layer["interactive"]["pid"], os.getpid())
+        for layer in self.executor.offloaded_layers:
+            self.assertNotEqual(by_layer[layer]["pid"], os.getpid())
+
+    def test_warm_up_starts_workers(self):
+        """Test warm-up starts every pool process"""
+        pids = self.executor.warm_up()
+
+        self.assertEqual(len(pids), 2)
+        self.assertNotIn(os.getpid(), pids)
+
+
+if __name__ == "__main__":
+    unittest.main()
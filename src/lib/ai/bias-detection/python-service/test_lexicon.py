@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+test_lexicon.py
+Unit tests for lexicon.py
+"""
+
+import unittest
+
+from lexicon import CompiledLexicon
+
+
+class TestCompiledLexicon(unittest.TestCase):
+    """Test single-pass lexicon matching"""
+
+    def setUp(self):
+        self.lexicon = CompiledLexicon(
+            {
+                "age": ["old", "young"],
+                "racial": ["native"],
+                "cultural": ["native", "foreign"],
+                "biased:age": ["over the hill", "senior moment", "old-fashioned"],
+            },
+            weights={"racial": 2.0},
+        )
+
+    def test_single_token_counts(self):
+        """Test single-token terms are counted case-insensitively"""
+        scan = self.lexicon.scan("The Old man and the young girl".split())
+
+        self.assertEqual(scan.counts["age"], 2)
+        self.assertEqual(scan.token_count, 7)
+
+    def test_term_in_multiple_categories(self):
+        """Test a term listed under several categories counts for each"""
+        scan = self.lexicon.scan(["Native", "speaker"])
+
+        self.assertEqual(scan.counts["racial"], 1)
+        self.assertEqual(scan.counts["cultural"], 1)
+        self.assertEqual(scan.weights["racial"], 2.0)
+        self.assertEqual(scan.weights["cultural"], 1.0)
+
+    def test_multi_word_phrases(self):
+        """Test multi-word phrases match with token positions"""
+        tokens = "he is over the hill and had a senior moment".split()
+        scan = self.lexicon.scan(tokens)
+
+        phrases = [(hit.term, hit.start, hit.end) for hit in scan.hits if hit.category == "biased:age"]
+        self.assertEqual(phrases, [("over the hill", 2, 5), ("senior moment", 8, 10)])
+
+    def test_hyphenated_phrase(self):
+        """Test hyphenated terms match whether or not the tokenizer splits them"""
+        split = self.lexicon.scan(["so", "old", "-", "fashioned"])
+        whole = self.lexicon.scan(["so", "old-fashioned"])
+
+        self.assertEqual(split.counts["biased:age"], 1)
+        self.assertEqual(whole.counts["biased:age"], 1)
+
+    def test_partial_phrase_does_not_match(self):
+        """Test a phrase prefix at the end of the text is not a hit"""
+        scan = self.lexicon.scan(["over", "the"])
+
+        self.assertEqual(scan.counts["biased:age"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
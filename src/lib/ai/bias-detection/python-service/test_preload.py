@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+test_preload.py
+Unit tests for preload.py
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from preload import memory_usage, prepare_for_fork, reinit_after_fork
+
+
+class TestPreload(unittest.TestCase):
+    """Test fork preparation and memory reporting"""
+
+    def tearDown(self):
+        gc.unfreeze()
+
+    @unittest.skipUnless(os.path.exists("/proc/self/smaps_rollup"), "needs Linux /proc")
+    def test_memory_usage(self):
+        """Test RSS and PSS are reported in kB"""
+        usage = memory_usage()
+        self.assertGreater(usage["rss_kb"], 0)
+        self.assertLessEqual(usage["pss_kb"], usage["rss_kb"])
+        self.assertEqual(memory_usage(pid=999999999), {})
+
+    def test_prepare_for_fork_drains_service_and_freezes_heap(self):
+        """Test the service hook runs and surviving objects are frozen"""
+        service = Mock()
+        prepare_for_fork(service)
+        service.prepare_for_fork.assert_called_once()
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    def test_reinit_after_fork_reseeds(self):
+        """Test workers do not inherit the master's RNG sequence"""
+        np.random.seed(0)
+        state = np.random.get_state()[1].copy()
+        reinit_after_fork()
+        self.assertFalse(np.array_equal(state, np.random.get_state()[1]))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_service_usable_in_forked_worker(self):
+        """Test a preloaded service analyzes sessions after prepare_for_fork and fork"""
+        from bias_detection_service import BiasDetectionConfig, BiasDetectionService, SessionData
+
+        service = BiasDetectionService(BiasDetectionConfig(enable_result_cache=False))
+        session = SessionData(
+            session_id="fork_session",
+            participant_demographics={"gender_distribution": {"male": 50, "female": 50}},
+            training_scenario={},
+            content={"session_notes": "Patient expressing anxiety"},
+            ai_responses=[{"content": "How are you?", "response_time": 1.0}],
+            expected_outcomes=[],
+            transcripts=[],
+            metadata={},
+        )
+        # Start the layer threads and audit writer in the "master" first
+        asyncio.run(service.analyze_session(session, "master"))
+        prepare_for_fork(service)
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                reinit_after_fork()
+                result = asyncio.run(service.analyze_session(session, "worker"))
+                service.audit_logger.flush(timeout=5)
+                code = 0 if result["layer_results"] and not result["partial"] else 1
+            except BaseException:
+                code = 2
+            sys.stdout.flush()
+            os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
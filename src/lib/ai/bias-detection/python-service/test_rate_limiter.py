@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+test_rate_limiter.py
+Unit tests for rate_limiter.py
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+from rate_limiter import RateLimiter, retry_after_seconds
+
+NOW = 1_700_000_000.0
+
+
+def _acquire_many(path, key, attempts, results):
+    limiter = RateLimiter(60, burst=100, path=path)
+    allowed = sum(limiter.acquire(key, now=NOW)[0] for _ in range(attempts))
+    results.put(allowed)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test token buckets in the shared table"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "rate_limit.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_burst_then_refill(self):
+        """Test the burst is spent, then tokens return at the configured rate"""
+        limiter = RateLimiter(60, burst=3, path=self.path)
+        self.assertEqual([limiter.acquire("u", now=NOW)[0] for _ in range(4)], [True] * 3 + [False])
+
+        allowed, retry_after = limiter.acquire("u", now=NOW)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(retry_after, 1.0)
+        self.assertTrue(limiter.acquire("u", now=NOW + 1.0)[0])
+        self.assertFalse(limiter.acquire("u", now=NOW + 1.5)[0])
+
+    def test_users_have_separate_buckets(self):
+        """Test one user exhausting its bucket does not affect another"""
+        limiter = RateLimiter(60, burst=2, path=self.path)
+        for _ in range(5):
+            limiter.acquire("noisy", now=NOW)
+        self.assertTrue(limiter.acquire("quiet", now=NOW)[0])
+
+    def test_table_shared_between_instances(self):
+        """Test limiters over the same file charge the same buckets"""
+        first = RateLimiter(60, burst=2, path=self.path)
+        second = RateLimiter(60, burst=2, path=self.path)
+        self.assertTrue(first.acquire("u", now=NOW)[0])
+        self.assertTrue(second.acquire("u", now=NOW)[0])
+        self.assertFalse(first.acquire("u", now=NOW)[0])
+        first.close()
+        second.close()
+
+    def test_full_window_evicts_least_recent(self):
+        """Test a tiny table still serves new keys by reusing slots"""
+        limiter = RateLimiter(60, burst=1, path=self.path, slots=16)
+        for i in range(40):
+            self.assertTrue(limiter.acquire(f"user{i}", now=NOW + i / 100)[0])
+
+    def test_multi_process_counts_are_exact(self):
+        """Test forked workers never grant more than the shared burst"""
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [
+            context.Process(target=_acquire_many, args=(self.path, "tenant", 50, results))
+            for _ in range(4)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(30)
+
+        self.assertEqual(sum(results.get(timeout=5) for _ in workers), 100)
+
+    def test_retry_after_seconds(self):
+        """Test Retry-After rounds up to whole seconds"""
+        self.assertEqual(retry_after_seconds(0.2), 1)
+        self.assertEqual(retry_after_seconds(2.01), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+test_request_body.py
+Unit tests for request_body.py
+"""
+
+import asyncio
+import unittest
+
+from request_body import (
+    PayloadError,
+    PayloadTooLarge,
+    check_content_length,
+    decode_json,
+    read_limited,
+)
+
+REQUIRED = ("session_id", "participant_demographics", "content")
+
+
+class TestSizeLimits(unittest.TestCase):
+    """Test Content-Length and streamed byte limits"""
+
+    def test_content_length(self):
+        """Test declared sizes over the limit are rejected up front"""
+        check_content_length(None, 10)
+        check_content_length("10", 10)
+        with self.assertRaises(PayloadTooLarge) as ctx:
+            check_content_length("11", 10)
+        self.assertEqual(ctx.exception.status_code, 413)
+        with self.assertRaises(PayloadError):
+            check_content_length("lots", 10)
+
+    def test_stream_stops_at_limit(self):
+        """Test reading stops at the first chunk past the limit"""
+        pulled = []
+
+        async def chunks():
+            for i in range(100):
+                pulled.append(i)
+                yield b"x" * 10
+
+        with self.assertRaises(PayloadTooLarge):
+            asyncio.run(read_limited(chunks(), 25))
+        self.assertEqual(len(pulled), 3)
+
+    def test_stream_within_limit(self):
+        """Test a body within the limit is returned whole"""
+
+        async def chunks():
+            yield b'{"a": '
+            yield b"1}"
+
+        self.assertEqual(asyncio.run(read_limited(chunks(), 100)), b'{"a": 1}')
+
+
+class TestDecodeJson(unittest.TestCase):
+    """Test fail-fast decoding"""
+
+    def test_empty_body_is_no_data(self):
+        """Test empty bodies decode to an empty dict"""
+        self.assertEqual(decode_json(b"", REQUIRED), {})
+        self.assertEqual(decode_json(b"  \n", REQUIRED), {})
+
+    def test_missing_required_field_fails_before_parsing(self):
+        """Test a missing key is reported even when the JSON is broken"""
+        with self.assertRaises(PayloadError) as ctx:
+            decode_json(b'{"session_id": "s1", "content": {} <truncated', REQUIRED)
+        self.assertIn("participant_demographics", str(ctx.exception))
+
+    def test_invalid_json_and_non_objects(self):
+        """Test malformed and non-object payloads are rejected"""
+        with self.assertRaises(PayloadError):
+            decode_json(b'{"session_id": ')
+        with self.assertRaises(PayloadError):
+            decode_json(b"[1, 2]")
+
+    def test_valid_payload(self):
+        """Test a complete payload decodes"""
+        body = b'{"session_id": "s1", "participant_demographics": {}, "content": {}}'
+        self.assertEqual(decode_json(body, REQUIRED)["session_id"], "s1")
+
+
+if __name__ == "__main__":
+    unittest.main()
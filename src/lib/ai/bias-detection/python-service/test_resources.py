@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+test_resources.py
+Unit tests for resources.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+import pytest
+
+from resources import SPACY_MODEL, ensure_nltk_resource, spacy_model_path
+
+
+class TestResources(unittest.TestCase):
+    """Test bundled resources are found without network access"""
+
+    def setUp(self):
+        self.resource_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.resource_dir)
+
+    def test_bundled_spacy_model_preferred(self):
+        """Test a model saved in the resource directory is loaded by path"""
+        model_dir = os.path.join(self.resource_dir, "spacy", SPACY_MODEL)
+        os.makedirs(model_dir)
+        with open(os.path.join(model_dir, "config.cfg"), "w") as f:
+            f.write("[nlp]\n")
+        self.assertEqual(spacy_model_path(self.resource_dir), model_dir)
+
+    def test_missing_spacy_model(self):
+        """Test an unbundled, uninstalled model is reported as missing"""
+        self.assertIsNone(spacy_model_path(self.resource_dir, model="no_such_model_xyz"))
+
+    def test_bundled_nltk_resource_found_offline(self):
+        """Test the resource directory is searched and nothing is downloaded"""
+        nltk = pytest.importorskip("nltk")
+        lexicon = os.path.join(self.resource_dir, "nltk_data", "sentiment", "vader_lexicon.zip")
+        os.makedirs(os.path.dirname(lexicon))
+        with zipfile.ZipFile(lexicon, "w") as archive:
+            archive.writestr("vader_lexicon/vader_lexicon.txt", "good\t1.9\t0.9\t[2]\n")
+        try:
+            self.assertTrue(ensure_nltk_resource("vader_lexicon", self.resource_dir))
+            self.assertEqual(nltk.data.find("sentiment/vader_lexicon.zip").zipfile.filename, lexicon)
+        finally:
+            nltk.data.path.remove(os.path.join(self.resource_dir, "nltk_data"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+test_result_cache.py
+Unit tests for result_cache.py
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from cryptography.fernet import Fernet
+
+from result_cache import ResultCache, compute_cache_key
+
+
+@dataclass
+class _Session:
+    session_id: str
+    content: Dict[str, Any] = field(default_factory=dict)
+    timestamp: Optional[str] = None
+
+
+@dataclass
+class _Config:
+    warning_threshold: float = 0.3
+    high_threshold: float = 0.6
+    critical_threshold: float = 0.8
+    layer_weights: Dict[str, float] = field(default_factory=lambda: {"preprocessing": 1.0})
+    inference_backend: str = "pytorch"
+
+
+class TestComputeCacheKey(unittest.TestCase):
+    """Test canonical cache keys"""
+
+    def test_key_ignores_timestamp_and_dict_order(self):
+        """Test keys are stable across timestamps and key ordering"""
+        a = _Session("s1", {"notes": "x", "tags": [1, 2]}, "2024-01-01T00:00:00")
+        b = _Session("s1", {"tags": [1, 2], "notes": "x"}, "2024-06-01T00:00:00")
+
+        self.assertEqual(compute_cache_key(a, _Config()), compute_cache_key(b, _Config()))
+
+    def test_key_changes_with_content_and_config(self):
+        """Test keys change when the payload or thresholds change"""
+        base = compute_cache_key(_Session("s1", {"notes": "x"}), _Config())
+
+        self.assertNotEqual(base, compute_cache_key(_Session("s1", {"notes": "y"}), _Config()))
+        self.assertNotEqual(
+            base, compute_cache_key(_Session("s1", {"notes": "x"}), _Config(high_threshold=0.7))
+        )
+        self.assertNotEqual(
+            base, compute_cache_key(_Session("s1", {"notes": "x"}), _Config(inference_backend="int8"))
+        )
+
+
+class TestResultCache(unittest.TestCase):
+    """Test the memory and encrypted disk tiers"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.fernet = Fernet(Fernet.generate_key())
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        cache = ResultCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"v": 1})
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Test expired entries are misses"""
+        cache = ResultCache(ttl_seconds=0.01)
+        cache.set("a", {"v": 1})
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_disk_tier_is_encrypted_and_shared(self):
+        """Test a second cache instance reads entries written to disk"""
+        writer = ResultCache(disk_dir=self.cache_dir, fernet=self.fernet)
+        key = compute_cache_key(_Session("s1", {"notes": "secret note"}), _Config())
+        writer.set(key, {"notes": "secret note"})
+
+        with open(os.path.join(self.cache_dir, f"{key}.bin"), "rb") as f:
+            self.assertNotIn(b"secret note", f.read())
+
+        reader = ResultCache(disk_dir=self.cache_dir, fernet=self.fernet)
+        self.assertEqual(reader.get(key), {"notes": "secret note"})
+        self.assertEqual(reader.stats()["disk_hits"], 1)
+
+    def test_invalidate_session(self):
+        """Test session invalidation clears both tiers"""
+        cache = ResultCache(disk_dir=self.cache_dir, fernet=self.fernet)
+        key = compute_cache_key(_Session("s1"), _Config())
+        other = compute_cache_key(_Session("s2"), _Config())
+        cache.set(key, {"v": 1})
+        cache.set(other, {"v": 2})
+
+        cache.invalidate_session("s1")
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.get(other), {"v": 2})
+        self.assertEqual(os.listdir(self.cache_dir), [f"{other}.bin"])
+
+    def test_disk_tier_requires_key(self):
+        """Test the disk tier refuses to store plaintext"""
+        with self.assertRaises(ValueError):
+            ResultCache(disk_dir=self.cache_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+test_result_store.py
+Unit tests for result_store.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from cryptography.fernet import Fernet
+
+from result_store import ResultStore, parse_date_range
+
+
+def _row(session_id, timestamp, score=0.3):
+    return {"session_id": session_id, "bias_score": score, "alert_level": "low", "timestamp": timestamp}
+
+
+class TestParseDateRange(unittest.TestCase):
+    """Test date_range parsing"""
+
+    def test_date_only_end_covers_whole_day(self):
+        """Test a date-only end includes the last day"""
+        start, end = parse_date_range({"start": "2024-01-01", "end": "2024-01-31"})
+        self.assertEqual(start, datetime(2024, 1, 1))
+        self.assertEqual(end.date().isoformat(), "2024-01-31")
+        self.assertEqual((end.hour, end.minute), (23, 59))
+
+    def test_open_and_invalid_ranges(self):
+        """Test missing bounds stay open and bad values raise"""
+        self.assertEqual(parse_date_range({}), (None, None))
+        self.assertEqual(parse_date_range(None), (None, None))
+        for invalid in ({"start": "yesterday"}, {"start": "2024-02-01", "end": "2024-01-01"}):
+            with self.assertRaises(ValueError):
+                parse_date_range(invalid)
+
+
+class TestResultStore(unittest.TestCase):
+    """Test day-partitioned appends and range scans"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_rows_partitioned_by_day(self):
+        """Test rows land in one file per day and scan in order"""
+        store = ResultStore(self.temp_dir)
+        store.append(_row("a", "2024-01-01T10:00:00"))
+        store.append(_row("b", "2024-01-02T09:00:00"))
+        store.append(_row("c", "2024-01-02T18:00:00"))
+        store.close()
+
+        self.assertEqual(store.partitions(), ["2024-01-01", "2024-01-02"])
+        self.assertEqual([r["session_id"] for r in store.scan()], ["a", "b", "c"])
+
+    def test_scan_filters_to_range(self):
+        """Test partitions outside the range are skipped and bounds are inclusive"""
+        store = ResultStore(self.temp_dir)
+        for day in range(1, 6):
+            store.append(_row(f"s{day}", f"2024-01-0{day}T12:00:00"))
+
+        start, end = parse_date_range({"start": "2024-01-02", "end": "2024-01-04"})
+        self.assertEqual([r["session_id"] for r in store.scan(start, end)], ["s2", "s3", "s4"])
+
+        start, end = parse_date_range({"start": "2024-01-03T13:00:00"})
+        self.assertEqual([r["session_id"] for r in store.scan(start, end)], ["s4", "s5"])
+
+    def test_encrypted_rows(self):
+        """Test rows are unreadable on disk but decrypt on scan"""
+        fernet = Fernet(Fernet.generate_key())
+        store = ResultStore(self.temp_dir, fernet=fernet)
+        store.append(_row("secret_session", "2024-01-01T10:00:00"))
+        store.close()
+
+        with open(os.path.join(self.temp_dir, "results-2024-01-01.jsonl")) as f:
+            self.assertNotIn("secret_session", f.read())
+        self.assertEqual(next(store.scan())["session_id"], "secret_session")
+
+    def test_partial_trailing_line_ignored(self):
+        """Test a row still being appended is not yielded"""
+        store = ResultStore(self.temp_dir)
+        store.append(_row("done", "2024-01-01T10:00:00"))
+        with open(os.path.join(self.temp_dir, "results-2024-01-01.jsonl"), "a") as f:
+            f.write('{"session_id": "half')
+        self.assertEqual([r["session_id"] for r in store.scan()], ["done"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+test_serialization.py
+Unit tests for serialization.py
+"""
+
+import gzip
+import json
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from serialization import dumps, encode_json_response, negotiate_encoding
+
+
+class TestDumps(unittest.TestCase):
+    """Test numpy-aware encoding"""
+
+    def test_numpy_values_nested(self):
+        """Test numpy scalars and arrays encode as plain JSON numbers and lists"""
+        result = {
+            "layer_results": {
+                "model_level": {
+                    "metrics": {
+                        "mean": np.float64(0.25),
+                        "var": np.float32(0.5),
+                        "count": np.int64(3),
+                        "flag": np.bool_(True),
+                        "scores": np.array([[1, 2], [3, 4]]),
+                    }
+                }
+            },
+            "timestamp": datetime(2024, 1, 1, 10, 0),
+        }
+        decoded = json.loads(dumps(result))
+        metrics = decoded["layer_results"]["model_level"]["metrics"]
+        self.assertEqual(metrics, {"mean": 0.25, "var": 0.5, "count": 3, "flag": True, "scores": [[1, 2], [3, 4]]})
+        self.assertEqual(decoded["timestamp"], "2024-01-01T10:00:00")
+
+    def test_compact_output(self):
+        """Test output has no insignificant whitespace"""
+        self.assertEqual(dumps({"a": [1, 2]}), b'{"a":[1,2]}')
+
+
+class TestNegotiation(unittest.TestCase):
+    """Test Accept-Encoding handling"""
+
+    def test_negotiate_encoding(self):
+        """Test q-values, wildcards and unsupported codings"""
+        self.assertIsNone(negotiate_encoding(None))
+        self.assertIsNone(negotiate_encoding("identity"))
+        self.assertIsNone(negotiate_encoding("gzip;q=0"))
+        self.assertEqual(negotiate_encoding("deflate, gzip;q=0.8"), "gzip")
+        self.assertIn(negotiate_encoding("*"), ("br", "gzip"))
+
+    def test_large_body_compressed(self):
+        """Test bodies over min_size are gzip encoded with matching headers"""
+        payload = {"scores": list(range(2000))}
+        body, headers = encode_json_response(payload, "gzip", min_size=1024)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(headers["Vary"], "Accept-Encoding")
+        self.assertEqual(json.loads(gzip.decompress(body)), payload)
+
+    def test_small_body_not_compressed(self):
+        """Test small bodies are sent as-is"""
+        body, headers = encode_json_response({"ok": True}, "gzip", min_size=1024)
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertEqual(json.loads(body), {"ok": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+test_toxicity.py
+Unit tests for toxicity.py
+"""
+
+import asyncio
+import threading
+import unittest
+
+from toxicity import MicroBatcher, aggregate_scores, chunk_windows
+
+
+class _FakeTokenizer:
+    """Whitespace tokenizer with the HF call/decode interface"""
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def __call__(self, text, add_special_tokens=False, return_attention_mask=False):
+        return {"input_ids": text.split()}
+
+    def decode(self, ids):
+        return " ".join(ids)
+
+
+class _RecordingClassifier:
+    """Scores each window by its length and records batch sizes"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, windows):
+        self.batches.append(len(windows))
+        return [{"toxic": len(w) / 100, "identity_hate": 0.0} for w in windows]
+
+
+class TestWindows(unittest.TestCase):
+    """Test chunking and aggregation"""
+
+    def test_chunk_windows_leaves_room_for_special_tokens(self):
+        """Test windows hold max_tokens minus the tokenizer's special tokens"""
+        text = " ".join(f"w{i}" for i in range(25))
+        windows = chunk_windows(text, _FakeTokenizer(), max_tokens=12)
+        self.assertEqual([len(w.split()) for w in windows], [10, 10, 5])
+
+    def test_chunk_windows_without_tokenizer(self):
+        """Test word windows are used without a tokenizer, and blank text has none"""
+        self.assertEqual(chunk_windows("a b c", max_tokens=2), ["a b", "c"])
+        self.assertEqual(chunk_windows("  "), [])
+
+    def test_aggregate_scores(self):
+        """Test worst-window and mean label scores"""
+        result = aggregate_scores([{"toxic": 0.2}, {"toxic": 0.6}])
+        self.assertEqual(result["max"], {"toxic": 0.6})
+        self.assertAlmostEqual(result["mean"]["toxic"], 0.4)
+        self.assertEqual(aggregate_scores([])["windows"], 0)
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """Test cross-request batching"""
+
+    def test_concurrent_requests_share_batches(self):
+        """Test windows from concurrent callers are scored together and scattered back"""
+        classifier = _RecordingClassifier()
+        batcher = MicroBatcher(classifier, max_batch_size=64, max_wait_ms=200)
+        results = {}
+
+        def request(index):
+            windows = ["x" * (index + 1)] * 3
+            results[index] = batcher.submit(windows).result(timeout=5)
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(len(classifier.batches), 8)
+        self.assertEqual(sum(classifier.batches), 24)
+        for index, scores in results.items():
+            self.assertEqual([s["toxic"] for s in scores], [(index + 1) / 100] * 3)
+
+    def test_batch_size_bounds_forward_passes(self):
+        """Test no forward pass exceeds max_batch_size, even for one large request"""
+        classifier = _RecordingClassifier()
+        batcher = MicroBatcher(classifier, max_batch_size=4, max_wait_ms=1)
+        scores = batcher.submit(["a"] * 10).result(timeout=5)
+        self.assertEqual(len(scores), 10)
+        self.assertEqual(classifier.batches, [4, 4, 2])
+
+    def test_async_score(self):
+        """Test awaiting scores from an event loop"""
+        batcher = MicroBatcher(_RecordingClassifier(), max_wait_ms=1)
+        scores = asyncio.run(batcher.score(["abc"]))
+        self.assertAlmostEqual(scores[0]["toxic"], 0.03)
+        self.assertEqual(asyncio.run(batcher.score([])), [])
+
+    def test_classifier_errors_reach_every_caller(self):
+        """Test a failed forward pass fails the requests in that batch"""
+
+        def failing(windows):
+            raise RuntimeError("model crashed")
+
+        batcher = MicroBatcher(failing, max_wait_ms=1)
+        with self.assertRaises(RuntimeError):
+            batcher.submit(["a"]).result(timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
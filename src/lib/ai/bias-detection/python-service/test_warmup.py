@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+test_warmup.py
+Unit tests for warmup.py
+"""
+
+import unittest
+
+from warmup import WARMUP_SESSION, Readiness
+
+
+class TestReadiness(unittest.TestCase):
+    """Test warm-up progress tracking"""
+
+    def test_ready_after_steps_run(self):
+        """Test readiness turns green only after every step ran, in order"""
+        readiness = Readiness()
+        calls = []
+        self.assertFalse(readiness.ready)
+        self.assertEqual(readiness.status()["status"], "pending")
+
+        readiness.run([("first", lambda: calls.append(1)), ("second", lambda: calls.append(2))])
+
+        self.assertEqual(calls, [1, 2])
+        status = readiness.status()
+        self.assertTrue(status["ready"])
+        self.assertEqual(status["status"], "ready")
+        self.assertEqual(list(status["steps"]), ["first", "second"])
+        self.assertIsNone(status["steps"]["first"]["error"])
+
+    def test_failed_step_reported_not_blocking(self):
+        """Test a failing step is reported and later steps still run"""
+        readiness = Readiness()
+
+        def broken():
+            raise RuntimeError("model missing")
+
+        readiness.run([("broken", broken), ("after", lambda: None)])
+        status = readiness.status()
+        self.assertTrue(status["ready"])
+        self.assertEqual(status["steps"]["broken"]["error"], "model missing")
+        self.assertIn("after", status["steps"])
+
+    def test_background_start_and_wait(self):
+        """Test warm-up on a background thread can be waited for"""
+        readiness = Readiness()
+        readiness.start([("step", lambda: None)])
+        self.assertTrue(readiness.wait(timeout=5))
+        self.assertTrue(readiness.ready)
+
+    def test_mark_ready_skips_warmup(self):
+        """Test disabling warm-up reports ready with no steps"""
+        readiness = Readiness()
+        readiness.mark_ready()
+        self.assertTrue(readiness.ready)
+        self.assertEqual(readiness.status()["steps"], {})
+
+    def test_warmup_session_has_text_for_every_layer(self):
+        """Test the synthetic session carries responses, transcripts and demographics"""
+        self.assertTrue(WARMUP_SESSION["ai_responses"])
+        self.assertTrue(WARMUP_SESSION["transcripts"])
+        self.assertTrue(WARMUP_SESSION["participant_demographics"])
+
+
+if __name__ == "__main__":
+    unittest.main()
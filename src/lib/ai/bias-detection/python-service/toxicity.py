@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+toxicity.py
+Toxicity scoring with cross-request micro-batching
+
+Session text is cut into windows that fit the classifier's 512-token limit.
+Windows from concurrent requests are queued to one background thread, which
+waits at most ``max_wait_ms`` after the first arrival to fill a batch of up
+to ``max_batch_size`` windows, runs a single forward pass and hands each
+request back the scores for its own windows.
+
+Requests reach the batcher from per-request event loops (Flask) or a shared
+loop (ASGI) alike, since callers wait on a concurrent.futures.Future.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Scores for one window: label -> probability
+WindowScores = Dict[str, float]
+Classifier = Callable[[List[str]], List[WindowScores]]
+
+
+def chunk_windows(text: str, tokenizer: Optional[Any] = None, max_tokens: int = 512) -> List[str]:
+    """Split ``text`` into windows of at most ``max_tokens`` model tokens
+
+    With a Hugging Face tokenizer, room is left for its special tokens; without
+    one, whitespace-separated words stand in for tokens.
+    """
+    if not text or not text.strip():
+        return []
+    if tokenizer is None:
+        words = text.split()
+        return [" ".join(words[i : i + max_tokens]) for i in range(0, len(words), max_tokens)]
+
+    size = max_tokens - tokenizer.num_special_tokens_to_add()
+    ids = tokenizer(text, add_special_tokens=False, return_attention_mask=False)["input_ids"]
+    return [tokenizer.decode(ids[i : i + size]) for i in range(0, len(ids), size)]
+
+
+def aggregate_scores(scores: Sequence[WindowScores]) -> Dict[str, Any]:
+    """Session-level label scores: the worst window and the mean over windows"""
+    if not scores:
+        return {"max": {}, "mean": {}, "windows": 0}
+    labels = scores[0].keys()
+    return {
+        "max": {label: max(s.get(label, 0.0) for s in scores) for label in labels},
+        "mean": {label: sum(s.get(label, 0.0) for s in scores) / len(scores) for label in labels},
+        "windows": len(scores),
+    }
+
+
+class _Request:
+    __slots__ = ("windows", "future")
+
+    def __init__(self, windows: List[str]):
+        self.windows = windows
+        self.future: Future = Future()
+
+
+class MicroBatcher:
+    """Coalesces windows from concurrent requests into shared forward passes"""
+
+    def __init__(self, classify: Classifier, max_batch_size: int = 32, max_wait_ms: float = 10.0):
+        self.classify = classify
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self.stats = {"requests": 0, "windows": 0, "batches": 0}
+
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: Optional[queue.Queue] = None
+
+    async def score(self, windows: List[str]) -> List[WindowScores]:
+        """Scores for ``windows``, in order, computed alongside other requests"""
+        if not windows:
+            return []
+        return await asyncio.wrap_future(self.submit(windows))
+
+    def submit(self, windows: List[str]) -> Future:
+        request = _Request(list(windows))
+        self._ensure_started().put(request)
+        return request.future
+
+    def _ensure_started(self) -> queue.Queue:
+        # (Re)start after a fork: threads do not survive into the child
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue()
+                    threading.Thread(target=self._run, name="toxicity-batcher", daemon=True).start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def _run(self):
+        pending: Optional[_Request] = None
+        while True:
+            batch = [pending or self._queue.get()]
+            pending = None
+            size = len(batch[0].windows)
+            deadline = time.monotonic() + self.max_wait
+
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if size + len(request.windows) > self.max_batch_size:
+                    pending = request  # starts the next batch
+                    break
+                batch.append(request)
+                size += len(request.windows)
+
+            self._process(batch)
+
+    def _process(self, batch: List[_Request]):
+        windows = [window for request in batch for window in request.windows]
+        try:
+            # A single request larger than max_batch_size runs in slices
+            scores: List[WindowScores] = []
+            for start in range(0, len(windows), self.max_batch_size):
+                scores.extend(self.classify(windows[start : start + self.max_batch_size]))
+                self.stats["batches"] += 1
+        except Exception as e:
+            logger.error(f"Toxicity batch of {len(windows)} windows failed: {e}")
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        self.stats["requests"] += len(batch)
+        self.stats["windows"] += len(windows)
+        offset = 0
+        for request in batch:
+            request.future.set_result(scores[offset : offset + len(request.windows)])
+            offset += len(request.windows)
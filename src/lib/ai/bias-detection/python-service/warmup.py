@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+warmup.py
+Readiness-gated warm-up
+
+A fresh worker answers /health at once, but its first analyses pay for lazy
+toolkit imports, spaCy's and the classifier's first-call costs and thread
+pool start-up. At startup the service runs a synthetic session through every
+analysis tier, so every enabled layer runs once. /ready answers 503 until
+that has finished, so load balancers only send traffic to warm workers.
+
+A failing step is logged and reported but does not hold readiness back. The
+layers degrade per request the same way, and a worker that never turns ready
+would only be restarted into the same failure.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Synthetic session (SessionData fields) exercising every layer: demographics
+# for the fairness dataset, responses with timings, and text with lexicon hits
+WARMUP_SESSION: Dict[str, Any] = {
+    "session_id": "warmup",
+    "participant_demographics": {
+        "gender_distribution": {"male": 40, "female": 50, "other": 10},
+        "age_distribution": {"18-30": 30, "31-50": 50, "51+": 20},
+    },
+    "training_scenario": {"type": "warmup"},
+    "content": {
+        "session_notes": "The chairman said older patients are too old-fashioned to change."
+    },
+    "ai_responses": [
+        {"content": "How have you been feeling this week?", "response_time": 1.1},
+        {"content": "She mentioned the men in her family rarely talk about it.", "response_time": 2.4},
+        {"content": "Tell me more about what happened next.", "response_time": 0.8},
+    ],
+    "expected_outcomes": [],
+    "transcripts": [
+        {"speaker": "participant", "text": "I feel anxious when I talk to my manager."}
+    ],
+    "metadata": {"warmup": True},
+}
+
+WarmupStep = Tuple[str, Callable[[], Any]]
+
+
+class Readiness:
+    """Warm-up progress of one worker, as reported by /ready"""
+
+    def __init__(self):
+        self.state = "pending"
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def mark_ready(self):
+        """Skip warm-up (disabled by configuration)"""
+        with self._lock:
+            self.state = "ready"
+            self.finished_at = datetime.now().isoformat()
+        self._done.set()
+
+    def run(self, steps: Sequence[WarmupStep]):
+        """Run warm-up steps in order, then turn ready"""
+        with self._lock:
+            self.state = "warming"
+            self.started_at = datetime.now().isoformat()
+
+        for name, step in steps:
+            start = time.perf_counter()
+            error = None
+            try:
+                step()
+            except Exception as e:
+                error = str(e)
+                logger.error(f"Warm-up step {name} failed: {e}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.steps[name] = {"duration_ms": elapsed_ms, "error": error}
+            logger.info(f"Warm-up step {name} took {elapsed_ms:.1f}ms")
+
+        self.mark_ready()
+
+    def start(self, steps: Sequence[WarmupStep]) -> threading.Thread:
+        """Run warm-up on a background thread so the server starts accepting at once"""
+        with self._lock:
+            self.state = "warming"
+        self._thread = threading.Thread(
+            target=self.run, args=(steps,), name="bias-warmup", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until a started warm-up has finished; whether the worker is ready"""
+        if self.state == "pending":
+            return False
+        return self._done.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "status": self.state,
+                "ready": self.ready,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "steps": {name: dict(step) for name, step in self.steps.items()},
+            }
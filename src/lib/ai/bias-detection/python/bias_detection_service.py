@@ -14,9 +14,10 @@ import asyncio
 import hashlib
 import json
 import logging
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -81,13 +82,6 @@ except ImportError:
     NLP_AVAILABLE = False
     logging.warning("NLP libraries not fully available. Text analysis will be limited.")
 
-# Visualization and data processing
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objs as go
-import seaborn as sns
-from plotly.subplots import make_subplots
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -128,6 +122,100 @@ class SessionData:
     metadata: Dict[str, Any]
 
 
+class TermMatcher:
+    """Aho-Corasick multi-pattern matcher with word-boundary semantics
+
+    Finds every occurrence of every term in one linear pass over the text.
+    A match only counts when it is not part of a longer word, so "he" does not
+    match inside "the" and "old" does not match inside "bold".
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for term in {t.lower() for t in terms}:
+            node = 0
+            for char in term:
+                if char not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[node][char] = len(self._goto) - 1
+                node = self._goto[node][char]
+            self._output[node].append(term)
+
+        # Breadth-first construction of failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_all(self, text: str) -> List[Tuple[str, int, int]]:
+        """Return (term, start, end) for every whole-word match in ``text``"""
+        text = text.lower()
+        matches = []
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for term in self._output[node]:
+                start, end = index - len(term) + 1, index + 1
+                if (start == 0 or not text[start - 1].isalnum()) and (
+                    end == len(text) or not text[end].isalnum()
+                ):
+                    matches.append((term, start, end))
+        matches.sort(key=lambda match: (match[1], match[2]))
+        return matches
+
+
+GENDERED_TERMS = {
+    "male_terms": ["he", "him", "his", "man", "men", "guy", "guys"],
+    "female_terms": ["she", "her", "hers", "woman", "women", "girl", "girls"],
+    "stereotypical_male": [
+        "aggressive",
+        "dominant",
+        "assertive",
+        "competitive",
+    ],
+    "stereotypical_female": ["emotional", "nurturing", "submissive", "caring"],
+}
+
+AGE_RELATED_TERMS = [
+    "young",
+    "old",
+    "elderly",
+    "senior",
+    "youth",
+    "teenager",
+    "millennial",
+    "boomer",
+    "generation",
+]
+
+BIASED_TERMS_DB = {
+    "gender": ["mankind", "manpower", "chairman"],
+    "racial": ["exotic", "articulate", "urban"],
+    "age": ["old-fashioned", "outdated", "modern"],
+    "cultural": ["foreign", "ethnic", "exotic"],
+}
+
+# One automaton over every term the text detectors look for
+TERM_MATCHER = TermMatcher(
+    [term for terms in GENDERED_TERMS.values() for term in terms]
+    + AGE_RELATED_TERMS
+    + [term for terms in BIASED_TERMS_DB.values() for term in terms]
+)
+
+
 class BiasDetectionService:
     """Main bias detection service implementing multi-layer analysis"""
 
@@ -281,14 +369,17 @@ class BiasDetectionService:
 
         doc = self.nlp(text_content)
 
+        # One linear pass finds every term the detectors need
+        term_matches = TERM_MATCHER.find_all(doc.text)
+
         # Gender bias detection
-        gender_bias = self._detect_gender_bias(doc)
+        gender_bias = self._detect_gender_bias(doc, term_matches)
 
         # Racial bias detection
         racial_bias = self._detect_racial_bias(doc)
 
         # Age bias detection
-        age_bias = self._detect_age_bias(doc)
+        age_bias = self._detect_age_bias(doc, term_matches)
 
         # Cultural bias detection
         cultural_bias = self._detect_cultural_bias(doc)
@@ -297,7 +388,7 @@ class BiasDetectionService:
         sentiment = self._analyze_sentiment(text_content)
 
         # Biased terms detection
-        biased_terms = self._detect_biased_terms(doc)
+        biased_terms = self._detect_biased_terms(doc, term_matches)
 
         overall_bias_score = np.mean([gender_bias, racial_bias, age_bias, cultural_bias])
 
@@ -311,7 +402,9 @@ class BiasDetectionService:
             "sentiment_analysis": sentiment,
         }
 
-    def _detect_gender_bias(self, doc) -> float:
+    def _detect_gender_bias(
+        self, doc, term_matches: Optional[List[Tuple[str, int, int]]] = None
+    ) -> float:
         """Detect gender bias in text"""
         bias_indicators = [
             "gendered_pronouns",
@@ -319,22 +412,14 @@ class BiasDetectionService:
             "gendered_adjectives",
         ]
 
-        gendered_terms = {
-            "male_terms": ["he", "him", "his", "man", "men", "guy", "guys"],
-            "female_terms": ["she", "her", "hers", "woman", "women", "girl", "girls"],
-            "stereotypical_male": [
-                "aggressive",
-                "dominant",
-                "assertive",
-                "competitive",
-            ],
-            "stereotypical_female": ["emotional", "nurturing", "submissive", "caring"],
-        }
-
-        text_lower = doc.text.lower()
+        if term_matches is None:
+            term_matches = TERM_MATCHER.find_all(doc.text)
+        matched_terms = [term for term, _, _ in term_matches]
 
-        male_count = sum(text_lower.count(term) for term in gendered_terms["male_terms"])
-        female_count = sum(text_lower.count(term) for term in gendered_terms["female_terms"])
+        male_terms = set(GENDERED_TERMS["male_terms"])
+        female_terms = set(GENDERED_TERMS["female_terms"])
+        male_count = sum(term in male_terms for term in matched_terms)
+        female_count = sum(term in female_terms for term in matched_terms)
 
         total_gendered = male_count + female_count
         if total_gendered == 0:
@@ -344,10 +429,10 @@ class BiasDetectionService:
         imbalance = abs(male_count - female_count) / total_gendered
 
         # Check for stereotypical language
-        stereotype_score = 0
-        for term in gendered_terms["stereotypical_male"] + gendered_terms["stereotypical_female"]:
-            if term in text_lower:
-                stereotype_score += 0.1
+        stereotypical_terms = set(
+            GENDERED_TERMS["stereotypical_male"] + GENDERED_TERMS["stereotypical_female"]
+        )
+        stereotype_score = 0.1 * len(stereotypical_terms.intersection(matched_terms))
 
         return min(imbalance + stereotype_score, 1.0)
 
@@ -362,22 +447,15 @@ class BiasDetectionService:
         # Real implementation would use more sophisticated NLP techniques
         return 0.1  # Low baseline bias score
 
-    def _detect_age_bias(self, doc) -> float:
+    def _detect_age_bias(
+        self, doc, term_matches: Optional[List[Tuple[str, int, int]]] = None
+    ) -> float:
         """Detect age bias in text"""
-        age_related_terms = [
-            "young",
-            "old",
-            "elderly",
-            "senior",
-            "youth",
-            "teenager",
-            "millennial",
-            "boomer",
-            "generation",
-        ]
+        if term_matches is None:
+            term_matches = TERM_MATCHER.find_all(doc.text)
 
-        text_lower = doc.text.lower()
-        age_mentions = sum(text_lower.count(term) for term in age_related_terms)
+        age_terms = set(AGE_RELATED_TERMS)
+        age_mentions = sum(term in age_terms for term, _, _ in term_matches)
 
         # Simple heuristic - high number of age mentions might indicate bias
         total_words = len(doc)
@@ -415,44 +493,59 @@ class BiasDetectionService:
             "overall_sentiment": (vader_scores["compound"] + textblob_sentiment.polarity) / 2,
         }
 
-    def _detect_biased_terms(self, doc) -> List[Dict[str, Any]]:
+    def _detect_biased_terms(
+        self, doc, term_matches: Optional[List[Tuple[str, int, int]]] = None
+    ) -> List[Dict[str, Any]]:
         """Detect potentially biased terms in text"""
-        biased_terms_db = {
-            "gender": ["mankind", "manpower", "chairman"],
-            "racial": ["exotic", "articulate", "urban"],
-            "age": ["old-fashioned", "outdated", "modern"],
-            "cultural": ["foreign", "ethnic", "exotic"],
-        }
+        if term_matches is None:
+            term_matches = TERM_MATCHER.find_all(doc.text)
 
-        detected_terms = []
-        text_lower = doc.text.lower()
+        # Position of the first whole-word occurrence of each term
+        first_match: Dict[str, Tuple[int, int]] = {}
+        for term, start, end in term_matches:
+            first_match.setdefault(term, (start, end))
 
-        for bias_type, terms in biased_terms_db.items():
+        detected_terms = []
+        for bias_type, terms in BIASED_TERMS_DB.items():
             for term in terms:
-                if term in text_lower:
+                if term in first_match:
+                    start, end = first_match[term]
                     detected_terms.append(
                         {
                             "term": term,
                             "bias_type": bias_type,
                             "severity": "medium",  # Could be enhanced with ML scoring
-                            "context": self._extract_context(doc, term),
+                            "context": self._extract_context(doc, term, start=start, end=end),
                             "suggested_alternative": self._suggest_alternative(term),
                         }
                     )
 
         return detected_terms
 
-    def _extract_context(self, doc, term: str, window: int = 10) -> str:
-        """Extract context around a biased term"""
+    def _extract_context(
+        self,
+        doc,
+        term: str,
+        window: int = 10,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> str:
+        """Extract context around a biased term
+
+        ``start``/``end`` are the match offsets reported by TERM_MATCHER; when
+        omitted the first whole-word occurrence of ``term`` is used.
+        """
         text = doc.text
-        term_pos = text.lower().find(term.lower())
-        if term_pos == -1:
-            return ""
+        if start is None or end is None:
+            matches = TermMatcher([term]).find_all(text)
+            if not matches:
+                return ""
+            _, start, end = matches[0]
 
-        start = max(0, term_pos - window * 5)  # Approximate word boundary
-        end = min(len(text), term_pos + len(term) + window * 5)
+        lo = max(0, start - window * 5)  # Approximate word boundary
+        hi = min(len(text), end + window * 5)
 
-        return text[start:end].strip()
+        return text[lo:hi].strip()
 
     def _suggest_alternative(self, term: str) -> str:
         """Suggest alternative terms for biased language"""
@@ -19,8 +19,10 @@ from pythonjsonlogger import jsonlogger
 
 # Add the python directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "python-service"))
 
 try:
+    from dashboard_rollups import DashboardRollups
     from python.bias_detection_service import (
         BiasDetectionConfig,
         BiasDetectionService,
@@ -47,6 +49,9 @@ CORS(app)  # Enable CORS for frontend communication
 # Global bias detection service instance
 bias_service = None
 
+# Dashboard aggregates, updated after every completed analysis
+rollups = DashboardRollups(os.environ.get("BIAS_DASHBOARD_ROLLUPS") or None)
+
 
 def initialize_service():
     """Initialize the bias detection service"""
@@ -118,6 +123,7 @@ def analyze_session():
         asyncio.set_event_loop(loop)
         result = loop.run_until_complete(bias_service.analyze_session(session_data))
         loop.close()
+        rollups.record(result)
 
         logger.info(f"Analysis completed for session {data['sessionId']}")
         return jsonify(result)
@@ -127,6 +133,20 @@ def analyze_session():
         return jsonify({"error": "Analysis failed", "message": str(e)}), 500
 
 
+def _trend_direction(scores):
+    """Compare the mean bias score of the first and second half of a window"""
+    if len(scores) < 2:
+        return "stable"
+    half = len(scores) // 2
+    earlier = sum(scores[:half]) / half
+    later = sum(scores[half:]) / (len(scores) - half)
+    if later < earlier - 0.02:
+        return "improving"
+    if later > earlier + 0.02:
+        return "worsening"
+    return "stable"
+
+
 @app.route("/dashboard", methods=["GET"])
 def get_dashboard_data():
     """Get dashboard data for bias monitoring"""
@@ -135,62 +155,58 @@ def get_dashboard_data():
             return jsonify({"error": "Service not initialized"}), 500
 
         # Get query parameters
-        request.args.get("timeRange", "24h")
-        request.args.get("demographic", "all")
+        time_range = request.args.get("timeRange", "24h")
+        demographic = request.args.get("demographic", "all")
+
+        try:
+            rollup = rollups.query(time_range, demographic)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        alerts = rollup["alert_levels"]
+        series = rollup["series"]
+        total = rollup["total_sessions"]
+        breakdown = [
+            {
+                "group": group,
+                "dimension": dimension,
+                "count": round(stats["weight"], 2),
+                "percentage": round(100 * stats["weight"] / total, 1) if total else 0.0,
+                "averageBiasScore": round(stats["average_bias_score"], 4),
+            }
+            for dimension, groups in rollup["demographics"].items()
+            for group, stats in groups.items()
+        ]
 
-        # Generate mock dashboard data
-        # In production, this would query your database
         dashboard_data = {
             "summary": {
-                "totalSessions": 1247,
-                "averageBiasScore": 0.23,
-                "alertsCount": 12,
-                "trendsDirection": "improving",
+                "totalSessions": total,
+                "averageBiasScore": round(rollup["average_bias_score"], 4),
+                "alertsCount": alerts["warning"] + alerts["high"] + alerts["critical"],
+                "trendsDirection": _trend_direction(series["average_bias_scores"]),
                 "lastUpdated": datetime.now().isoformat(),
+                "percentiles": rollup["percentiles"],
             },
-            "alerts": [
-                {
-                    "id": "alert-001",
-                    "sessionId": "session-123",
-                    "level": "high",
-                    "message": ("Potential gender bias detected in " "therapeutic responses"),
-                    "timestamp": datetime.now().isoformat(),
-                    "biasType": "gender",
-                    "confidence": 0.87,
-                    "affectedDemographics": ["female", "non-binary"],
-                    "recommendations": [
-                        "Review language patterns in AI responses",
-                        "Implement gender-neutral terminology",
-                    ],
-                }
-            ],
+            # Individual alerts are not kept in the rollups
+            "alerts": [],
             "trends": {
-                "biasScoreOverTime": [],
-                "alertsOverTime": [],
+                "biasScoreOverTime": [
+                    {"timestamp": t, "value": v, "sessions": n}
+                    for t, v, n in zip(
+                        series["timestamps"],
+                        series["average_bias_scores"],
+                        series["session_counts"],
+                    )
+                ],
+                "alertsOverTime": [
+                    {"timestamp": t, "value": v}
+                    for t, v in zip(series["timestamps"], series["alert_counts"])
+                ],
                 "demographicTrends": {},
             },
             "demographics": {
-                "totalParticipants": 1247,
-                "breakdown": [
-                    {
-                        "group": "Female",
-                        "count": 623,
-                        "percentage": 50.0,
-                        "averageBiasScore": 0.21,
-                    },
-                    {
-                        "group": "Male",
-                        "count": 498,
-                        "percentage": 39.9,
-                        "averageBiasScore": 0.25,
-                    },
-                    {
-                        "group": "Non-binary",
-                        "count": 87,
-                        "percentage": 7.0,
-                        "averageBiasScore": 0.28,
-                    },
-                ],
+                "totalParticipants": total,
+                "breakdown": breakdown,
             },
         }
 